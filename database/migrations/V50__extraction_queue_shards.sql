@@ -0,0 +1,21 @@
+-- V50: Page-range shards for large documents
+-- Purpose: let the Python worker split a whole-document PDF task into page-range
+-- child tasks (aligned to Krithi starts) so several workers share one anthology.
+--
+-- Children are ordinary page-range tasks: the backend ingests their results as
+-- it does any task with page_range set. The parent stays PROCESSING until the
+-- last shard finishes, then records the aggregate result_count and turns DONE
+-- (no payload of its own) or FAILED (listing the failed shards in error_detail).
+
+SET search_path TO public;
+
+ALTER TABLE extraction_queue
+    ADD COLUMN IF NOT EXISTS parent_extraction_id UUID REFERENCES extraction_queue(id) ON DELETE CASCADE;
+
+COMMENT ON COLUMN extraction_queue.parent_extraction_id IS
+    'Whole-document task this page-range shard was split from; NULL for unsharded tasks.';
+
+-- Roll-up and aggregation read every child of one parent
+CREATE INDEX IF NOT EXISTS idx_eq_parent_extraction
+    ON extraction_queue(parent_extraction_id)
+    WHERE parent_extraction_id IS NOT NULL;
@@ -0,0 +1,20 @@
+-- V51: Per-extraction result rows
+-- Purpose: let the Python worker persist a large task's results one row per
+-- CanonicalExtraction (streamed with COPY) instead of as one result_payload
+-- JSONB array that has to be built, sent and parsed as a single value.
+--
+-- Opt-in on the worker (SG_RESULT_PERSISTENCE=rows). A task completed this way
+-- leaves result_payload NULL; readers assemble the array from these rows in
+-- ordinal order. When result_payload is set it stays authoritative.
+
+SET search_path TO public;
+
+CREATE TABLE IF NOT EXISTS extraction_results (
+    extraction_id   UUID NOT NULL REFERENCES extraction_queue(id) ON DELETE CASCADE,
+    ordinal         INTEGER NOT NULL,
+    result          JSONB NOT NULL,
+    PRIMARY KEY (extraction_id, ordinal)
+);
+
+COMMENT ON TABLE extraction_results IS
+    'One CanonicalExtractionDto per row for tasks whose result_payload is NULL; ordinal is the position in the result list.';
@@ -0,0 +1,16 @@
+-- V52: Per-stage timings and counters for extraction tasks
+-- Purpose: record where a task's duration_ms went (download, PyMuPDF, OCR,
+-- segmentation, parsing, identity discovery, Gemini) and what it did (pages
+-- OCR'd, segments, Gemini calls and retries, cache hits), so slow tasks and
+-- regressions can be traced to a stage.
+--
+-- Written by the Python worker on DONE and FAILED; NULL for tasks completed
+-- before V52.
+
+SET search_path TO public;
+
+ALTER TABLE extraction_queue
+    ADD COLUMN IF NOT EXISTS stage_metrics JSONB;
+
+COMMENT ON COLUMN extraction_queue.stage_metrics IS
+    'Worker stage breakdown: {"stages_ms": {stage: wall-clock ms}, "counters": {name: count}}.';
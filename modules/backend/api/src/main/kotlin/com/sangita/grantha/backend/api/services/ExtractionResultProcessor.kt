@@ -85,6 +85,12 @@ class ExtractionResultProcessor(
                 }
                 val resultPayload = detail.resultPayload
                 if (resultPayload.isNullOrBlank() || resultPayload == "null") {
+                    if (dal.extractionQueue.hasShards(task.id)) {
+                        // Sharded parent: its shards are ingested as tasks of their own.
+                        logger.info("Extraction ${task.id} is a sharded parent, results ingested via its shards")
+                        processedTasks++
+                        continue
+                    }
                     logger.warn("Extraction ${task.id} has no result payload, skipping")
                     skippedTasks++
                     continue
@@ -192,6 +192,22 @@ class ExtractionResultProcessorUnitTest {
             assertEquals(0, report.processedTasks)
         }
 
+        @Test
+        fun `sharded parent without payload is processed, not skipped`() = kotlinx.coroutines.runBlocking {
+            val taskDto = buildExtractionTaskDto()
+            val detailDto = buildExtractionDetailDto(resultPayload = null)
+
+            coEvery { dal.extractionQueue.list(status = listOf("DONE"), limit = any()) } returns
+                Pair(listOf(taskDto), 1)
+            coEvery { dal.extractionQueue.findById(taskDto.id) } returns detailDto
+            coEvery { dal.extractionQueue.hasShards(taskDto.id) } returns true
+
+            val report = processor.processCompletedExtractions()
+            assertEquals(0, report.skippedTasks)
+            assertEquals(1, report.processedTasks)
+            assertEquals(0, report.evidenceRecordsCreated)
+        }
+
         @Test
         fun `empty extractions list marks as ingested`() = kotlinx.coroutines.runBlocking {
             val taskDto = buildExtractionTaskDto()
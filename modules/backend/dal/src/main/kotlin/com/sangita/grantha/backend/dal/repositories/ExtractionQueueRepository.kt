@@ -6,6 +6,7 @@ import com.sangita.grantha.backend.dal.enums.ExtractionStatus
 import com.sangita.grantha.backend.dal.support.toJavaUuid
 import com.sangita.grantha.backend.dal.support.toKotlinUuid
 import com.sangita.grantha.backend.dal.tables.ExtractionQueueTable
+import com.sangita.grantha.backend.dal.tables.ExtractionResultsTable
 import com.sangita.grantha.shared.domain.model.ExtractionTaskDto
 import com.sangita.grantha.shared.domain.model.ExtractionDetailDto
 import com.sangita.grantha.shared.domain.model.ExtractionStatsDto
@@ -65,6 +66,7 @@ class ExtractionQueueRepository {
         extractionMethod = this[T.extractionMethod],
         extractorVersion = this[T.extractorVersion],
         durationMs = this[T.durationMs],
+        stageMetrics = this[T.stageMetrics],
         attempts = this[T.attempts],
         maxAttempts = this[T.maxAttempts],
         claimedBy = this[T.claimedBy],
@@ -124,10 +126,36 @@ class ExtractionQueueRepository {
     }
 
     suspend fun findById(id: Uuid): ExtractionDetailDto? = DatabaseFactory.dbQuery {
-        T.selectAll()
+        val detail = T.selectAll()
             .andWhere { T.id eq id.toJavaUuid() }
             .map { it.toDetailDto() }
             .singleOrNull()
+        if (detail == null || detail.resultPayload != null) detail
+        else detail.copy(resultPayload = resultRowsAsPayload(id))
+    }
+
+    /**
+     * V51: tasks the worker completed with per-result rows leave result_payload NULL.
+     * Reassemble the same JSON array from extraction_results, or null if there are none.
+     */
+    private fun resultRowsAsPayload(id: Uuid): String? {
+        val R = ExtractionResultsTable
+        val rows = R.selectAll()
+            .andWhere { R.extractionId eq id.toJavaUuid() }
+            .orderBy(R.ordinal to SortOrder.ASC)
+            .map { it[R.result] }
+        return if (rows.isEmpty()) null else rows.joinToString(separator = ",", prefix = "[", postfix = "]")
+    }
+
+    /**
+     * Whether the worker split this task into page-range shards. A sharded parent is
+     * finished with no results of its own: each shard is a DONE task carrying its pages.
+     */
+    suspend fun hasShards(id: Uuid): Boolean = DatabaseFactory.dbQuery {
+        T.selectAll()
+            .where { T.parentExtractionId eq id.toJavaUuid() }
+            .limit(1)
+            .count() > 0
     }
 
     /**
@@ -66,6 +66,9 @@ object ExtractionQueueTable : UUIDTable("extraction_queue") {
     val confidence = decimal("confidence", 5, 4).nullable()
     val durationMs = integer("duration_ms").nullable()
 
+    // V52: per-stage timings and counters recorded by the worker
+    val stageMetrics = jsonbText("stage_metrics").nullable()
+
     // Error handling
     val errorDetail = jsonbText("error_detail").nullable()
     val lastErrorAt = timestampWithTimeZone("last_error_at").nullable()
@@ -82,11 +85,26 @@ object ExtractionQueueTable : UUIDTable("extraction_queue") {
     val extractionIntent = pgEnum<ExtractionIntent>("extraction_intent", ExtractionIntent.DB_TYPE)
     val relatedExtractionId = javaUUID("related_extraction_id").nullable()
 
+    // V50: page-range shard of a large whole-document task
+    val parentExtractionId = javaUUID("parent_extraction_id").nullable()
+
     // Audit
     val createdAt = timestampWithTimeZone("created_at")
     val updatedAt = timestampWithTimeZone("updated_at")
 }
 
+/**
+ * Per-extraction result rows for tasks whose `result_payload` is NULL.
+ * Migration 51.
+ */
+object ExtractionResultsTable : Table("extraction_results") {
+    val extractionId = javaUUID("extraction_id")
+    val ordinal = integer("ordinal")
+    val result = jsonbText("result")
+
+    override val primaryKey = PrimaryKey(extractionId, ordinal)
+}
+
 /**
  * Krithi source evidence — links Krithis to contributing sources.
  * Migration 24.
@@ -110,6 +110,7 @@ export interface ExtractionDetail extends ExtractionTask {
   errorDetail?: Record<string, unknown> | null;
   sourceChecksum?: string | null;
   cachedArtifactPath?: string | null;
+  stageMetrics?: Record<string, unknown> | null;
 }
 
 export interface CreateExtractionRequest {
@@ -128,6 +128,8 @@ data class ExtractionDetailDto(
     val extractionMethod: String? = null,
     val extractorVersion: String? = null,
     val durationMs: Int? = null,
+    // V52: {"stages_ms": {...}, "counters": {...}} from the worker
+    val stageMetrics: String? = null,
     val attempts: Int = 0,
     val maxAttempts: Int = 3,
     val claimedBy: String? = null,
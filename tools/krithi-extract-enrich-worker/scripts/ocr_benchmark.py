@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""Compare OCR throughput (pages/sec) of the persistent and subprocess backends.
+
+Renders the requested pages of a scanned PDF once, then runs every installed
+backend over the same pixmaps, so only recognition (and, for pytesseract, the
+per-page process start and traineddata load) is timed. Also reports whether
+the backends produced identical text.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/ocr_benchmark.py scan.pdf
+    PYTHONPATH=. uv run python scripts/ocr_benchmark.py scan.pdf --pages 0-9 --lang ta --lang en
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+import fitz
+
+from scripts._common import setup_logging
+from src.ocr_engine import OcrEngine, PytesseractEngine, TesserocrEngine
+from src.ocr_fallback import OcrFallback
+
+
+def _render(pdf_path: str, start: int, end: int, dpi: int) -> list[fitz.Pixmap]:
+    matrix = fitz.Matrix(dpi / 72, dpi / 72)
+    with fitz.open(pdf_path) as doc:
+        end = min(end, len(doc) - 1)
+        return [doc[n].get_pixmap(matrix=matrix) for n in range(start, end + 1)]
+
+
+def _engines(lang: str) -> list[OcrEngine]:
+    engines: list[OcrEngine] = []
+    for cls in (TesserocrEngine, PytesseractEngine):
+        try:
+            engines.append(cls(lang))
+        except ImportError:
+            print(f"{cls.name}: not installed, skipped", file=sys.stderr)
+        except RuntimeError as exc:
+            # e.g. tesserocr cannot find the traineddata for `lang`.
+            print(f"{cls.name}: {exc}, skipped", file=sys.stderr)
+    return engines
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("pdf", help="scanned PDF to OCR")
+    ap.add_argument("--pages", default="0-4", help="0-based inclusive page range (default 0-4)")
+    ap.add_argument("--lang", action="append", default=[], help="language code (repeatable; default sa + en)")
+    ap.add_argument("--dpi", type=int, default=300)
+    args = ap.parse_args()
+    setup_logging()
+
+    start, _, end = args.pages.partition("-")
+    pixmaps = _render(args.pdf, int(start), int(end or start), args.dpi)
+    lang = OcrFallback(languages=args.lang or None).tesseract_lang_str
+    print(f"{len(pixmaps)} pages at {args.dpi} DPI, lang={lang}")
+
+    outputs: dict[str, list[str]] = {}
+    for engine in _engines(lang):
+        began = time.perf_counter()
+        outputs[engine.name] = [engine.recognize(pix) for pix in pixmaps]
+        elapsed = time.perf_counter() - began
+        engine.close()
+        print(f"{engine.name:12s} {elapsed:8.2f}s  {len(pixmaps) / elapsed:6.2f} pages/sec")
+
+    if len(outputs) == 2:
+        same = outputs["tesserocr"] == outputs["pytesseract"]
+        print(f"identical text: {'yes' if same else 'NO'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
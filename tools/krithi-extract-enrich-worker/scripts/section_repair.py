@@ -63,7 +63,7 @@ _WORKER_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_WORKER_ROOT))
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from section_triage import DB_URL, triage  # noqa: E402
+from section_triage import DB_URL, PARSER, prefetch, triage  # noqa: E402
 
 from src.html_extractor import HtmlTextExtractor  # noqa: E402
 from src.structure_parser import StructureParser  # noqa: E402
@@ -162,11 +162,12 @@ def main() -> int:
     if not ids:
         ap.error("provide --krithi or --from-report")
 
-    extractor, parser = HtmlTextExtractor(), StructureParser()
+    extractor, parser = HtmlTextExtractor(), PARSER
     token = _token() if args.apply else None
     written = skipped = 0
 
     with psycopg.connect(DB_URL) as conn:
+        prefetch(conn, ids)
         for kid in ids:
             res = triage(conn, kid, extractor, parser)
             if res.classification != "resplit-to-template":
@@ -254,8 +255,9 @@ def main() -> int:
     return 0
 
 
-# triage() already parsed the source; re-run the parser once more to hand back the
-# variant objects (with section text) rather than only the summary in TriageResult.
+# triage() already parsed the source; parse it again (a hit in the shared parser's
+# cache) to hand back the variant objects (with section text) rather than only the
+# summary in TriageResult.
 _CACHE: dict[Any, Any] = {}
 
 
@@ -267,7 +269,7 @@ def _reparse(res, lang):
         from src.diacritic_normalizer import normalize_garbled_diacritics
 
         html = _fetch(res.source_url)
-        parsed = StructureParser().parse(
+        parsed = PARSER.parse(
             normalize_garbled_diacritics(HtmlTextExtractor().extract(html, base_url=res.source_url).text)
         )
         _CACHE[key] = parsed
@@ -30,10 +30,9 @@ _WORKER_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_WORKER_ROOT))
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from section_triage import DB_URL, triage  # noqa: E402
+from section_triage import DB_URL, PARSER, prefetch, triage  # noqa: E402
 
 from src.html_extractor import HtmlTextExtractor  # noqa: E402
-from src.structure_parser import StructureParser  # noqa: E402
 
 _HEADING = re.compile(r"^##\s+(.*)$")
 _UUID = re.compile(r"`([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})`")
@@ -67,9 +66,10 @@ def main() -> int:
     print(f"Triaging {len(ids)} unique krithis…", file=sys.stderr)
 
     extractor = HtmlTextExtractor()
-    parser = StructureParser()
+    parser = PARSER
     report = []
     with psycopg.connect(DB_URL) as conn:
+        print(f"Prefetched {prefetch(conn, ids)} source pages", file=sys.stderr)
         for i, kid in enumerate(ids, 1):
             try:
                 res = triage(conn, kid, extractor, parser)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+"""Micro-benchmark StructureParser line classification and whole-text parsing.
+
+Reads the given text files (or, by default, the test fixtures), then times
+the per-line boilerplate and metadata-keyword checks over every line, the
+metadata-boundary scan of every file and a full `StructureParser.parse` of
+every file, reporting the best of ``--repeat`` rounds.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/structure_parser_benchmark.py
+    PYTHONPATH=. uv run python scripts/structure_parser_benchmark.py page.txt --repeat 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+from scripts._common import setup_logging
+from src.structure_parser import StructureParser
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def _best_of(repeat: int, run: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - began)
+    return best
+
+
+def _classify_all(check: Callable[[str], bool], lines: list[str]) -> list[bool]:
+    return [check(line) for line in lines]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("files", nargs="*", type=Path, help="text files to classify (default: test fixtures)")
+    ap.add_argument("--repeat", type=int, default=5, help="rounds per measurement; the best is reported")
+    args = ap.parse_args()
+    setup_logging()
+
+    files = args.files or sorted(p for p in DEFAULT_FIXTURES.rglob("*") if p.suffix in {".txt", ".html"})
+    texts = [path.read_text(encoding="utf-8") for path in files]
+    lines = [line.strip() for text in texts for line in text.splitlines() if line.strip()]
+    parser = StructureParser()
+    print(f"{len(files)} files, {len(lines)} non-blank lines")
+
+    for name, check in (("boilerplate", parser._is_boilerplate), ("meta", parser._is_meta_line)):
+        elapsed = _best_of(args.repeat, partial(_classify_all, check, lines))
+        hits = sum(check(line) for line in lines)
+        print(f"{name:12s} {elapsed * 1e6 / len(lines):7.2f} µs/line  ({hits} matched)")
+
+    elapsed = _best_of(args.repeat, lambda: [parser._find_metadata_boundaries(text) for text in texts])
+    print(f"{'boundaries':12s} {elapsed * 1e3:7.2f} ms for {sum(map(len, texts))} chars")
+    elapsed = _best_of(args.repeat, lambda: [parser.parse(text) for text in texts])
+    print(f"{'parse':12s} {elapsed * 1e3:7.1f} ms for all files")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
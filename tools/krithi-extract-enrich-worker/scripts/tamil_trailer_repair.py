@@ -48,7 +48,7 @@ from section_repair import (  # noqa: E402  (reuse the audited helpers)
     _token,
     _variant_ids,
 )
-from section_triage import DB_URL, _fetch, triage  # noqa: E402
+from section_triage import DB_URL, PARSE_CACHE_SIZE, PARSER, _fetch, prefetch, triage  # noqa: E402
 
 from src.diacritic_normalizer import normalize_garbled_diacritics  # noqa: E402
 from src.html_extractor import HtmlTextExtractor  # noqa: E402
@@ -58,9 +58,12 @@ _MIN_TRAILER_CHARS = 40
 _MIN_SHARED_RUN = 20
 
 
+# The stripping parser is triage's, so the stripped parse is a cache hit.
+_PARSERS = {True: PARSER, False: StructureParser(cache_size=PARSE_CACHE_SIZE, trailer_strip=False)}
+
+
 def _parse(url: str, *, strip: bool):
-    p = StructureParser()
-    p._trailer_strip_enabled = strip
+    p = _PARSERS[strip]
     html = _fetch(url)
     return {
         v.language: v
@@ -133,8 +136,9 @@ def main() -> int:
     token = _token() if args.apply else None
     written = skipped = 0
     with psycopg.connect(DB_URL) as conn:
+        prefetch(conn, ids)
         for kid in ids:
-            res = triage(conn, kid, HtmlTextExtractor(), StructureParser())
+            res = triage(conn, kid, HtmlTextExtractor(), PARSER)
             if res.classification != "resplit-to-template":
                 continue
             if res.stored_counts.get(args.lang) == 0:
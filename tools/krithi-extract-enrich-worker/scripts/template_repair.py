@@ -75,11 +75,10 @@ sys.path.insert(0, str(_WORKER_ROOT))
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from section_repair import _content_preserved, _stored_blob  # noqa: E402
-from section_triage import DB_URL, _fetch, triage  # noqa: E402
+from section_triage import DB_URL, PARSER, _fetch, prefetch, triage  # noqa: E402
 
 from src.diacritic_normalizer import normalize_garbled_diacritics  # noqa: E402
 from src.html_extractor import HtmlTextExtractor  # noqa: E402
-from src.structure_parser import StructureParser  # noqa: E402
 
 API = os.environ.get("SANGITA_API", "http://localhost:8080")
 ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "dev-admin-token")
@@ -108,11 +107,9 @@ def _token() -> str:
 
 
 def _parsed_variants(res):
-    """Re-parse the source once; return {lang: [DetectedSection,...]}."""
+    """Parse the source (a cache hit after triage); return {lang: [DetectedSection,...]}."""
     html = _fetch(res.source_url)
-    parsed = StructureParser().parse(
-        normalize_garbled_diacritics(HtmlTextExtractor().extract(html, base_url=res.source_url).text)
-    )
+    parsed = PARSER.parse(normalize_garbled_diacritics(HtmlTextExtractor().extract(html, base_url=res.source_url).text))
     return {v.language: v.sections for v in parsed.lyric_variants}
 
 
@@ -133,7 +130,7 @@ def _section_ids_by_order(conn, krithi_id: str) -> dict[int, str]:
 
 def plan(conn, kid: str):
     """Return a repair plan dict, or (None, reason) if the krithi is ineligible."""
-    res = triage(conn, kid, HtmlTextExtractor(), StructureParser())
+    res = triage(conn, kid, HtmlTextExtractor(), PARSER)
     if res.classification != "template-undercount":
         return None, f"{res.classification}: {res.note}"
 
@@ -219,6 +216,7 @@ def main() -> int:
     eligible = skipped = variant_writes = 0
 
     with psycopg.connect(DB_URL) as conn:
+        prefetch(conn, ids)
         for kid in ids:
             p, reason = plan(conn, kid)
             if p is None:
@@ -0,0 +1,288 @@
+"""Content-addressed cache for downloaded source artifacts.
+
+Replaces the URL-keyed `EXTRACTION_CACHE_DIR/<sha256(url)[:16]><ext>` files,
+which held each body in memory, were never evicted, and were written in place
+so a crash could leave a truncated file that was then reused forever.
+
+Layout under the cache root::
+
+    objects/<sha[:2]>/<sha><ext>   artifact bytes, named by their SHA-256
+    aliases/<sha256(url)>          JSON: content SHA, extension and HTTP validators
+    tmp/                           in-flight downloads
+
+Downloads stream to ``tmp/`` while being hashed and are renamed into place
+only once complete, so a reader never sees a partial object. Two URLs that
+serve identical bytes share one object. Objects are touched on every hit and
+the least recently used are evicted once the store exceeds its byte budget;
+an alias whose object was evicted is simply a miss.
+
+By default a cached URL is never fetched again. In revalidation mode the
+stored ``ETag``/``Last-Modified`` are sent as ``If-None-Match``/
+``If-Modified-Since``; a 304 reuses the local copy, and a 200 replaces it, so a
+corrected blog page is picked up while unchanged pages transfer no body.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import httpx
+
+from . import task_metrics
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 16
+
+
+def file_checksum(path: str | Path) -> str:
+    """SHA-256 of a file, streamed rather than read into memory."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@dataclass(frozen=True)
+class StoredArtifact:
+    """A cached source artifact."""
+
+    path: Path
+    checksum: str  # SHA-256 hex digest of the bytes at `path`
+    size: int
+
+
+class ArtifactStore:
+    """Content-addressed, size-bounded artifact cache shared by the strategies."""
+
+    def __init__(self, root: str | Path, max_bytes: int = 0) -> None:
+        """Initialize the store.
+
+        Args:
+            root: Cache directory (``EXTRACTION_CACHE_DIR``).
+            max_bytes: Byte budget for stored objects; 0 disables eviction.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._objects = self.root / "objects"
+        self._aliases = self.root / "aliases"
+        self._tmp = self.root / "tmp"
+
+    def lookup(self, url: str) -> StoredArtifact | None:
+        """Return the cached artifact for a URL, refreshing its LRU position."""
+        record = self._read_alias(url)
+        return self._resolve(url, record) if record is not None else None
+
+    def fetch(
+        self,
+        url: str,
+        client: httpx.Client,
+        extension: str,
+        *,
+        revalidate: bool = False,
+    ) -> StoredArtifact:
+        """Return the artifact for a URL, streaming it into the store on a miss.
+
+        With ``revalidate``, a hit is confirmed with a conditional GET first.
+        A hit stored without validators cannot be confirmed and is re-fetched.
+        """
+        record = self._read_alias(url)
+        cached = self._resolve(url, record) if record is not None else None
+        if cached is not None and not revalidate:
+            logger.debug(f"Using cached artifact: {cached.path}")
+            task_metrics.count("artifact_cache_hits")
+            return cached
+
+        logger.info(f"Downloading source: {url}")
+        with client.stream("GET", url, headers=self._conditional_headers(cached, record)) as response:
+            if cached is not None and response.status_code == 304:
+                logger.debug(f"Source not modified, reusing cached artifact: {cached.path}")
+                task_metrics.count("artifact_cache_hits")
+                return cached
+            response.raise_for_status()
+            artifact = self._store_stream(response.iter_bytes(_CHUNK_SIZE), extension)
+            self._record(url, artifact, extension, response)
+        task_metrics.count("artifact_downloads")
+        return artifact
+
+    async def fetch_async(
+        self,
+        url: str,
+        client: httpx.AsyncClient,
+        extension: str,
+        *,
+        revalidate: bool = False,
+    ) -> StoredArtifact:
+        """`fetch` over an async client, for concurrent prefetching.
+
+        Same cache, revalidation and atomicity rules; only the transfer is async.
+        """
+        record = self._read_alias(url)
+        cached = self._resolve(url, record) if record is not None else None
+        if cached is not None and not revalidate:
+            return cached
+
+        logger.info(f"Downloading source: {url}")
+        async with client.stream("GET", url, headers=self._conditional_headers(cached, record)) as response:
+            if cached is not None and response.status_code == 304:
+                logger.debug(f"Source not modified, reusing cached artifact: {cached.path}")
+                return cached
+            response.raise_for_status()
+            with self._open_writer() as writer:
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    writer.write(chunk)
+                artifact = writer.commit(extension)
+            self._record(url, artifact, extension, response)
+        return artifact
+
+    @staticmethod
+    def _conditional_headers(cached: StoredArtifact | None, record: dict[str, Any] | None) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if cached is not None and record is not None:
+            if record.get("etag"):
+                headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def _record(self, url: str, artifact: StoredArtifact, extension: str, response: httpx.Response) -> None:
+        """Point the URL's alias at a freshly stored artifact, then enforce the budget."""
+        self._write_alias(
+            url,
+            {
+                "checksum": artifact.checksum,
+                "extension": extension,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            },
+        )
+        self.evict(keep=artifact.path)
+
+    def _read_alias(self, url: str) -> dict[str, Any] | None:
+        try:
+            record: dict[str, Any] = json.loads(self._alias_path(url).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            # Unreadable alias: treat as a miss, the next fetch rewrites it.
+            return None
+        return record
+
+    def _resolve(self, url: str, record: dict[str, Any]) -> StoredArtifact | None:
+        """The object an alias record points at, touched; None if it was evicted."""
+        object_path = self._object_path(record["checksum"], record["extension"])
+        try:
+            size = object_path.stat().st_size
+            os.utime(object_path)
+        except FileNotFoundError:
+            # Evicted since the alias was written.
+            self._alias_path(url).unlink(missing_ok=True)
+            return None
+        return StoredArtifact(path=object_path, checksum=record["checksum"], size=size)
+
+    def _store_stream(self, chunks: Iterable[bytes], extension: str) -> StoredArtifact:
+        """Hash chunks into a temp file, then atomically publish it under its digest."""
+        with self._open_writer() as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            return writer.commit(extension)
+
+    @contextlib.contextmanager
+    def _open_writer(self) -> Iterator[_ObjectWriter]:
+        """A temp-file writer whose file is removed unless it was committed."""
+        self._tmp.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._tmp)
+        writer = _ObjectWriter(self, os.fdopen(fd, "wb"), tmp_name)
+        try:
+            yield writer
+        finally:
+            writer.file.close()
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_name)
+
+    def _write_alias(self, url: str, record: dict[str, Any]) -> None:
+        alias_path = self._alias_path(url)
+        alias_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=alias_path.parent, prefix=".alias-")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(record, tmp_file)
+        os.replace(tmp_name, alias_path)
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Delete least recently used objects until the store fits its budget.
+
+        Returns the number of bytes freed.
+        """
+        if self.max_bytes <= 0 or not self._objects.exists():
+            return 0
+
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self._objects.glob("*/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        freed = 0
+        for _mtime, size, path in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            freed += size
+
+        if freed:
+            logger.info(
+                "Evicted cached artifacts",
+                extra={"freed_bytes": freed, "store_bytes": total - freed, "max_bytes": self.max_bytes},
+            )
+        return freed
+
+    def _alias_path(self, url: str) -> Path:
+        return self._aliases / hashlib.sha256(url.encode()).hexdigest()
+
+    def _object_path(self, checksum: str, extension: str) -> Path:
+        return self._objects / checksum[:2] / f"{checksum}{extension}"
+
+
+class _ObjectWriter:
+    """Streams one download into ``tmp/`` while hashing it."""
+
+    def __init__(self, store: ArtifactStore, file: BinaryIO, tmp_name: str) -> None:
+        self.store = store
+        self.file = file
+        self.tmp_name = tmp_name
+        self._digest = hashlib.sha256()
+        self._size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._digest.update(chunk)
+        self.file.write(chunk)
+        self._size += len(chunk)
+
+    def commit(self, extension: str) -> StoredArtifact:
+        """Fsync and publish the temp file under its digest, deduplicating by content."""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+        checksum = self._digest.hexdigest()
+        object_path = self.store._object_path(checksum, extension)
+        if object_path.exists():
+            # Same bytes already stored under another URL: deduplicate.
+            os.utime(object_path)
+        else:
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self.tmp_name, object_path)
+        return StoredArtifact(path=object_path, checksum=checksum, size=self._size)
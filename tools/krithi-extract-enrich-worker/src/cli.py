@@ -1,7 +1,8 @@
 """CLI entry point for local development and testing.
 
 Usage:
-    python -m src.cli extract --input <pdf_path_or_url> --output <json_path> [--pages 1-10]
+    python -m src.cli extract --input <pdf_path_or_url> --output <json_path> [--pages 1-10] [--reparse]
+    python -m src.cli reextract [--dry-run] [--workers 4] [--batch-size 50] [--limit N] [--format PDF]
     python -m src.cli transliterate --text "..." --from devanagari --to tamil
 
 For production use, the worker.py entry point polls the extraction_queue database table.
@@ -11,6 +12,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
 import uuid
 from pathlib import Path
@@ -19,12 +21,15 @@ from typing import Any
 import click
 
 from .config import ExtractorConfig
-from .db import ExtractionTask
+from .db import ExtractionQueueDB, ExtractionTask
+from .document_cache import DocumentCache
 from .extraction_strategies import PdfExtractionStrategy
 from .extractor import PdfExtractor
+from .font_encoding import FontEncodingRegistry
 from .metadata_parser import MetadataParser
 from .ocr_fallback import OcrFallback
 from .page_segmenter import PageSegmenter
+from .reextract import CorpusReextractor
 from .schema import CanonicalExtraction
 from .structure_parser import StructureParser
 from .transliterator import Transliterator
@@ -51,6 +56,9 @@ def cli(verbose: bool) -> None:
 @click.option("--composer", "-c", default=None, help="Composer hint (e.g. 'Muthuswami Dikshitar')")
 @click.option("--source-name", default="local", help="Source name for provenance")
 @click.option("--source-tier", default=5, type=int, help="Source authority tier (1-5)")
+@click.option(
+    "--reparse", is_flag=True, help="Start from cached extracted text when present (SG_DOCUMENT_CACHE=reparse)"
+)
 def extract(
     input_path: str,
     output_path: str,
@@ -58,6 +66,7 @@ def extract(
     composer: str | None,
     source_name: str,
     source_tier: int,
+    reparse: bool,
 ) -> None:
     """Extract Krithis from a PDF file into canonical JSON format.
 
@@ -84,12 +93,23 @@ def extract(
     strategy = PdfExtractionStrategy(
         config,
         finalize,
-        pdf_extractor=PdfExtractor(),
+        pdf_extractor=PdfExtractor(
+            strip_running_headers=config.pdf_strip_running_headers,
+            font_registry=(
+                FontEncodingRegistry(Path(config.cache_dir) / "font-encodings") if config.pdf_font_encodings else None
+            ),
+        ),
         page_segmenter=PageSegmenter(),
-        ocr_fallback=OcrFallback(),
+        ocr_fallback=OcrFallback(backend=config.ocr_backend, preflight=config.ocr_preflight),
         structure_parser=StructureParser(),
         metadata_parser=MetadataParser(),
         transliterator=Transliterator(),
+        document_cache=(
+            DocumentCache(Path(config.cache_dir) / "documents", max_bytes=config.document_cache_max_bytes)
+            if reparse or config.document_cache != "off"
+            else None
+        ),
+        reparse=reparse or config.document_cache == "reparse",
     )
 
     task = ExtractionTask(
@@ -130,6 +150,44 @@ def extract(
     click.echo(f"\nWrote {len(results)} extractions to {output_path}")
 
 
+@cli.command()
+@click.option("--dry-run", is_flag=True, help="Re-extract and report the diff without writing anything")
+@click.option("--workers", "-w", default=os.cpu_count() or 1, show_default=True, help="Extraction processes")
+@click.option("--batch-size", default=50, show_default=True, help="Tasks per batch (one write transaction each)")
+@click.option("--limit", default=None, type=int, help="Stop after this many DONE tasks")
+@click.option("--format", "source_format", default=None, help="Only tasks of this source format (e.g. PDF)")
+def reextract(dry_run: bool, workers: int, batch_size: int, limit: int | None, source_format: str | None) -> None:
+    """Re-extract DONE tasks completed by an older EXTRACTOR_VERSION.
+
+    Replaces the reset-to-PENDING migrations (V42/V43): results are rebuilt
+    from cached sources and text on a process pool, and only tasks whose
+    results changed are rewritten.
+    """
+    config = ExtractorConfig()
+    db = ExtractionQueueDB(config)
+    try:
+        stats = CorpusReextractor(
+            config,
+            db,
+            workers=workers,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            limit=limit,
+            source_format=source_format,
+        ).run()
+    finally:
+        db.close()
+
+    click.echo(f"{'Dry run: ' if dry_run else ''}re-extraction against {config.extractor_version}")
+    click.echo(
+        f"  scanned {stats.scanned}, changed {stats.changed}, unchanged {stats.unchanged}, "
+        f"failed {stats.failed}, skipped (newer version) {stats.skipped_newer}"
+    )
+    click.echo(f"  results {stats.results_before} -> {stats.results_after}, tasks written {stats.written}")
+    for field_name, count in stats.field_changes.most_common():
+        click.echo(f"    {field_name}: {count}")
+
+
 @cli.command()
 @click.option("--text", "-t", required=True, help="Text to transliterate")
 @click.option("--from", "from_script", required=True, help="Source script (devanagari, tamil, etc.)")
@@ -1,6 +1,7 @@
 """Environment-based configuration for the Krithi extraction/enrichment worker."""
 
 import socket
+from typing import Literal
 
 from pydantic import Field, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -41,11 +42,83 @@ class ExtractorConfig(BaseSettings):
     # Worker behaviour
     poll_interval_s: int = Field(default=5, ge=1, validation_alias="EXTRACTION_POLL_INTERVAL_S")
 
+    # Embedded HTTP endpoint: /metrics (Prometheus text format), /healthz and
+    # /readyz answered from in-process state. 0 disables it, and the Docker
+    # health check falls back to a database round trip.
+    metrics_port: int = Field(default=9108, ge=0, le=65535, validation_alias="SG_METRICS_PORT")
+    metrics_host: str = Field(default="0.0.0.0", validation_alias="SG_METRICS_HOST")
+    # How often the polling loop samples queue depth (get_queue_stats) for /metrics.
+    queue_stats_interval_s: int = Field(default=30, ge=1, validation_alias="SG_QUEUE_STATS_INTERVAL_S")
+    # /healthz fails once the loop has made no progress for this long; one OCR
+    # task can legitimately hold it for many minutes.
+    liveness_max_stall_s: int = Field(default=3600, ge=1, validation_alias="SG_LIVENESS_MAX_STALL_S")
+    # Fraction of tasks (0.0-1.0) run under cProfile, pstats written to
+    # <cache_dir>/profiles/<task id>.pstats; a task whose request payload has
+    # "profile": true is always profiled. 0 leaves tasks unprofiled.
+    profile_tasks: float = Field(default=0.0, ge=0.0, le=1.0, validation_alias="SG_PROFILE_TASKS")
+    # pstats files older than this are removed whenever a new profile is written; 0 keeps them.
+    profile_max_age_s: int = Field(default=7 * 24 * 3600, ge=0, validation_alias="SG_PROFILE_MAX_AGE_S")
+
+    # Large-document sharding: whole-document PDF tasks above the page threshold
+    # are split into page-range child tasks so several workers share one anthology.
+    enable_task_sharding: bool = Field(default=False, validation_alias="SG_ENABLE_TASK_SHARDING")
+    shard_page_threshold: int = Field(default=200, ge=2, validation_alias="SG_SHARD_PAGE_THRESHOLD")
+    shard_target_pages: int = Field(default=50, ge=1, validation_alias="SG_SHARD_TARGET_PAGES")
+    # PROCESSING claims older than this go back to PENDING (a worker died
+    # mid-task); the same sweep finishes sharded parents whose roll-up was
+    # lost. Generous by default: one OCR-heavy task may run for a long time.
+    # 0 disables the sweep.
+    stale_claim_timeout_s: int = Field(default=21600, ge=0, validation_alias="SG_STALE_CLAIM_TIMEOUT_S")
+
+    # Extracted PDF text (PyMuPDF spans or OCR pages) cache under
+    # <cache_dir>/documents: "write" stores it after every extraction,
+    # "reparse" also starts from it when present, skipping PyMuPDF and OCR.
+    document_cache: Literal["off", "write", "reparse"] = Field(default="off", validation_alias="SG_DOCUMENT_CACHE")
+    # Byte budget for that tree; least recently used entries are evicted beyond it. 0 disables eviction.
+    document_cache_max_bytes: int = Field(default=2 * 1024**3, ge=0, validation_alias="SG_DOCUMENT_CACHE_MAX_BYTES")
+
+    # Result persistence: "payload" writes the whole result list into
+    # extraction_queue.result_payload; "rows" streams one extraction_results row
+    # per extraction through COPY (V51), for large anthologies.
+    result_persistence: Literal["payload", "rows"] = Field(default="payload", validation_alias="SG_RESULT_PERSISTENCE")
+
+    # Checkpoint OCR'd pages and finished segments of PDF tasks under
+    # <cache_dir>/checkpoints so a retried task resumes instead of restarting.
+    task_checkpoints: bool = Field(default=False, validation_alias="SG_TASK_CHECKPOINTS")
+    # Logs of tasks that never completed are removed after this many seconds
+    # (checked at worker start); 0 keeps them.
+    checkpoint_max_age_s: int = Field(default=7 * 24 * 3600, ge=0, validation_alias="SG_CHECKPOINT_MAX_AGE_S")
+
+    # Born-digital PDF text: drop running headers/footers that recur across
+    # the extracted pages.
+    pdf_strip_running_headers: bool = Field(default=False, validation_alias="SG_PDF_STRIP_RUNNING_HEADERS")
+    # Derive glyph maps for legacy Indic Type 1 fonts without /ToUnicode from
+    # their embedded encoding vectors, cached under <cache_dir>/font-encodings.
+    # Velthuis fonts keep the dvng10 map; their vectors are only checked against it.
+    pdf_font_encodings: bool = Field(default=True, validation_alias="SG_PDF_FONT_ENCODINGS")
+
+    # OCR engine: "tesserocr" keeps one in-process Tesseract handle per worker,
+    # "pytesseract" forks the CLI per page, "auto" picks the best installed.
+    ocr_backend: Literal["auto", "tesserocr", "pytesseract"] = Field(default="auto", validation_alias="SG_OCR_BACKEND")
+    # Skip blank/plate pages and crop text pages to their text region before OCR.
+    ocr_preflight: bool = Field(default=True, validation_alias="SG_OCR_PREFLIGHT")
+
     # Logging
     log_level: str = Field(default="INFO", validation_alias="LOG_LEVEL")
 
     # Cache
     cache_dir: str = Field(default="/app/cache", validation_alias="EXTRACTION_CACHE_DIR")
+    # Byte budget for the source artifact store; least recently used artifacts
+    # are evicted beyond it. 0 disables eviction.
+    cache_max_bytes: int = Field(default=10 * 1024**3, ge=0, validation_alias="EXTRACTION_CACHE_MAX_BYTES")
+    # Confirm cached sources with a conditional GET (ETag/Last-Modified) before reuse.
+    cache_revalidate: bool = Field(default=False, validation_alias="EXTRACTION_CACHE_REVALIDATE")
+
+    # Concurrent source prefetch: when an HTML task's page is not cached, it and
+    # the next pending HTML pages are fetched together. 0 disables prefetching.
+    prefetch_batch_size: int = Field(default=0, ge=0, validation_alias="SG_PREFETCH_BATCH_SIZE")
+    fetch_per_host_limit: int = Field(default=4, ge=1, validation_alias="SG_FETCH_PER_HOST_LIMIT")
+    fetch_host_delay_s: float = Field(default=0.25, ge=0, validation_alias="SG_FETCH_HOST_DELAY_S")
 
     # Identity (for claimed_by tracking)
     hostname: str = Field(default_factory=socket.gethostname)
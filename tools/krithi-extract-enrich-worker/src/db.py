@@ -2,12 +2,16 @@
 
 Provides claim/update/query operations that the worker loop uses to:
 1. Claim PENDING tasks (SELECT ... FOR UPDATE SKIP LOCKED)
-2. Mark tasks as PROCESSING, DONE, or FAILED
-3. Query queue statistics for health monitoring
+2. Mark tasks as PROCESSING, DONE, or FAILED (results inline or as rows)
+3. Split large tasks into page-range shards and roll the parent up
+   (resuming an existing split, and reaping stalled parents and stale claims)
+4. Re-extract DONE tasks left by an older extractor version
+5. Query queue statistics for health monitoring
 """
 
 import json
 import logging
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -19,6 +23,15 @@ from .config import ExtractorConfig
 
 logger = logging.getLogger(__name__)
 
+# A parent's current shards: the newest child per page range. Older children
+# for the same range are superseded and never rolled up or aggregated.
+_CURRENT_SHARDS_SQL = """
+    SELECT DISTINCT ON (page_range) *
+    FROM extraction_queue
+    WHERE parent_extraction_id = %(id)s
+    ORDER BY page_range, created_at DESC, id DESC
+"""
+
 
 @dataclass
 class ExtractionTask:
@@ -34,6 +47,26 @@ class ExtractionTask:
     import_batch_id: UUID | None
     import_task_run_id: UUID | None
     attempts: int
+    # Set on page-range shards enqueued by the splitter (V50).
+    parent_extraction_id: UUID | None = None
+
+
+@dataclass
+class DoneExtraction:
+    """A DONE task with the version and results it was completed with."""
+
+    task: ExtractionTask
+    extractor_version: str | None
+    result_payload: list[dict[str, Any]]
+
+
+@dataclass
+class RewrittenResults:
+    """Re-extracted results for a DONE task, one JSON document per result."""
+
+    task_id: UUID
+    result_documents: list[str]
+    extraction_method: str
 
 
 @dataclass
@@ -98,7 +131,7 @@ class ExtractionQueueDB:
                 """
                 SELECT id, source_url, source_format, source_name, source_tier,
                        request_payload, page_range, import_batch_id,
-                       import_task_run_id, attempts
+                       import_task_run_id, attempts, parent_extraction_id
                 FROM extraction_queue
                 WHERE status = 'PENDING' AND attempts < max_attempts
                 ORDER BY created_at
@@ -145,6 +178,7 @@ class ExtractionQueueDB:
                 # The row was read before the claim UPDATE incremented it;
                 # the task object must carry the attempt now in progress.
                 attempts=row["attempts"] + 1,
+                parent_extraction_id=row["parent_extraction_id"],
             )
 
     def mark_done(
@@ -155,34 +189,23 @@ class ExtractionQueueDB:
         confidence: float,
         duration_ms: int,
         source_checksum: str | None = None,
+        cached_artifact_path: str | None = None,
+        stage_metrics: dict[str, Any] | None = None,
     ) -> None:
         """Mark a task as successfully completed with results."""
         self.ensure_connected()
         with self.conn.cursor() as cur:
-            cur.execute(
-                """
-                UPDATE extraction_queue
-                SET status = 'DONE',
-                    result_payload = %(result)s::jsonb,
-                    result_count = %(count)s,
-                    extraction_method = %(method)s,
-                    extractor_version = %(version)s,
-                    confidence = %(confidence)s,
-                    duration_ms = %(duration)s,
-                    source_checksum = %(checksum)s,
-                    updated_at = NOW()
-                WHERE id = %(id)s
-                """,
-                {
-                    "id": task_id,
-                    "result": json.dumps(result_payload),
-                    "count": len(result_payload),
-                    "method": extraction_method,
-                    "version": self._config.extractor_version,
-                    "confidence": confidence,
-                    "duration": duration_ms,
-                    "checksum": source_checksum,
-                },
+            self._set_done(
+                cur,
+                task_id,
+                result_json=json.dumps(result_payload),
+                result_count=len(result_payload),
+                extraction_method=extraction_method,
+                confidence=confidence,
+                duration_ms=duration_ms,
+                source_checksum=source_checksum,
+                cached_artifact_path=cached_artifact_path,
+                stage_metrics=stage_metrics,
             )
             self.conn.commit()
         logger.info(
@@ -190,8 +213,103 @@ class ExtractionQueueDB:
             extra={"task_id": str(task_id), "result_count": len(result_payload), "duration_ms": duration_ms},
         )
 
-    def mark_failed(self, task_id: UUID, error_detail: dict[str, Any]) -> None:
-        """Mark a task as failed with error details."""
+    def mark_done_rows(
+        self,
+        task_id: UUID,
+        result_documents: Iterable[str],
+        extraction_method: str,
+        confidence: float,
+        duration_ms: int,
+        source_checksum: str | None = None,
+        cached_artifact_path: str | None = None,
+        stage_metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Mark a task as completed, storing each result as its own `extraction_results` row (V51).
+
+        `result_documents` yields one JSON document per CanonicalExtraction; they
+        are streamed through COPY as they are produced, so the whole payload is
+        never held as one value on either side. `result_payload` stays NULL and
+        readers fall back to the rows; a task with no results records an empty
+        inline payload, as `mark_done` would. Rows left by an earlier attempt
+        are replaced in the same transaction.
+        """
+        self.ensure_connected()
+        result_count = 0
+        with self.conn.cursor() as cur:
+            cur.execute("DELETE FROM extraction_results WHERE extraction_id = %(id)s", {"id": task_id})
+            with cur.copy("COPY extraction_results (extraction_id, ordinal, result) FROM STDIN") as copy:
+                for ordinal, document in enumerate(result_documents):
+                    copy.write_row((task_id, ordinal, document))
+                    result_count = ordinal + 1
+            self._set_done(
+                cur,
+                task_id,
+                result_json=None if result_count else "[]",
+                result_count=result_count,
+                extraction_method=extraction_method,
+                confidence=confidence,
+                duration_ms=duration_ms,
+                source_checksum=source_checksum,
+                cached_artifact_path=cached_artifact_path,
+                stage_metrics=stage_metrics,
+            )
+            self.conn.commit()
+        logger.info(
+            "Task completed",
+            extra={"task_id": str(task_id), "result_count": result_count, "duration_ms": duration_ms},
+        )
+
+    def _set_done(
+        self,
+        cur: psycopg.Cursor[dict[str, Any]],
+        task_id: UUID,
+        *,
+        result_json: str | None,
+        result_count: int,
+        extraction_method: str,
+        confidence: float,
+        duration_ms: int,
+        source_checksum: str | None,
+        cached_artifact_path: str | None,
+        stage_metrics: dict[str, Any] | None,
+    ) -> None:
+        cur.execute(
+            """
+            UPDATE extraction_queue
+            SET status = 'DONE',
+                result_payload = %(result)s::jsonb,
+                result_count = %(count)s,
+                extraction_method = %(method)s,
+                extractor_version = %(version)s,
+                confidence = %(confidence)s,
+                duration_ms = %(duration)s,
+                source_checksum = %(checksum)s,
+                cached_artifact_path = %(artifact_path)s,
+                stage_metrics = %(stage_metrics)s::jsonb,
+                updated_at = NOW()
+            WHERE id = %(id)s
+            """,
+            {
+                "id": task_id,
+                "result": result_json,
+                "count": result_count,
+                "method": extraction_method,
+                "version": self._config.extractor_version,
+                "confidence": confidence,
+                "duration": duration_ms,
+                "checksum": source_checksum,
+                "artifact_path": cached_artifact_path,
+                "stage_metrics": json.dumps(stage_metrics) if stage_metrics is not None else None,
+            },
+        )
+
+    def mark_failed(
+        self,
+        task_id: UUID,
+        error_detail: dict[str, Any],
+        stage_metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Mark a task as failed with error details and the stages it got through."""
         self.ensure_connected()
         with self.conn.cursor() as cur:
             cur.execute(
@@ -199,6 +317,7 @@ class ExtractionQueueDB:
                 UPDATE extraction_queue
                 SET status = 'FAILED',
                     error_detail = %(error)s::jsonb,
+                    stage_metrics = %(stage_metrics)s::jsonb,
                     last_error_at = NOW(),
                     updated_at = NOW()
                 WHERE id = %(id)s
@@ -206,6 +325,7 @@ class ExtractionQueueDB:
                 {
                     "id": task_id,
                     "error": json.dumps(error_detail),
+                    "stage_metrics": json.dumps(stage_metrics) if stage_metrics is not None else None,
                 },
             )
             self.conn.commit()
@@ -216,6 +336,437 @@ class ExtractionQueueDB:
             error_detail.get("type", "unknown"),
         )
 
+    def attach_profile(self, task_id: UUID, profile: dict[str, Any]) -> None:
+        """Add a profiled task's top-function summary to its stage_metrics, after its outcome is written."""
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE extraction_queue
+                SET stage_metrics = COALESCE(stage_metrics, '{}'::jsonb)
+                        || jsonb_build_object('profile', %(profile)s::jsonb)
+                WHERE id = %(id)s
+                """,
+                {"id": task_id, "profile": json.dumps(profile)},
+            )
+            self.conn.commit()
+
+    def has_shards(self, task_id: UUID) -> bool:
+        """Whether `task_id` was already split into shards by an earlier claim."""
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                "SELECT EXISTS (SELECT 1 FROM extraction_queue WHERE parent_extraction_id = %(id)s) AS sharded",
+                {"id": task_id},
+            )
+            row = cur.fetchone()
+            self.conn.rollback()
+        return bool(row and row["sharded"])
+
+    def enqueue_shards(self, parent: ExtractionTask, page_ranges: list[str]) -> list[UUID]:
+        """Enqueue one PENDING child task per page range, or resume an existing split.
+
+        Children copy the parent's request columns and point back at it through
+        `parent_extraction_id`. All inserts share one commit, so a crash cannot
+        leave a parent with only some of its shards. The parent itself stays
+        PROCESSING until `complete_parent_if_ready` rolls it up.
+
+        A parent reclaimed after a backend retry already has shards (the worker
+        checks `has_shards` and passes no ranges). Their layout is kept and
+        `page_ranges` is ignored: DONE and INGESTED shards
+        are left alone (inserting them again would ingest the same Krithis
+        twice), FAILED and CANCELLED ones are requeued in place, and shards
+        still PENDING or PROCESSING carry on. Returns the current shard ids.
+        """
+        self.ensure_connected()
+        child_ids: list[UUID] = []
+        with self.conn.cursor() as cur:
+            # Serializes a reclaim with complete_parent_if_ready, which locks the parent too.
+            cur.execute("SELECT id FROM extraction_queue WHERE id = %(id)s FOR UPDATE", {"id": parent.id})
+            if cur.fetchone() is None:
+                self.conn.rollback()
+                raise RuntimeError(f"Parent task {parent.id} vanished while enqueueing shards")
+            cur.execute(
+                f"SELECT id, status::text AS status FROM ({_CURRENT_SHARDS_SQL}) shards",
+                {"id": parent.id},
+            )
+            existing = cur.fetchall()
+            if existing:
+                requeued = [row["id"] for row in existing if row["status"] in ("FAILED", "CANCELLED")]
+                if requeued:
+                    cur.execute(
+                        """
+                        UPDATE extraction_queue
+                        SET status = 'PENDING',
+                            attempts = 0,
+                            error_detail = NULL,
+                            updated_at = NOW()
+                        WHERE id = ANY(%(ids)s)
+                        """,
+                        {"ids": requeued},
+                    )
+                self.conn.commit()
+                logger.info(
+                    "Resumed sharded task",
+                    extra={"task_id": str(parent.id), "shards": len(existing), "requeued_shards": len(requeued)},
+                )
+                return [row["id"] for row in existing]
+
+            for page_range in page_ranges:
+                cur.execute(
+                    """
+                    INSERT INTO extraction_queue
+                        (import_batch_id, import_task_run_id, source_url, source_format,
+                         source_name, source_tier, request_payload, page_range, max_attempts,
+                         content_language, extraction_intent, related_extraction_id,
+                         parent_extraction_id)
+                    SELECT import_batch_id, import_task_run_id, source_url, source_format,
+                           source_name, source_tier, request_payload, %(page_range)s, max_attempts,
+                           content_language, extraction_intent, related_extraction_id,
+                           id
+                    FROM extraction_queue
+                    WHERE id = %(parent_id)s
+                    RETURNING id
+                    """,
+                    {"parent_id": parent.id, "page_range": page_range},
+                )
+                row = cur.fetchone()
+                if row is None:
+                    raise RuntimeError(f"Parent task {parent.id} vanished while enqueueing shards")
+                child_ids.append(row["id"])
+            self.conn.commit()
+        logger.info(
+            "Task sharded",
+            extra={"task_id": str(parent.id), "shards": len(child_ids), "page_ranges": page_ranges},
+        )
+        return child_ids
+
+    def complete_parent_if_ready(self, parent_id: UUID) -> bool:
+        """Roll a sharded parent up once every child has reached a terminal state.
+
+        The parent row is locked first, so concurrent workers finishing the last
+        two shards serialize here and exactly one performs the roll-up. Children
+        carry the extraction results (each is an ordinary page-range task the
+        backend ingests); the parent records the aggregate count and is marked
+        DONE with no payload of its own, or FAILED listing the failed shards.
+        A retried shard re-enters here, so a FAILED parent can still turn DONE.
+        Only the newest shard per page range counts; older duplicates (left by
+        re-splits before `enqueue_shards` resumed existing shards) are superseded.
+
+        Returns True if the parent was finalized by this call.
+        """
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT status::text AS status
+                FROM extraction_queue
+                WHERE id = %(id)s
+                FOR UPDATE
+                """,
+                {"id": parent_id},
+            )
+            parent = cur.fetchone()
+            if parent is None or parent["status"] not in ("PROCESSING", "FAILED"):
+                self.conn.rollback()
+                return False
+
+            cur.execute(
+                f"""
+                SELECT id, page_range, status::text AS status, result_count,
+                       extraction_method, duration_ms
+                FROM ({_CURRENT_SHARDS_SQL}) shards
+                """,
+                {"id": parent_id},
+            )
+            children = cur.fetchall()
+            if not children or any(child["status"] in ("PENDING", "PROCESSING") for child in children):
+                self.conn.rollback()
+                return False
+
+            failed = [child for child in children if child["status"] not in ("DONE", "INGESTED")]
+            if failed:
+                error_detail = {
+                    "message": f"{len(failed)} of {len(children)} shards did not complete",
+                    "type": "ShardFailure",
+                    "failed_shards": [
+                        {"id": str(child["id"]), "page_range": child["page_range"], "status": child["status"]}
+                        for child in failed
+                    ],
+                }
+                cur.execute(
+                    """
+                    UPDATE extraction_queue
+                    SET status = 'FAILED',
+                        error_detail = %(error)s::jsonb,
+                        last_error_at = NOW(),
+                        updated_at = NOW()
+                    WHERE id = %(id)s
+                    """,
+                    {"id": parent_id, "error": json.dumps(error_detail)},
+                )
+            else:
+                methods = [child["extraction_method"] for child in children if child["extraction_method"]]
+                cur.execute(
+                    """
+                    UPDATE extraction_queue
+                    SET status = 'DONE',
+                        result_payload = NULL,
+                        result_count = %(count)s,
+                        extraction_method = %(method)s,
+                        extractor_version = %(version)s,
+                        duration_ms = %(duration)s,
+                        error_detail = NULL,
+                        updated_at = NOW()
+                    WHERE id = %(id)s
+                    """,
+                    {
+                        "id": parent_id,
+                        "count": sum(child["result_count"] or 0 for child in children),
+                        "method": max(set(methods), key=methods.count) if methods else None,
+                        "version": self._config.extractor_version,
+                        "duration": sum(child["duration_ms"] or 0 for child in children),
+                    },
+                )
+            self.conn.commit()
+        logger.info(
+            "Sharded parent finalized",
+            extra={"task_id": str(parent_id), "shards": len(children), "failed_shards": len(failed)},
+        )
+        return True
+
+    def roll_up_stalled_parents(self) -> int:
+        """Finalize PROCESSING parents whose current shards are all terminal.
+
+        Normally the worker finishing the last shard rolls its parent up; if
+        that roll-up failed (or the worker died between committing the shard
+        and rolling up) nothing else would ever finish the parent. Returns the
+        number of parents finalized.
+        """
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT p.id
+                FROM extraction_queue p
+                WHERE p.status = 'PROCESSING'
+                  AND EXISTS (SELECT 1 FROM extraction_queue c WHERE c.parent_extraction_id = p.id)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM extraction_queue c
+                      WHERE c.parent_extraction_id = p.id AND c.status IN ('PENDING', 'PROCESSING')
+                  )
+                """
+            )
+            parent_ids = [row["id"] for row in cur.fetchall()]
+            self.conn.rollback()
+        return sum(self.complete_parent_if_ready(parent_id) for parent_id in parent_ids)
+
+    def requeue_stale_claims(self, older_than_s: int) -> int:
+        """Return tasks stuck in PROCESSING past `older_than_s` to the queue.
+
+        A worker that dies mid-task (including between claiming a large PDF
+        and committing its shards) leaves the row PROCESSING forever. Such a
+        claim goes back to PENDING, or to FAILED once its attempts are spent.
+        Sharded parents are excluded: they stay PROCESSING while their shards
+        run and are finished by the roll-up. Returns the number of rows reset.
+        """
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE extraction_queue q
+                SET status = CASE WHEN q.attempts >= q.max_attempts
+                                  THEN 'FAILED'::extraction_status
+                                  ELSE 'PENDING'::extraction_status END,
+                    error_detail = jsonb_build_object(
+                        'message', 'Claim by ' || COALESCE(q.claimed_by, 'unknown worker') || ' expired',
+                        'type', 'StaleClaim',
+                        'attempt', q.attempts
+                    ),
+                    last_error_at = NOW(),
+                    updated_at = NOW()
+                WHERE q.status = 'PROCESSING'
+                  AND q.claimed_at < NOW() - make_interval(secs => %(older_than_s)s)
+                  AND NOT EXISTS (SELECT 1 FROM extraction_queue c WHERE c.parent_extraction_id = q.id)
+                RETURNING q.id
+                """,
+                {"older_than_s": older_than_s},
+            )
+            reset = [row["id"] for row in cur.fetchall()]
+            self.conn.commit()
+        if reset:
+            logger.warning("Requeued stale claims", extra={"count": len(reset), "task_ids": [str(i) for i in reset]})
+        return len(reset)
+
+    def list_done_extractions(
+        self,
+        *,
+        exclude_version: str,
+        after_id: UUID | None,
+        limit: int,
+        source_format: str | None = None,
+    ) -> list[DoneExtraction]:
+        """A page of DONE tasks not completed by `exclude_version`, in id order.
+
+        Keyset-paginated on `id`: pass the last id of the previous page as
+        `after_id`. Results stored as `extraction_results` rows (V51) are
+        folded into `result_payload`. Sharded parents carry no results of their
+        own and are left out; their shards are listed like any other task.
+        """
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT q.id, q.source_url, q.source_format, q.source_name, q.source_tier,
+                       q.request_payload, q.page_range, q.import_batch_id,
+                       q.import_task_run_id, q.attempts, q.parent_extraction_id,
+                       q.extractor_version,
+                       COALESCE(
+                           q.result_payload,
+                           (SELECT jsonb_agg(er.result ORDER BY er.ordinal)
+                            FROM extraction_results er WHERE er.extraction_id = q.id),
+                           '[]'::jsonb
+                       ) AS result_payload
+                FROM extraction_queue q
+                WHERE q.status = 'DONE'
+                  AND q.extractor_version IS DISTINCT FROM %(version)s
+                  AND (%(after_id)s::uuid IS NULL OR q.id > %(after_id)s::uuid)
+                  AND (%(source_format)s::text IS NULL OR q.source_format = %(source_format)s::text)
+                  AND NOT EXISTS (SELECT 1 FROM extraction_queue c WHERE c.parent_extraction_id = q.id)
+                ORDER BY q.id
+                LIMIT %(limit)s
+                """,
+                {"version": exclude_version, "after_id": after_id, "source_format": source_format, "limit": limit},
+            )
+            rows = cur.fetchall()
+            self.conn.rollback()
+        return [
+            DoneExtraction(
+                task=ExtractionTask(
+                    id=row["id"],
+                    source_url=row["source_url"],
+                    source_format=row["source_format"],
+                    source_name=row["source_name"],
+                    source_tier=row["source_tier"],
+                    request_payload=(
+                        row["request_payload"]
+                        if isinstance(row["request_payload"], dict)
+                        else json.loads(row["request_payload"])
+                    ),
+                    page_range=row["page_range"],
+                    import_batch_id=row["import_batch_id"],
+                    import_task_run_id=row["import_task_run_id"],
+                    attempts=row["attempts"],
+                    parent_extraction_id=row["parent_extraction_id"],
+                ),
+                extractor_version=row["extractor_version"],
+                result_payload=row["result_payload"],
+            )
+            for row in rows
+        ]
+
+    def rewrite_done_results(
+        self,
+        changed: Sequence[RewrittenResults],
+        unchanged: Sequence[UUID],
+        *,
+        as_rows: bool = False,
+    ) -> int:
+        """Write a batch of re-extracted results back in one transaction.
+
+        Changed tasks get their new results, inline in `result_payload` or, with
+        `as_rows`, COPY'd into `extraction_results`; unchanged tasks only have
+        `extractor_version` bumped, so their payloads are not rewritten. Rows
+        are locked first and only those still DONE are touched: a task the
+        backend ingested in the meantime keeps what it was ingested with.
+
+        Returns the number of changed tasks written.
+        """
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT id FROM extraction_queue
+                WHERE id = ANY(%(ids)s) AND status = 'DONE'
+                ORDER BY id
+                FOR UPDATE
+                """,
+                {"ids": [result.task_id for result in changed] + list(unchanged)},
+            )
+            still_done = {row["id"] for row in cur.fetchall()}
+            writes = [result for result in changed if result.task_id in still_done]
+            if writes:
+                cur.execute(
+                    "DELETE FROM extraction_results WHERE extraction_id = ANY(%(ids)s)",
+                    {"ids": [result.task_id for result in writes]},
+                )
+            if as_rows and writes:
+                with cur.copy("COPY extraction_results (extraction_id, ordinal, result) FROM STDIN") as copy:
+                    for result in writes:
+                        for ordinal, document in enumerate(result.result_documents):
+                            copy.write_row((result.task_id, ordinal, document))
+            cur.executemany(
+                """
+                UPDATE extraction_queue
+                SET result_payload = %(result)s::jsonb,
+                    result_count = %(count)s,
+                    extraction_method = %(method)s,
+                    extractor_version = %(version)s,
+                    updated_at = NOW()
+                WHERE id = %(id)s
+                """,
+                [
+                    {
+                        "id": result.task_id,
+                        "result": (
+                            None
+                            if as_rows and result.result_documents
+                            else "[" + ",".join(result.result_documents) + "]"
+                        ),
+                        "count": len(result.result_documents),
+                        "method": result.extraction_method,
+                        "version": self._config.extractor_version,
+                    }
+                    for result in writes
+                ],
+            )
+            cur.execute(
+                """
+                UPDATE extraction_queue
+                SET extractor_version = %(version)s, updated_at = NOW()
+                WHERE id = ANY(%(ids)s)
+                """,
+                {
+                    "ids": [task_id for task_id in unchanged if task_id in still_done],
+                    "version": self._config.extractor_version,
+                },
+            )
+            self.conn.commit()
+        return len(writes)
+
+    def peek_pending_source_urls(self, source_format: str, limit: int) -> list[str]:
+        """Source URLs of the next PENDING tasks of a format, oldest first.
+
+        A plain read with no row locks: used only to warm the artifact store,
+        so a URL another worker claims in the meantime costs nothing.
+        """
+        self.ensure_connected()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT source_url
+                FROM extraction_queue
+                WHERE status = 'PENDING' AND attempts < max_attempts
+                  AND source_format = %(source_format)s
+                ORDER BY created_at
+                LIMIT %(limit)s
+                """,
+                {"source_format": source_format, "limit": limit},
+            )
+            rows = cur.fetchall()
+            self.conn.rollback()
+            return [row["source_url"] for row in rows]
+
     def get_queue_stats(self) -> QueueStats:
         """Get current queue depth by status."""
         self.ensure_connected()
@@ -231,7 +782,9 @@ class ExtractionQueueDB:
             for row in cur.fetchall():
                 status = row["status"].lower()
                 setattr(stats, status, row["cnt"])
-            return stats
+        # Sampled from the polling loop; don't hold a read transaction open between claims.
+        self.conn.rollback()
+        return stats
 
     def list_composer_reference_rows(self) -> list[dict[str, Any]]:
         """Load composer reference rows (with aliases where available)."""
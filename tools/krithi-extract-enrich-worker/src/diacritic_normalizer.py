@@ -25,32 +25,24 @@ import re
 # Rules 1–7 are safe for broad application.  Rule 8 (consonant + dot) is
 # handled via permissive regex in the parsers, not here.
 #
-# Each tuple: (compiled regex, replacement string)
-
-_RULES: list[tuple[re.Pattern[str], str]] = [
-    # 1. macron (¯) + optional space + a  →  ā
-    (re.compile(r"\u00AF\s*a"), "ā"),
-    # 2. macron (¯) + optional space + i or dotless-i (ı)  →  ī
-    (re.compile(r"\u00AF\s*[iı]"), "ī"),
-    # 3. macron (¯) + optional space + u  →  ū
-    (re.compile(r"\u00AF\s*u"), "ū"),
-    # 4. optional space + dot-above (˙) + optional space + m  →  ṁ
-    (re.compile(r"\s*\u02D9\s*m"), "ṁ"),
-    # 5. optional space + dot-above (˙) + optional space + n  →  ṅ
-    (re.compile(r"\s*\u02D9\s*n"), "ṅ"),
-    # 5b. optional space + dot-above (˙) + optional space + r  →  ṛ
-    (re.compile(r"\s*\u02D9\s*r"), "ṛ"),
-    # 6. acute (´) + optional space + s  →  ś
-    (re.compile(r"\u00B4\s*s"), "ś"),
-    # 7. tilde (˜) + optional space + n  →  ñ
-    (re.compile(r"\u02DC\s*n"), "ñ"),
-    # 8. Maltese Cross (✠) → strip (PDF artifact)
-    (re.compile(r"\u2720"), ""),
-    # 9. Trailing numbers at end of lines (Page/Song indices)
-    (re.compile(r"\n\s*\d+\s*$"), "\n"),
-    # 10. dotless-i (ı) → i (fallback)
-    (re.compile(r"\u0131"), "i"),
-]
+# Each family maps the letter after the diacritic (optional whitespace
+# allowed in between) to its precomposed form.
+
+# 1–3. macron (¯) + a / i or dotless-i (ı) / u  →  ā ī ū
+_MACRON = {"a": "ā", "i": "ī", "\u0131": "ī", "u": "ū"}
+# 4, 5, 5b. optional space + dot-above (˙) + m / n / r  →  ṁ ṅ ṛ
+_DOT_ABOVE = {"m": "ṁ", "n": "ṅ", "r": "ṛ"}
+# 6. acute (´) + s  →  ś
+_ACUTE = {"s": "ś"}
+# 7. tilde (˜) + n  →  ñ
+_TILDE = {"n": "ñ"}
+# Also: Maltese Cross (✠) → strip (PDF artifact), and dotless-i (ı) → i
+# (fallback, after rule 2 has had its chance).
+_STRIP = {"\u2720": "", "\u0131": "i"}
+
+# 9. Trailing numbers at end of lines (Page/Song indices). Anchored at the end
+# of the text, so it only needs running when the text ends in a digit.
+_TRAILING_INDEX = re.compile(r"\n\s*\d+\s*$")
 
 # ─── Rule 8: Consonant-dot patterns (Section 4.1, previously skipped) ────
 #
@@ -58,34 +50,74 @@ _RULES: list[tuple[re.Pattern[str], str]] = [
 # as base consonant + dot-below (represented as period).  The dot may be
 # followed by optional whitespace before the next character.
 #
-# We process these AFTER rules 1–7 so that combined forms like t¯al.a
-# (tāḷa) have the macron resolved first, then the dot.
+# These apply to the text as rules 1–7 leave it, so that combined forms like
+# t¯al.a (tāḷa) have the macron resolved first, then the dot.
 #
-# Order matters: longer patterns first to avoid partial matches.
-
-_CONSONANT_DOT_RULES: list[tuple[re.Pattern[str], str]] = [
-    # Each pattern uses a negative lookbehind for uppercase letters to
-    # prevent false positives on abbreviations like "Dr.", "Sr.", "Mr.".
-    # Sanskrit/IAST text uses lowercase; abbreviations use Title/UPPER case.
-    #
-    # Horizontal whitespace only ([ \t]*) — never consume newlines, otherwise
-    # "Mother.\npallavi" collapses into "Motheṛpallavi" and destroys section headers.
-    #
-    # s. + optional horizontal space  →  ṣ  (retroflex sibilant)
-    (re.compile(r"(?<![A-Z])s\.[ \t]*"), "ṣ"),
-    # n. + optional horizontal space  →  ṇ  (retroflex nasal)
-    (re.compile(r"(?<![A-Z])n\.[ \t]*"), "ṇ"),
-    # d. + optional horizontal space  →  ḍ  (retroflex stop)
-    (re.compile(r"(?<![A-Z])d\.[ \t]*"), "ḍ"),
-    # t. + optional horizontal space  →  ṭ  (retroflex stop)
-    (re.compile(r"(?<![A-Z])t\.[ \t]*"), "ṭ"),
-    # l. + optional horizontal space  →  ḷ  (retroflex lateral)
-    (re.compile(r"(?<![A-Z])l\.[ \t]*"), "ḷ"),
-    # r. + optional horizontal space  →  ṛ  (vocalic r)
-    (re.compile(r"(?<![A-Z])r\.[ \t]*"), "ṛ"),
-    # h. + optional horizontal space  →  ḥ  (visarga)
-    (re.compile(r"(?<![A-Z])h\.[ \t]*"), "ḥ"),
-]
+# A negative lookbehind for uppercase letters prevents false positives on
+# abbreviations like "Dr.", "Sr.", "Mr.". Sanskrit/IAST text uses lowercase;
+# abbreviations use Title/UPPER case.
+#
+# Horizontal whitespace only ([ \t]*) — never consume newlines, otherwise
+# "Mother.\npallavi" collapses into "Motheṛpallavi" and destroys section headers.
+_CONSONANT_DOT = {
+    "s": "ṣ",  # retroflex sibilant
+    "n": "ṇ",  # retroflex nasal
+    "d": "ḍ",  # retroflex stop
+    "t": "ṭ",  # retroflex stop
+    "l": "ḷ",  # retroflex lateral
+    "r": "ṛ",  # vocalic r
+    "h": "ḥ",  # visarga
+}
+
+# ─── Compiled scanner ───────────────────────────────────────────────────
+#
+# All rules run as one alternation, one named group per family; the callback
+# looks the captured letter up in that family's table. Every branch starts
+# with a fixed character class (the consonant-dot lookbehind is placed after
+# the consonant) so the regex engine skips quickly to candidate positions.
+#
+# One left-to-right pass gives the same result as applying the rules one
+# after another: rule 1–7 matches start at a diacritic or at the whitespace
+# before ˙, consonant-dot matches start at a lowercase consonant, and no
+# replacement produces a character another rule triggers on (or an A–Z letter
+# the lookbehind tests). The exception is the Maltese Cross: deleting it can
+# join a consonant to its dot ("s✠." → "s." → "ṣ"), so text containing ✠ runs
+# the consonant-dot rules as a second pass once the cross is gone.
+
+_FAMILIES: dict[str, dict[str, str]] = {
+    "macron": _MACRON,
+    "dot_above": _DOT_ABOVE,
+    "acute": _ACUTE,
+    "tilde": _TILDE,
+    "strip": _STRIP,
+    "consonant_dot": _CONSONANT_DOT,
+}
+
+
+def _letters(table: dict[str, str]) -> str:
+    return "[" + "".join(table) + "]"
+
+
+_DIACRITIC_BRANCHES = (
+    rf"\u00af\s*(?P<macron>{_letters(_MACRON)})",
+    rf"(?:\s+\u02d9|\u02d9)\s*(?P<dot_above>{_letters(_DOT_ABOVE)})",
+    rf"\u00b4\s*(?P<acute>{_letters(_ACUTE)})",
+    rf"\u02dc\s*(?P<tilde>{_letters(_TILDE)})",
+    rf"(?P<strip>{_letters(_STRIP)})",
+)
+_CONSONANT_DOT_BRANCH = rf"(?P<consonant_dot>{_letters(_CONSONANT_DOT)})(?<![A-Z].)\.[ \t]*"
+
+_SINGLE_PASS = re.compile("|".join((_CONSONANT_DOT_BRANCH, *_DIACRITIC_BRANCHES)))
+_DIACRITIC_PASS = re.compile("|".join(_DIACRITIC_BRANCHES))
+_CONSONANT_DOT_PASS = re.compile(_CONSONANT_DOT_BRANCH)
+
+_TRIGGER_CHARS = "\u00af\u02d9\u00b4\u02dc\u2720\u0131"
+
+
+def _replace(match: re.Match[str]) -> str:
+    # Every branch has exactly one named group, so lastgroup is always set.
+    family = match.lastgroup or ""
+    return _FAMILIES[family][match.group(family)]
 
 
 def normalize_garbled_diacritics(text: str) -> str:
@@ -100,13 +132,23 @@ def normalize_garbled_diacritics(text: str) -> str:
     Returns:
         Text with standalone diacritics replaced by their IAST equivalents.
     """
+    has_diacritic = any(ch in text for ch in _TRIGGER_CHARS)
+    has_dot = "." in text
+    trailing_index = text.rstrip()[-1:].isdigit()
+
+    if "\u2720" in text:
+        # Rules 1–7 (and the ✠ strip), then rule 9, then rule 8 on the cleaned text
+        result = _DIACRITIC_PASS.sub(_replace, text)
+        result = _TRAILING_INDEX.sub("\n", result)
+        return _CONSONANT_DOT_PASS.sub(_replace, result)
+
     result = text
-    # Rules 1–7: combining diacritics (macron, dot-above, acute, tilde)
-    for pattern, replacement in _RULES:
-        result = pattern.sub(replacement, result)
-    # Rule 8: consonant-dot patterns (must run after rules 1–7)
-    for pattern, replacement in _CONSONANT_DOT_RULES:
-        result = pattern.sub(replacement, result)
+    if has_diacritic:
+        result = _SINGLE_PASS.sub(_replace, result)
+    elif has_dot:
+        result = _CONSONANT_DOT_PASS.sub(_replace, result)
+    if trailing_index:
+        result = _TRAILING_INDEX.sub("\n", result)
     return result
 
 
@@ -0,0 +1,222 @@
+"""On-disk cache of extracted PDF text, for parser-only re-runs.
+
+PyMuPDF span extraction and 300-DPI OCR dominate the cost of a PDF task, yet
+a change to `StructureParser` or `MetadataParser` does not change their
+output. `DocumentCache` keeps what those stages produced, a `DocumentContent`
+with every page's text, geometry and spans, or the per-page OCR text, so a
+re-extraction can start at segmentation::
+
+    <cache_dir>/documents/<sha[:2]>/<sha>-<settings[:16]>.sgdc
+
+Entries are keyed by the source checksum plus a fingerprint of everything
+that shapes the text: page range, `TEXT_EXTRACTOR_VERSION`, the header and
+font options and the OCR languages, DPI and preflight. Parser and worker
+versions are deliberately not part of the key.
+
+The file is a short magic header followed by zlib-compressed JSON laid out
+column-wise: blocks are plain arrays and font names are interned in one
+table, so a 500-page anthology stores in a fraction of its PDF size and
+loads in milliseconds. Writes go through a temporary file and a rename.
+
+Entries are touched on every hit, and the least recently used are evicted
+once the tree exceeds its byte budget (`SG_DOCUMENT_CACHE_MAX_BYTES`), the
+same policy as the source artifact store.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from . import task_metrics
+from .extractor import DocumentContent, PageContent, TextBlock
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; older entries are then misses.
+_MAGIC = b"SGDC\x01"
+
+DocumentKind = Literal["text", "ocr"]
+
+
+@dataclass(frozen=True)
+class CachedDocument:
+    """A cached extraction: PyMuPDF content, or OCR text as one page entry per page."""
+
+    kind: DocumentKind
+    document: DocumentContent
+
+
+def encode_document(kind: DocumentKind, document: DocumentContent) -> bytes:
+    """Serialize to the compact cache format (the checksum and path are not stored)."""
+    fonts: dict[str, int] = {}
+    pages = [
+        [
+            page.page_number,
+            page.text,
+            page.width,
+            page.height,
+            [
+                [
+                    block.text,
+                    block.x0,
+                    block.y0,
+                    block.x1,
+                    block.y1,
+                    block.font_size,
+                    fonts.setdefault(block.font_name, len(fonts)),
+                    int(block.is_bold),
+                ]
+                for block in page.blocks
+            ],
+        ]
+        for page in document.pages
+    ]
+    body = {"kind": kind, "total_pages": document.total_pages, "fonts": list(fonts), "pages": pages}
+    return _MAGIC + zlib.compress(json.dumps(body, ensure_ascii=False, separators=(",", ":")).encode(), 6)
+
+
+def decode_document(data: bytes, checksum: str, source_path: str) -> CachedDocument:
+    """Inverse of `encode_document`; raises ValueError on anything else."""
+    if not data.startswith(_MAGIC):
+        raise ValueError("not a document cache entry")
+    try:
+        return _decode_body(json.loads(zlib.decompress(data[len(_MAGIC) :])), checksum, source_path)
+    except zlib.error as exc:
+        raise ValueError(f"corrupt document cache entry: {exc}") from exc
+    except KeyError as exc:
+        raise ValueError(f"malformed document cache entry: missing {exc}") from exc
+    except TypeError as exc:
+        raise ValueError(f"malformed document cache entry: {exc}") from exc
+
+
+def _decode_body(body: dict[str, Any], checksum: str, source_path: str) -> CachedDocument:
+    fonts: list[str] = body["fonts"]
+    pages = [
+        PageContent(
+            page_number=page_number,
+            text=text,
+            blocks=[
+                TextBlock(
+                    text=block_text,
+                    page_number=page_number,
+                    x0=x0,
+                    y0=y0,
+                    x1=x1,
+                    y1=y1,
+                    font_size=font_size,
+                    font_name=fonts[font],
+                    is_bold=bool(is_bold),
+                )
+                for block_text, x0, y0, x1, y1, font_size, font, is_bold in blocks
+            ],
+            width=width,
+            height=height,
+        )
+        for page_number, text, width, height, blocks in body["pages"]
+    ]
+    document = DocumentContent(
+        pages=pages,
+        total_pages=body["total_pages"],
+        checksum=checksum,
+        source_path=source_path,
+    )
+    return CachedDocument(kind=body["kind"], document=document)
+
+
+class DocumentCache:
+    """Extracted document text per (source checksum, extraction settings)."""
+
+    def __init__(self, root: str | Path, max_bytes: int = 0) -> None:
+        """Initialize the cache.
+
+        Args:
+            root: Cache directory (``<cache_dir>/documents``).
+            max_bytes: Byte budget for entries; 0 disables eviction.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+
+    def load(self, checksum: str, settings: str, source_path: str) -> CachedDocument | None:
+        """The cached extraction, or None on a miss or an unreadable entry."""
+        path = self._path(checksum, settings)
+        try:
+            cached = decode_document(path.read_bytes(), checksum, source_path)
+        except FileNotFoundError:
+            task_metrics.count("document_cache_misses")
+            return None
+        except ValueError:
+            logger.warning("Discarding unreadable document cache entry", extra={"path": str(path)}, exc_info=True)
+            task_metrics.count("document_cache_misses")
+            return None
+        task_metrics.count("document_cache_hits")
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        logger.info(
+            "Document cache hit",
+            extra={"checksum": checksum, "kind": cached.kind, "pages": len(cached.document.pages)},
+        )
+        return cached
+
+    def store(self, checksum: str, settings: str, kind: DocumentKind, document: DocumentContent) -> None:
+        """Write an entry; failures are logged, never raised (the cache is an optimization)."""
+        path = self._path(checksum, settings)
+        tmp_name: str | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".document-")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(encode_document(kind, document))
+            os.replace(tmp_name, path)
+            tmp_name = None
+            self.evict(keep=path)
+        except OSError:
+            logger.warning("Could not cache extracted document", extra={"path": str(path)}, exc_info=True)
+        finally:
+            if tmp_name is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_name)
+
+    def evict(self, keep: Path | None = None) -> int:
+        """Delete least recently used entries until the cache fits its budget.
+
+        Returns the number of bytes freed.
+        """
+        if self.max_bytes <= 0 or not self.root.exists():
+            return 0
+
+        entries: list[tuple[float, int, Path]] = []
+        total = 0
+        for path in self.root.glob("*/*.sgdc"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        freed = 0
+        for _mtime, size, path in sorted(entries):
+            if total - freed <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            freed += size
+
+        if freed:
+            logger.info(
+                "Evicted cached documents",
+                extra={"freed_bytes": freed, "cache_bytes": total - freed, "max_bytes": self.max_bytes},
+            )
+        return freed
+
+    def _path(self, checksum: str, settings: str) -> Path:
+        return self.root / checksum[:2] / f"{checksum}-{settings[:16]}.sgdc"
@@ -12,26 +12,32 @@ callback applied to every extraction a strategy produces.
 
 from __future__ import annotations
 
+import json
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime
+from functools import partial
 from hashlib import sha256
 from pathlib import Path
 from typing import ClassVar
 
 import httpx
 
+from . import task_metrics
+from .artifact_store import ArtifactStore, StoredArtifact, file_checksum
 from .config import ExtractorConfig
 from .db import ExtractionTask
 from .diacritic_normalizer import cleanup_raga_tala_name
-from .extractor import DocumentContent, PdfExtractor
+from .document_cache import DocumentCache, DocumentKind
+from .extractor import TEXT_EXTRACTOR_VERSION, DocumentContent, PageContent, PdfExtractor
+from .fetch_service import FetchService
 from .heuristics import infer_composer_from_url, is_valid_segment_title
 from .html_extractor import HtmlTextExtractor
 from .metadata_parser import MetadataParser
 from .normalizer import normalize_garbled_diacritics
 from .ocr_fallback import OcrFallback
-from .page_segmenter import PageSegmenter
+from .page_segmenter import KrithiSegment, PageSegmenter
 from .schema import (
     CanonicalExtraction,
     CanonicalLyricSection,
@@ -41,6 +47,8 @@ from .schema import (
     MusicalForm,
 )
 from .structure_parser import StructureParser, StructureParseResult
+from .task_checkpoint import CheckpointStore, TaskCheckpoint
+from .task_splitter import TaskSplitter
 from .transliterator import Transliterator
 
 logger = logging.getLogger(__name__)
@@ -67,6 +75,13 @@ def parse_page_range(value: str | None) -> tuple[int, int] | None:
     return None
 
 
+def format_page_range(start: int, end: int) -> str:
+    """Format a 0-based inclusive range as 1-based ``page_range`` text; inverse of `parse_page_range`."""
+    if start == end:
+        return str(start + 1)
+    return f"{start + 1}-{end + 1}"
+
+
 class ExtractionStrategy(ABC):
     """Base class for format-specific extraction pipelines."""
 
@@ -78,6 +93,10 @@ class ExtractionStrategy(ABC):
         self.config = config
         self._finalize = finalize
         self._http_client: httpx.Client | None = None
+        self.artifact_store = ArtifactStore(config.cache_dir, max_bytes=config.cache_max_bytes)
+        # URLs the last prefetch_sources() just fetched or revalidated; their next
+        # download need not send a conditional GET of its own.
+        self._revalidated: set[str] = set()
 
     @property
     def http_client(self) -> httpx.Client:
@@ -100,8 +119,15 @@ class ExtractionStrategy(ABC):
     def extract(self, task: ExtractionTask) -> list[CanonicalExtraction]:
         """Extract canonical compositions from the task's source document."""
 
+    def plan_shards(self, task: ExtractionTask) -> list[str]:
+        """Page ranges to split the task into, or [] to extract it in one piece.
+
+        Only formats with a page axis can shard; the default never does.
+        """
+        return []
+
     def _download_source(self, url: str) -> Path:
-        """Download a source document to the cache directory, or resolve a local file path."""
+        """Download a source document into the artifact store, or resolve a local file path."""
         # Support local file paths (bare paths and file:// URIs)
         local_path = self._resolve_local_path(url)
         if local_path is not None:
@@ -110,24 +136,43 @@ class ExtractionStrategy(ABC):
             logger.info(f"Using local source file: {local_path}")
             return local_path
 
-        cache_dir = Path(self.config.cache_dir)
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Use URL hash as filename
-        url_hash = sha256(url.encode()).hexdigest()[:16]
         extension = Path(url).suffix or self.default_extension
-        cached_path = cache_dir / f"{url_hash}{extension}"
-
-        if cached_path.exists():
-            logger.debug(f"Using cached artifact: {cached_path}")
-            return cached_path
-
-        logger.info(f"Downloading source: {url}")
-        response = self.http_client.get(url)
-        response.raise_for_status()
-        cached_path.write_bytes(response.content)
-
-        return cached_path
+        revalidate = self.config.cache_revalidate and url not in self._revalidated
+        self._revalidated.discard(url)
+        with task_metrics.stage("download"):
+            return self.artifact_store.fetch(
+                url,
+                self.http_client,
+                extension,
+                revalidate=revalidate,
+            ).path
+
+    def source_artifact(self, url: str) -> StoredArtifact | None:
+        """The stored artifact a downloaded URL resolved to; None for local files or misses."""
+        if self._resolve_local_path(url) is not None:
+            return None
+        return self.artifact_store.lookup(url)
+
+    def prefetch_sources(self, urls: Iterable[str]) -> int:
+        """Download uncached remote sources concurrently into the artifact store.
+
+        Returns how many of them are now cached. Local paths are ignored.
+        """
+        remote = [url for url in urls if self._resolve_local_path(url) is None]
+        if not remote:
+            return 0
+        service = FetchService(
+            self.artifact_store,
+            per_host_limit=self.config.fetch_per_host_limit,
+            host_delay_s=self.config.fetch_host_delay_s,
+            revalidate=self.config.cache_revalidate,
+        )
+        fetched = service.prefetch(remote, self.default_extension)
+        if self.config.cache_revalidate:
+            # Replaced, not extended: a new prefetch only happens once the last
+            # batch has been worked through, and this keeps the set bounded.
+            self._revalidated = set(fetched)
+        return len(fetched)
 
     @staticmethod
     def _resolve_local_path(url: str) -> Path | None:
@@ -260,6 +305,10 @@ class PdfExtractionStrategy(_TextPipelineStrategy):
         structure_parser: StructureParser,
         metadata_parser: MetadataParser,
         transliterator: Transliterator,
+        task_splitter: TaskSplitter | None = None,
+        checkpoints: CheckpointStore | None = None,
+        document_cache: DocumentCache | None = None,
+        reparse: bool = False,
     ) -> None:
         super().__init__(
             config,
@@ -271,104 +320,181 @@ class PdfExtractionStrategy(_TextPipelineStrategy):
         self.pdf_extractor = pdf_extractor
         self.page_segmenter = page_segmenter
         self.ocr_fallback = ocr_fallback
+        self.task_splitter = task_splitter
+        self.checkpoints = checkpoints
+        # Extracted text is written to the document cache after every PyMuPDF or
+        # OCR run; only in reparse mode is it trusted to stand in for them.
+        self.document_cache = document_cache
+        self.reparse = reparse
+
+    def close(self) -> None:
+        """Release the HTTP pool and the OCR engine."""
+        super().close()
+        self.ocr_fallback.close()
+
+    def plan_shards(self, task: ExtractionTask) -> list[str]:
+        """Split whole-document tasks on large PDFs at Krithi-aligned page boundaries.
+
+        Tasks that already carry a page range (including shards themselves) are
+        never split again.
+        """
+        if self.task_splitter is None or task.page_range or task.parent_extraction_id is not None:
+            return []
+        pdf_path = self._download_source(task.source_url)
+        with task_metrics.stage("shard_planning"):
+            shards = self.task_splitter.plan(
+                pdf_path,
+                text_extractable=self.pdf_extractor.is_text_extractable(str(pdf_path)),
+            )
+        return [format_page_range(start, end) for start, end in shards]
 
     def extract(self, task: ExtractionTask) -> list[CanonicalExtraction]:
-        """Extract Krithis from a PDF document."""
+        """Extract Krithis from a PDF document.
+
+        With a checkpoint store, OCR'd pages and finished segments are logged as
+        they are produced and a retry of the task picks up from them. In reparse
+        mode, text cached by an earlier run replaces PyMuPDF/OCR entirely.
+        """
         # Download PDF
         pdf_path = self._download_source(task.source_url)
 
         # Parse page range from task
         page_range = parse_page_range(task.page_range)
 
-        # Check if text is extractable (vs. scanned)
-        use_ocr = not self.pdf_extractor.is_text_extractable(str(pdf_path))
+        checkpoint = self._open_checkpoint(task, pdf_path)
+        try:
+            return self._extract(task, pdf_path, page_range, checkpoint)
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
 
-        if use_ocr:
-            logger.info("PDF requires OCR", extra={"task_id": str(task.id)})
-            return self._extract_ocr(task, pdf_path, page_range)
-
-        # Extract text with PyMuPDF
-        document = self.pdf_extractor.extract_document(str(pdf_path), page_range)
-        if self._should_force_ocr_for_garbled_devanagari(document):
-            logger.info(
-                "Forcing OCR due to garbled Devanagari text",
-                extra={"task_id": str(task.id)},
+    def _extract(
+        self,
+        task: ExtractionTask,
+        pdf_path: Path,
+        page_range: tuple[int, int] | None,
+        checkpoint: TaskCheckpoint | None,
+    ) -> list[CanonicalExtraction]:
+        cached = None
+        if self.reparse and self.document_cache is not None:
+            cached = self.document_cache.load(
+                self._source_checksum(task, pdf_path), self._text_settings_key(task), str(pdf_path)
             )
-            return self._extract_ocr(task, pdf_path, page_range)
+        if cached is not None and cached.kind == "ocr":
+            page_texts = {page.page_number: page.text for page in cached.document.pages}
+            return self._ocr_results(task, pdf_path, page_texts, checkpoint)
+
+        if cached is not None:
+            document = cached.document
+        else:
+            # Check if text is extractable (vs. scanned)
+            with task_metrics.stage("pdf_text"):
+                use_ocr = not self.pdf_extractor.is_text_extractable(str(pdf_path))
+
+            if use_ocr:
+                logger.info("PDF requires OCR", extra={"task_id": str(task.id)})
+                return self._extract_ocr(task, pdf_path, page_range, checkpoint)
+
+            # Extract text with PyMuPDF
+            with task_metrics.stage("pdf_text"):
+                document = self.pdf_extractor.extract_document(str(pdf_path), page_range)
+            if self._should_force_ocr_for_garbled_devanagari(document):
+                logger.info(
+                    "Forcing OCR due to garbled Devanagari text",
+                    extra={"task_id": str(task.id)},
+                )
+                return self._extract_ocr(task, pdf_path, page_range, checkpoint)
+            self._store_document(task, "text", document)
 
         # Segment into individual Krithis
-        segments = self.page_segmenter.segment(document)
+        with task_metrics.stage("segmentation"):
+            segments = self.page_segmenter.segment(document)
+        task_metrics.count("segments", len(segments))
 
         # Process each segment
         results: list[CanonicalExtraction] = []
+        for index, segment in enumerate(segments):
+            extraction = self._checkpointed(
+                checkpoint,
+                f"text:{index}",
+                partial(self._extract_segment, task, segment, document.checksum),
+            )
+            if extraction is not None:
+                results.append(extraction)
+
+        return results
+
+    def _extract_segment(
+        self, task: ExtractionTask, segment: KrithiSegment, checksum: str
+    ) -> CanonicalExtraction | None:
+        """One born-digital Krithi segment, or None if its title is not a valid Krithi title."""
         composer_hint = task.request_payload.get("composerHint", "")
 
-        for segment in segments:
-            # Step 1: Normalize garbled diacritics in the body text
-            normalized_body = normalize_garbled_diacritics(segment.body_text)
+        # Step 1: Normalize garbled diacritics in the body text
+        normalized_body = normalize_garbled_diacritics(segment.body_text)
 
-            # Parse metadata from header (uses normalized text internally if needed)
+        # Parse metadata from header (uses normalized text internally if needed)
+        with task_metrics.stage("metadata_parse"):
             metadata = self.metadata_parser.parse(
                 normalized_body[:500],  # First 500 chars likely contain header
                 title_hint=segment.title_text,
             )
 
-            # Parse lyric structure and metadata boundaries from normalized text.
+        # Parse lyric structure and metadata boundaries from normalized text.
+        with task_metrics.stage("structure_parse"):
             parse_result = self.structure_parser.parse(normalized_body)
             canonical_sections = self.structure_parser.to_canonical_sections(parse_result.sections)
             metadata_boundaries = self.structure_parser.to_canonical_metadata_boundaries(
                 parse_result.metadata_boundaries
             )
             lyric_variants = self._build_lyric_variants(parse_result, normalized_body, default_script="devanagari")
-            primary_script = (
-                lyric_variants[0].script
-                if lyric_variants
-                else (self.transliterator.detect_script(normalized_body) or "devanagari")
-            )
+        primary_script = (
+            lyric_variants[0].script
+            if lyric_variants
+            else (self.transliterator.detect_script(normalized_body) or "devanagari")
+        )
 
-            # Apply name cleanup to raga/tala (defensive — MetadataParser
-            # already normalises, but this ensures clean output even when
-            # metadata comes from other parsers or fallback paths).
-            raga_name = cleanup_raga_tala_name(metadata.raga) if metadata.raga else "Unknown"
-            tala_name = cleanup_raga_tala_name(metadata.tala) if metadata.tala else "Unknown"
-
-            ragas = self._build_ragas(parse_result, raga_name)
-            alternate_title = self._derive_alternate_title(metadata.title, metadata.alternate_title, primary_script)
-
-            # Build canonical extraction
-            extraction = CanonicalExtraction(
-                title=metadata.title,
-                alternate_title=alternate_title,
-                composer=metadata.composer or composer_hint or infer_composer_from_url(task.source_url) or "Unknown",
-                musical_form=MusicalForm.KRITHI,
-                ragas=ragas,
-                tala=tala_name,
-                sections=canonical_sections,
-                lyric_variants=lyric_variants,
-                metadata_boundaries=metadata_boundaries,
-                deity=metadata.deity,
-                temple=metadata.temple,
-                temple_location=metadata.temple_location,
-                source_url=task.source_url,
-                source_name=task.source_name or "unknown",
-                source_tier=task.source_tier or 5,
-                extraction_method=ExtractionMethod.PDF_PYMUPDF,
-                extraction_timestamp=datetime.now(UTC).isoformat(),
-                page_range=segment.page_range_str,
-                checksum=document.checksum,
-            )
+        # Apply name cleanup to raga/tala (defensive — MetadataParser
+        # already normalises, but this ensures clean output even when
+        # metadata comes from other parsers or fallback paths).
+        raga_name = cleanup_raga_tala_name(metadata.raga) if metadata.raga else "Unknown"
+        tala_name = cleanup_raga_tala_name(metadata.tala) if metadata.tala else "Unknown"
 
-            if not is_valid_segment_title(extraction.title):
-                logger.info(
-                    "Skipping invalid segment title: %s",
-                    extraction.title,
-                    extra={"task_id": str(task.id)},
-                )
-                continue
+        ragas = self._build_ragas(parse_result, raga_name)
+        alternate_title = self._derive_alternate_title(metadata.title, metadata.alternate_title, primary_script)
+
+        # Build canonical extraction
+        extraction = CanonicalExtraction(
+            title=metadata.title,
+            alternate_title=alternate_title,
+            composer=metadata.composer or composer_hint or infer_composer_from_url(task.source_url) or "Unknown",
+            musical_form=MusicalForm.KRITHI,
+            ragas=ragas,
+            tala=tala_name,
+            sections=canonical_sections,
+            lyric_variants=lyric_variants,
+            metadata_boundaries=metadata_boundaries,
+            deity=metadata.deity,
+            temple=metadata.temple,
+            temple_location=metadata.temple_location,
+            source_url=task.source_url,
+            source_name=task.source_name or "unknown",
+            source_tier=task.source_tier or 5,
+            extraction_method=ExtractionMethod.PDF_PYMUPDF,
+            extraction_timestamp=datetime.now(UTC).isoformat(),
+            page_range=segment.page_range_str,
+            checksum=checksum,
+        )
 
-            results.append(self._finalize(extraction, normalized_body, "PDF"))
+        if not is_valid_segment_title(extraction.title):
+            logger.info(
+                "Skipping invalid segment title: %s",
+                extraction.title,
+                extra={"task_id": str(task.id)},
+            )
+            return None
 
-        return results
+        return self._finalize(extraction, normalized_body, "PDF")
 
     def _should_force_ocr_for_garbled_devanagari(self, document: DocumentContent) -> bool:
         """Detect broken Devanagari extraction and force OCR fallback."""
@@ -399,15 +525,50 @@ class PdfExtractionStrategy(_TextPipelineStrategy):
         task: ExtractionTask,
         pdf_path: Path,
         page_range: tuple[int, int] | None,
+        checkpoint: TaskCheckpoint | None = None,
     ) -> list[CanonicalExtraction]:
         """Extract from scanned PDF using OCR fallback."""
-        page_texts = self.ocr_fallback.extract_document_text(str(pdf_path), page_range)
+        with task_metrics.stage("ocr"):
+            page_texts = self.ocr_fallback.extract_document_text(
+                str(pdf_path),
+                page_range,
+                completed=checkpoint.pages if checkpoint else None,
+                on_page=checkpoint.record_page if checkpoint else None,
+            )
+        ocr_stats = self.ocr_fallback.last_stats
+        task_metrics.count("ocr_pages", ocr_stats.ocr_pages)
+        task_metrics.count("ocr_pages_skipped", ocr_stats.skipped_blank + ocr_stats.skipped_plate)
+        logger.info(
+            "OCR page summary",
+            extra={"task_id": str(task.id), **ocr_stats.as_log_extra()},
+        )
 
         if not page_texts:
             logger.warning("OCR produced no text", extra={"task_id": str(task.id)})
             return []
 
-        checksum = sha256(pdf_path.read_bytes()).hexdigest()
+        if any(text.strip() for text in page_texts.values()):
+            # All-empty output also comes from a missing OCR stack; never cache that.
+            pages = [PageContent(page_number=n, text=text) for n, text in sorted(page_texts.items())]
+            document = DocumentContent(
+                pages=pages,
+                total_pages=len(pages),
+                checksum=self._source_checksum(task, pdf_path),
+                source_path=str(pdf_path),
+            )
+            self._store_document(task, "ocr", document)
+
+        return self._ocr_results(task, pdf_path, page_texts, checkpoint)
+
+    def _ocr_results(
+        self,
+        task: ExtractionTask,
+        pdf_path: Path,
+        page_texts: dict[int, str],
+        checkpoint: TaskCheckpoint | None,
+    ) -> list[CanonicalExtraction]:
+        """One Krithi per OCR'd page that has text."""
+        checksum = self._source_checksum(task, pdf_path)
         results: list[CanonicalExtraction] = []
 
         for page_num in sorted(page_texts.keys()):
@@ -415,46 +576,108 @@ class PdfExtractionStrategy(_TextPipelineStrategy):
             if not page_text.strip():
                 continue
 
+            extraction = self._checkpointed(
+                checkpoint,
+                f"ocr:{page_num}",
+                partial(self._extract_ocr_page, task, page_num, page_text, checksum),
+            )
+            if extraction is not None:
+                results.append(extraction)
+
+        return results
+
+    def _extract_ocr_page(
+        self, task: ExtractionTask, page_num: int, page_text: str, checksum: str
+    ) -> CanonicalExtraction | None:
+        """One OCR'd page as a Krithi."""
+        with task_metrics.stage("metadata_parse"):
             metadata = self.metadata_parser.parse(page_text[:500])
+        with task_metrics.stage("structure_parse"):
             parse_result = self.structure_parser.parse(page_text)
             canonical_sections = self.structure_parser.to_canonical_sections(parse_result.sections)
             metadata_boundaries = self.structure_parser.to_canonical_metadata_boundaries(
                 parse_result.metadata_boundaries
             )
             lyric_variants = self._build_lyric_variants(parse_result, page_text, default_script="devanagari")
-            primary_script = (
-                lyric_variants[0].script
-                if lyric_variants
-                else (self.transliterator.detect_script(page_text) or "devanagari")
-            )
-            alternate_title = self._derive_alternate_title(metadata.title, metadata.alternate_title, primary_script)
-
-            extraction = CanonicalExtraction(
-                title=metadata.title,
-                alternate_title=alternate_title,
-                composer=metadata.composer
-                or task.request_payload.get("composerHint")
-                or infer_composer_from_url(task.source_url)
-                or "Unknown",
-                musical_form=MusicalForm.KRITHI,
-                ragas=[CanonicalRaga(name=metadata.raga or "Unknown")],
-                tala=metadata.tala or "Unknown",
-                sections=canonical_sections,
-                lyric_variants=lyric_variants,
-                metadata_boundaries=metadata_boundaries,
-                deity=metadata.deity,
-                temple=metadata.temple,
-                source_url=task.source_url,
-                source_name=task.source_name or "unknown",
-                source_tier=task.source_tier or 5,
-                extraction_method=ExtractionMethod.PDF_OCR,
-                extraction_timestamp=datetime.now(UTC).isoformat(),
-                page_range=str(page_num + 1),
-                checksum=checksum,
-            )
-            results.append(self._finalize(extraction, page_text, "PDF"))
+        primary_script = (
+            lyric_variants[0].script
+            if lyric_variants
+            else (self.transliterator.detect_script(page_text) or "devanagari")
+        )
+        alternate_title = self._derive_alternate_title(metadata.title, metadata.alternate_title, primary_script)
 
-        return results
+        extraction = CanonicalExtraction(
+            title=metadata.title,
+            alternate_title=alternate_title,
+            composer=metadata.composer
+            or task.request_payload.get("composerHint")
+            or infer_composer_from_url(task.source_url)
+            or "Unknown",
+            musical_form=MusicalForm.KRITHI,
+            ragas=[CanonicalRaga(name=metadata.raga or "Unknown")],
+            tala=metadata.tala or "Unknown",
+            sections=canonical_sections,
+            lyric_variants=lyric_variants,
+            metadata_boundaries=metadata_boundaries,
+            deity=metadata.deity,
+            temple=metadata.temple,
+            source_url=task.source_url,
+            source_name=task.source_name or "unknown",
+            source_tier=task.source_tier or 5,
+            extraction_method=ExtractionMethod.PDF_OCR,
+            extraction_timestamp=datetime.now(UTC).isoformat(),
+            page_range=str(page_num + 1),
+            checksum=checksum,
+        )
+        return self._finalize(extraction, page_text, "PDF")
+
+    def _source_checksum(self, task: ExtractionTask, pdf_path: Path) -> str:
+        artifact = self.source_artifact(task.source_url)
+        return artifact.checksum if artifact else file_checksum(pdf_path)
+
+    def _text_settings(self, task: ExtractionTask) -> dict[str, object]:
+        """Everything besides the source bytes that shapes the extracted page text."""
+        return {
+            "page_range": task.page_range,
+            "text_extractor_version": TEXT_EXTRACTOR_VERSION,
+            "strip_running_headers": self.pdf_extractor.strip_running_headers,
+            "font_encodings": self.pdf_extractor.font_registry is not None,
+            "ocr_languages": self.ocr_fallback.tesseract_lang_str,
+            "ocr_dpi": self.ocr_fallback.dpi,
+            "ocr_preflight": self.ocr_fallback.preflight,
+        }
+
+    def _text_settings_key(self, task: ExtractionTask) -> str:
+        return sha256(json.dumps(self._text_settings(task), sort_keys=True).encode()).hexdigest()
+
+    def _store_document(self, task: ExtractionTask, kind: DocumentKind, document: DocumentContent) -> None:
+        if self.document_cache is not None:
+            self.document_cache.store(document.checksum, self._text_settings_key(task), kind, document)
+
+    def _open_checkpoint(self, task: ExtractionTask, pdf_path: Path) -> TaskCheckpoint | None:
+        """The task's checkpoint log, valid only for this source and these extraction settings."""
+        if self.checkpoints is None:
+            return None
+        # Unlike the document cache, checkpoints hold parsed segments, so any
+        # worker upgrade invalidates them.
+        settings = {**self._text_settings(task), "extractor_version": self.config.extractor_version}
+        fingerprint = sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+        return self.checkpoints.open(task.id, self._source_checksum(task, pdf_path), fingerprint)
+
+    @staticmethod
+    def _checkpointed(
+        checkpoint: TaskCheckpoint | None,
+        key: str,
+        build: Callable[[], CanonicalExtraction | None],
+    ) -> CanonicalExtraction | None:
+        """Reuse a segment an earlier attempt finished, or build it and log it."""
+        if checkpoint is not None and key in checkpoint.segments:
+            task_metrics.count("checkpoint_segments_reused")
+            return checkpoint.segments[key]
+        extraction = build()
+        if checkpoint is not None:
+            checkpoint.record_segment(key, extraction)
+        return extraction
 
 
 class HtmlExtractionStrategy(_TextPipelineStrategy):
@@ -488,22 +711,27 @@ class HtmlExtractionStrategy(_TextPipelineStrategy):
         html_path = self._download_source(task.source_url)
         html_bytes = html_path.read_bytes()
         html_content = html_bytes.decode("utf-8", errors="ignore")
-        extracted = self.html_extractor.extract(html_content, base_url=task.source_url)
+        with task_metrics.stage("html_text"):
+            extracted = self.html_extractor.extract(html_content, base_url=task.source_url)
 
         if not extracted.text.strip():
             logger.warning("HTML extraction produced no text", extra={"task_id": str(task.id)})
             return []
 
         normalized_body = normalize_garbled_diacritics(extracted.text)
-        metadata = self.metadata_parser.parse(
-            normalized_body[:500],
-            title_hint=extracted.title,
-        )
+        with task_metrics.stage("metadata_parse"):
+            metadata = self.metadata_parser.parse(
+                normalized_body[:500],
+                title_hint=extracted.title,
+            )
 
-        parse_result = self.structure_parser.parse(normalized_body)
-        canonical_sections = self.structure_parser.to_canonical_sections(parse_result.sections)
-        metadata_boundaries = self.structure_parser.to_canonical_metadata_boundaries(parse_result.metadata_boundaries)
-        lyric_variants = self._build_lyric_variants(parse_result, normalized_body, default_script="latin")
+        with task_metrics.stage("structure_parse"):
+            parse_result = self.structure_parser.parse(normalized_body)
+            canonical_sections = self.structure_parser.to_canonical_sections(parse_result.sections)
+            metadata_boundaries = self.structure_parser.to_canonical_metadata_boundaries(
+                parse_result.metadata_boundaries
+            )
+            lyric_variants = self._build_lyric_variants(parse_result, normalized_body, default_script="latin")
 
         raga_hint = task.request_payload.get("ragaHint")
         raga_name = (
@@ -3,23 +3,52 @@
 Primary extraction engine for born-digital PDFs. Extracts full Unicode text
 with font-size and positional data, supporting Devanagari, Tamil, Telugu,
 Kannada, Malayalam, and Latin scripts.
+
+The span walk indexes only the fields `TextBlock` carries; most of the
+per-page cost is MuPDF's own text-page construction. With
+``strip_running_headers`` the extractor also drops running headers and
+footers: lines in the top/bottom band of the page whose text, with digits
+masked, recurs across the extracted range. Neither the segmenter nor the
+structure parser then sees them.
 """
 
 from __future__ import annotations
 
 import hashlib
 import logging
+import re
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import fitz  # PyMuPDF
 
+from .font_encoding import FontEncodingRegistry
 from .velthuis_decoder import VelthuisDecoder
 
 logger = logging.getLogger(__name__)
 
+# Version of the text this module and OCR produce for a page. Bump it when a
+# change alters extracted text, spans or OCR output, so `DocumentCache` entries
+# written by the old code are no longer reused.
+TEXT_EXTRACTOR_VERSION = 2
 
-@dataclass
+# Text flags for the "dict" walk: whitespace kept as-is. TEXT_PRESERVE_IMAGES is
+# absent, so MuPDF returns no image blocks. Adding TEXT_MEDIABOX_CLIP (drop
+# glyphs outside the mediabox) was timed on born-digital PDFs and made no
+# consistent difference, and it would change spans on pages with off-page text.
+TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE
+
+# Running headers/footers: lines within this share of the page height from the
+# top or bottom edge whose digit-masked text recurs on this share of pages.
+RUNNING_BAND_FRACTION = 0.08
+RUNNING_MIN_PAGE_SHARE = 0.5
+RUNNING_MIN_PAGES = 3
+_DIGITS = re.compile(r"\d+")
+
+
+@dataclass(slots=True)
 class TextBlock:
     """A block of text extracted from a PDF page with positional metadata."""
 
@@ -66,8 +95,23 @@ class DocumentContent:
 class PdfExtractor:
     """Extract text and positional data from PDF documents using PyMuPDF."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        strip_running_headers: bool = False,
+        font_registry: FontEncodingRegistry | None = None,
+    ) -> None:
+        """Initialize the extractor.
+
+        Args:
+            strip_running_headers: Drop recurring header and footer lines
+                                   from the blocks and page text.
+            font_registry: Derives glyph maps for the legacy Indic fonts
+                           each document embeds. Velthuis spans use the
+                           built-in dvng10 map either way.
+        """
         self._velthuis_decoder = VelthuisDecoder()
+        self.font_registry = font_registry
+        self.strip_running_headers = strip_running_headers
 
     def extract_document(
         self,
@@ -97,10 +141,19 @@ class PdfExtractor:
             end_page = page_range[1] if page_range else total_pages - 1
             end_page = min(end_page, total_pages - 1)
 
-            for page_num in range(start_page, end_page + 1):
-                page = doc[page_num]
-                page_content = self._extract_page(page, page_num)
-                pages.append(page_content)
+            decoders = (
+                self.font_registry.decoders_for(doc, range(start_page, end_page + 1))
+                if self.font_registry is not None
+                else {}
+            )
+
+            if self.strip_running_headers:
+                pages = self._extract_pages_without_running_headers(doc, start_page, end_page, decoders)
+            else:
+                for page_num in range(start_page, end_page + 1):
+                    page = doc[page_num]
+                    page_content = self._extract_page(page, page_num, decoders)
+                    pages.append(page_content)
 
         logger.info(
             "Extracted PDF",
@@ -118,70 +171,117 @@ class PdfExtractor:
             source_path=str(pdf_path),
         )
 
-    def _extract_page(self, page: fitz.Page, page_number: int) -> PageContent:
-        """Extract text blocks from a single PDF page."""
-        # Get page dimensions
-        rect = page.rect
-        width, height = rect.width, rect.height
-
-        # Extract text with positional data using "dict" mode for font info
-        page_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
-
+    def _extract_page(
+        self,
+        page: fitz.Page,
+        page_number: int,
+        decoders: dict[str, VelthuisDecoder] | None = None,
+    ) -> PageContent:
+        """Extract text blocks from a single PDF page.
+
+        ``decoders`` maps font names to decoders derived for this document's
+        embedded fonts; other Velthuis fonts use the built-in map.
+        """
         blocks: list[TextBlock] = []
-        full_text_parts: list[str] = []
-
-        for block in page_dict.get("blocks", []):
-            if block.get("type") != 0:  # Skip image blocks
-                continue
-
-            for line in block.get("lines", []):
-                line_text_parts: list[str] = []
-
-                for span in line.get("spans", []):
-                    text = span.get("text", "").strip()
-                    if not text:
-                        continue
-
-                    font_size = span.get("size", 0.0)
-                    font_name = span.get("font", "")
-                    # TRACK-060: Use PyMuPDF font flags for bold detection.
-                    # Bit 4 (value 16) = bold in span["flags"].
-                    # Fallback to font name check for compatibility.
-                    font_flags = span.get("flags", 0)
-                    is_bold = bool(font_flags & 16) or "Bold" in font_name or "bold" in font_name
-
-                    # Decode Velthuis Devanagari font spans
-                    if VelthuisDecoder.is_velthuis_font(font_name):
-                        text = self._velthuis_decoder.decode_text(text)
-
-                    bbox = span.get("bbox", (0, 0, 0, 0))
-                    text_block = TextBlock(
-                        text=text,
-                        page_number=page_number,
-                        x0=bbox[0],
-                        y0=bbox[1],
-                        x1=bbox[2],
-                        y1=bbox[3],
-                        font_size=font_size,
-                        font_name=font_name,
-                        is_bold=is_bold,
-                    )
-                    blocks.append(text_block)
-                    line_text_parts.append(text)
-
-                if line_text_parts:
-                    full_text_parts.append(" ".join(line_text_parts))
-
-        full_text = "\n".join(full_text_parts)
+        texts: list[str] = []
+        for text, line_blocks, _bbox in self._iter_lines(page, page_number, decoders or {}):
+            blocks.extend(line_blocks)
+            texts.append(text)
+        return self._page_content(page, page_number, texts, blocks)
 
+    def _extract_pages_without_running_headers(
+        self,
+        doc: fitz.Document,
+        start_page: int,
+        end_page: int,
+        decoders: dict[str, VelthuisDecoder],
+    ) -> list[PageContent]:
+        """Extract a page range minus its running headers and footers."""
+        # Running headers are only known once every page has been read, so
+        # lines are held with their band key until then.
+        held: list[tuple[fitz.Page, int, list[tuple[str, list[TextBlock], str | None]]]] = []
+        for page_num in range(start_page, end_page + 1):
+            page = doc[page_num]
+            top_band = page.rect.height * RUNNING_BAND_FRACTION
+            bottom_band = page.rect.height - top_band
+            lines = [
+                (
+                    text,
+                    line_blocks,
+                    _DIGITS.sub("#", text) if bbox[3] <= top_band or bbox[1] >= bottom_band else None,
+                )
+                for text, line_blocks, bbox in self._iter_lines(page, page_num, decoders)
+            ]
+            held.append((page, page_num, lines))
+
+        running = self._running_keys([[key for *_, key in lines if key is not None] for *_, lines in held])
+        pages = []
+        dropped = 0
+        for page, page_num, lines in held:
+            blocks = []
+            texts = []
+            for text, line_blocks, key in lines:
+                if key is not None and key in running:
+                    dropped += 1
+                    continue
+                blocks.extend(line_blocks)
+                texts.append(text)
+            pages.append(self._page_content(page, page_num, texts, blocks))
+        if running:
+            logger.info("Dropped running headers/footers", extra={"patterns": len(running), "lines": dropped})
+        return pages
+
+    @staticmethod
+    def _page_content(page: fitz.Page, page_num: int, texts: list[str], blocks: list[TextBlock]) -> PageContent:
+        rect = page.rect
         return PageContent(
-            page_number=page_number,
-            text=full_text,
+            page_number=page_num,
+            text="\n".join(texts),
             blocks=blocks,
-            width=width,
-            height=height,
+            width=rect.width,
+            height=rect.height,
         )
 
+    def _iter_lines(
+        self, page: fitz.Page, page_number: int, decoders: dict[str, VelthuisDecoder]
+    ) -> Iterator[tuple[str, list[TextBlock], tuple[float, float, float, float]]]:
+        """Yield (line text, span blocks, line bbox) for each line with text."""
+        velthuis_decoder = self._velthuis_decoder
+        is_velthuis = VelthuisDecoder.is_velthuis_font
+        for block in page.get_text("dict", flags=TEXT_FLAGS)["blocks"]:
+            if block["type"] != 0:  # Skip image blocks
+                continue
+            for line in block["lines"]:
+                line_blocks: list[TextBlock] = []
+                for span in line["spans"]:
+                    text = span["text"].strip()
+                    if not text:
+                        continue
+                    font_name = span["font"]
+                    # TRACK-060: bold from font flags (bit 4), falling back to the name.
+                    is_bold = bool(span["flags"] & 16) or "Bold" in font_name or "bold" in font_name
+                    # Decode legacy-font spans (registry-derived glyph maps, then Velthuis Devanagari)
+                    decoder = decoders.get(font_name)
+                    if decoder is not None:
+                        text = decoder.decode_text(text)
+                    elif is_velthuis(font_name):
+                        text = velthuis_decoder.decode_text(text)
+                    x0, y0, x1, y1 = span["bbox"]
+                    line_blocks.append(TextBlock(text, page_number, x0, y0, x1, y1, span["size"], font_name, is_bold))
+                if line_blocks:
+                    yield " ".join(block.text for block in line_blocks), line_blocks, line["bbox"]
+
+    @staticmethod
+    def _running_keys(pages: list[list[str]]) -> set[str]:
+        """Digit-masked band lines that recur on enough pages to be running headers/footers."""
+        if len(pages) < RUNNING_MIN_PAGES:
+            return set()
+        seen: Counter[str] = Counter()
+        for keys in pages:
+            seen.update(set(keys))
+        needed = max(RUNNING_MIN_PAGES, len(pages) * RUNNING_MIN_PAGE_SHARE)
+        return {key for key, count in seen.items() if count >= needed}
+
     def _compute_checksum(self, file_path: Path) -> str:
         """Compute SHA-256 checksum of a file."""
         sha256 = hashlib.sha256()
@@ -0,0 +1,261 @@
+"""Per-font glyph maps derived from embedded Type 1 encoding vectors.
+
+Legacy TeX fonts (Velthuis-dvng*, and other Indic Type 1 fonts) embed no
+/ToUnicode CMap, and their glyph names are not in the Adobe Glyph List, so
+MuPDF hands back the raw glyph codes. `VelthuisDecoder` maps those codes with
+a table written for Velthuis-dvng10; sibling fonts (dvngi10, dvng8, bold cuts)
+may place glyphs at other codes.
+
+`FontEncodingRegistry` reads the ``dup <code> /<name> put`` encoding vector
+from the embedded font program the first time a font is seen and resolves
+each glyph name to Unicode:
+
+- Velthuis glyph names (``halfna``, ``ksa``, ``sh_v``...), AGL names for
+  digits and punctuation, and ``uniXXXX``/``uXXXX`` names.
+
+Velthuis fonts keep the dvng10 map: their derived names are only checked
+against it, and codes that disagree are logged, until the corpus shows which
+of the two is right. Other fonts are taken on when they lack /ToUnicode and
+at least one glyph name resolves to an Indic code point. Results are kept in memory
+and on disk as ``<cache_dir>/<font>-<sha[:16]>.json``, keyed by font name plus
+the SHA-256 of the raw font stream, so later documents embedding the same
+font reuse the map without decompressing or parsing the program again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+from collections.abc import Callable, Iterable
+from hashlib import sha256
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from .velthuis_decoder import _GLYPH_MAP, VelthuisDecoder
+
+logger = logging.getLogger(__name__)
+
+# The encoding vector sits in the cleartext head of a Type 1 program.
+_ENCODING_HEAD_BYTES = 5000
+_ENCODING_ENTRY = re.compile(r"dup\s+(\d+)\s+/(\S+)\s+put")
+_UNI_NAME = re.compile(r"uni([0-9A-F]{4})|u([0-9A-F]{4,6})")
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]")
+_INDIC_RANGE = range(0x0900, 0x0E00)
+# Bumped when derivation changes, so maps cached by older code are derived again.
+_MAP_VERSION = 2
+
+# Velthuis-dvng glyph names for half forms and conjunct ligatures.
+_VELTHUIS_GLYPH_NAMES: dict[str, str] = {
+    "halfna": "न्",
+    "halfna2": "न्",
+    "halfnna": "ण्",
+    "halfsha": "श्",
+    "halfma": "म्",
+    "halfya": "य्",
+    "halfra": "र्",
+    "halfla": "ल्",
+    "halfta": "त्",
+    "halfda": "द्",
+    "halfka": "क्",
+    "halfga": "ग्",
+    "halfpa": "प्",
+    "halfba": "ब्",
+    "halfva": "व्",
+    "halfca": "च्",
+    "halfja": "ज्",
+    "halfsa": "स्",
+    "halfha": "ह्",
+    "halfssa": "ष्",
+    "ksa": "क्ष",
+    "sh_v": "श्व",
+    "sh_r": "श्र",
+    "l_l": "ल्ल",
+    "ss_tt": "ष्ट",
+    "j_ny": "ज्ञ",
+    "t_t": "त्त",
+    "t_r": "त्र",
+    "d_d": "द्द",
+    "d_dh": "द्ध",
+    "d_v": "द्व",
+    "d_y": "द्य",
+    "h_n": "ह्न",
+    "h_m": "ह्म",
+    "h_y": "ह्य",
+    "h_r": "ह्र",
+    "h_l": "ह्ल",
+    "h_v": "ह्व",
+    "n_n": "न्न",
+    "n_d": "न्द",
+    "n_dh": "न्ध",
+}
+
+# Adobe Glyph List names for the digits and punctuation these fonts carry.
+_AGL_NAMES: dict[str, str] = {
+    "space": " ",
+    "parenleft": "(",
+    "parenright": ")",
+    "colon": ":",
+    "period": ".",
+    "zero": "0",
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+}
+
+
+def parse_encoding_vector(program: bytes) -> dict[int, str] | None:
+    """Glyph code → glyph name from a Type 1 program's encoding vector."""
+    head = program[:_ENCODING_HEAD_BYTES].decode("latin-1")
+    entries = _ENCODING_ENTRY.findall(head)
+    return {int(code): name for code, name in entries} if entries else None
+
+
+def glyph_name_to_unicode(name: str) -> str | None:
+    """Unicode text for a glyph name, or None when the name is unknown."""
+    if name in _VELTHUIS_GLYPH_NAMES:
+        return _VELTHUIS_GLYPH_NAMES[name]
+    if name in _AGL_NAMES:
+        return _AGL_NAMES[name]
+    match = _UNI_NAME.fullmatch(name)
+    if match:
+        return chr(int(match.group(1) or match.group(2), 16))
+    return None
+
+
+def derive_glyph_map(font_name: str, encoding: dict[int, str]) -> dict[int, str] | None:
+    """Glyph code → Unicode for one font, or None when the font is not decodable.
+
+    Velthuis fonts always return None, so their spans keep the built-in dvng10
+    decoding; the derived names are only compared with it.
+    """
+    resolved = {code: text for code, name in encoding.items() if (text := glyph_name_to_unicode(name)) is not None}
+    if VelthuisDecoder.is_velthuis_font(font_name):
+        disagreements = [code for code, text in resolved.items() if code in _GLYPH_MAP and _GLYPH_MAP[code] != text]
+        if disagreements:
+            logger.info(
+                "Font encoding differs from the Velthuis-dvng10 map",
+                extra={"font": font_name, "codes": sorted(disagreements)},
+            )
+        return None
+    if not any(ord(ch) in _INDIC_RANGE for text in resolved.values() for ch in text):
+        return None
+    return resolved
+
+
+class FontEncodingRegistry:
+    """Glyph maps (and their decoders) per embedded font, cached in memory and on disk."""
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._maps: dict[tuple[str, str], dict[int, str] | None] = {}
+        self._decoders: dict[tuple[str, str], VelthuisDecoder] = {}
+
+    def decoders_for(self, doc: fitz.Document, page_numbers: Iterable[int]) -> dict[str, VelthuisDecoder]:
+        """Decoders for the fonts used on ``page_numbers``, keyed by span font name."""
+        decoders: dict[str, VelthuisDecoder] = {}
+        seen: set[int] = set()
+        for page_number in page_numbers:
+            for xref, _ext, font_type, basefont, *_ in doc.get_page_fonts(page_number):
+                if xref in seen:
+                    continue
+                seen.add(xref)
+                font_name = basefont.partition("+")[2] or basefont
+                if font_name in decoders or not font_type.startswith("Type1"):
+                    continue
+                decoder = self._decoder_for_font(doc, xref, font_name)
+                if decoder is not None:
+                    decoders[font_name] = decoder
+        return decoders
+
+    def _decoder_for_font(self, doc: fitz.Document, font_xref: int, font_name: str) -> VelthuisDecoder | None:
+        velthuis = VelthuisDecoder.is_velthuis_font(font_name)
+        if not velthuis and doc.xref_get_key(font_xref, "ToUnicode")[0] != "null":
+            return None
+        stream_xref = self._font_file_xref(doc, font_xref)
+        if stream_xref is None:
+            return None
+        key = (font_name, sha256(doc.xref_stream_raw(stream_xref)).hexdigest())
+        if key in self._decoders:
+            return self._decoders[key]
+        glyph_map = self.glyph_map(key, lambda: doc.xref_stream(stream_xref))
+        if glyph_map is None:
+            return None
+        decoder = self._decoders[key] = VelthuisDecoder(glyph_map=glyph_map)
+        return decoder
+
+    def glyph_map(self, key: tuple[str, str], load_program: Callable[[], bytes]) -> dict[int, str] | None:
+        """Glyph map for (font name, stream SHA-256); the program is loaded only on a miss."""
+        if key in self._maps:
+            return self._maps[key]
+        glyph_map = self._read_cached(key)
+        if glyph_map is None:
+            encoding = parse_encoding_vector(load_program())
+            glyph_map = derive_glyph_map(key[0], encoding) if encoding else None
+            self._write_cached(key, glyph_map)
+            logger.info(
+                "Derived font glyph map",
+                extra={"font": key[0], "codes": len(glyph_map) if glyph_map else 0},
+            )
+        else:
+            glyph_map = glyph_map or None
+        self._maps[key] = glyph_map
+        return glyph_map
+
+    @staticmethod
+    def _font_file_xref(doc: fitz.Document, font_xref: int) -> int | None:
+        kind, value = doc.xref_get_key(font_xref, "FontDescriptor")
+        if kind != "xref":
+            return None
+        descriptor = int(value.split()[0])
+        for key in ("FontFile", "FontFile3"):
+            kind, value = doc.xref_get_key(descriptor, key)
+            if kind == "xref":
+                return int(value.split()[0])
+        return None
+
+    def _cache_path(self, key: tuple[str, str]) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        font_name, digest = key
+        return self.cache_dir / f"{_SAFE_NAME.sub('_', font_name)}-{digest[:16]}.json"
+
+    def _read_cached(self, key: tuple[str, str]) -> dict[int, str] | None:
+        """The cached map; an empty dict records a font known not to be decodable."""
+        path = self._cache_path(key)
+        if path is None:
+            return None
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError:
+            logger.warning("Discarding corrupt font glyph map", extra={"path": str(path)})
+            return None
+        if record.get("font") != key[0] or record.get("sha256") != key[1] or record.get("version") != _MAP_VERSION:
+            return None
+        stored = record.get("glyph_map") or {}
+        return {int(code): text for code, text in stored.items()}
+
+    def _write_cached(self, key: tuple[str, str], glyph_map: dict[int, str] | None) -> None:
+        path = self._cache_path(key)
+        if path is None:
+            return
+        record = {"font": key[0], "sha256": key[1], "version": _MAP_VERSION, "glyph_map": glyph_map}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".glyph-map-")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(record, tmp_file, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except OSError:
+            logger.warning("Could not cache font glyph map", extra={"path": str(path)}, exc_info=True)
@@ -22,6 +22,7 @@ from typing import Any, Protocol
 
 from pydantic import BaseModel, Field
 
+from . import task_metrics
 from .diacritic_normalizer import cleanup_raga_tala_name
 from .schema import (
     CanonicalExtraction,
@@ -140,11 +141,13 @@ class GeminiMetadataEnricher:
         max_retries = 5
         for attempt in range(max_retries + 1):
             try:
+                task_metrics.count("gemini_calls")
                 response = self._client.generate_content(prompt)
                 suggestion = self._parse_response(response)
                 break
             except Exception as exc:
                 if self._is_rate_limit(exc):
+                    task_metrics.count("gemini_rate_limited")
                     if attempt < max_retries:
                         delay = 2 * (2**attempt) + random.uniform(0, 1)
                         logger.warning(
@@ -153,6 +156,7 @@ class GeminiMetadataEnricher:
                             attempt + 1,
                             max_retries,
                         )
+                        task_metrics.count("gemini_retries")
                         time.sleep(delay)
                         continue
                     else:
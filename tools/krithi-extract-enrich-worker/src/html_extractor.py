@@ -4,16 +4,53 @@ This mirrors the Kotlin HtmlTextExtractor behavior:
 1. Remove boilerplate nodes (script/style/nav/footer/etc.)
 2. Prefer known content selectors (post-body/article/post-content)
 3. Preserve lightweight structure (paragraph breaks + links)
+
+Two parser backends produce the same text. ``html.parser`` (via BeautifulSoup)
+is the reference. Pages whose content selector matches are parsed and walked
+natively with lxml instead, which is several times faster on heavy Blogger
+pages. Anything the fast path does not handle (no selector match, a selector
+that is not ``tag`` or ``tag.class``, a parse failure) takes the
+``html.parser`` path.
+
+The parsers repair broken markup differently: libxml2 closes an open ``<p>``
+when a block such as ``<div>`` starts inside it, while html.parser keeps the
+literal nesting, so the same page can walk to different text. Before trusting
+the lxml result, the fast path replays the stdlib tokenizer with
+BeautifulSoup's nesting rules, rebuilds only the content region that way and
+walks it too; if the text differs the page takes the reference path. Repairs
+that do not change the text (libxml2 closing an unclosed ``<li>``) keep the
+fast path.
+tests/test_html_backend_equivalence.py pins the two backends to identical
+output on the HTML fixtures and on mis-nested markup.
 """
 
 from __future__ import annotations
 
 import re
+from collections import Counter
 from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Literal
 from urllib.parse import urljoin
 
+import lxml.html
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
+from lxml import etree
+
+HtmlBackend = Literal["auto", "lxml", "html.parser"]
+
+_BOILERPLATE_TAGS = ("script", "style", "nav", "footer", "header", "form", "aside", "noscript")
+_SIMPLE_SELECTOR = re.compile(r"^([a-z][a-z0-9]*)(?:\.([\w-]+))?$")
+# bs4's HTMLTreeBuilder.empty_element_tags: closed as soon as they open.
+_ELEMENT_NAME = re.compile(r"^[a-z][a-z0-9]*$")
+_VOID_TAGS = frozenset(
+    {
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem",
+        "meta", "param", "source", "track", "wbr", "basefont", "bgsound", "command", "frame",
+        "image", "isindex", "nextid", "spacer",
+    }
+)  # fmt: skip
 
 
 @dataclass
@@ -31,7 +68,16 @@ class HtmlTextExtractor:
         self,
         max_chars: int = 120_000,
         selectors: list[str] | None = None,
+        backend: HtmlBackend = "auto",
     ) -> None:
+        """Initialize the extractor.
+
+        Args:
+            max_chars: Extracted text is truncated to this many characters.
+            selectors: Content selectors, tried in order.
+            backend: ``auto`` and ``lxml`` take the fast path where it applies,
+                     ``html.parser`` forces the reference path.
+        """
         self.max_chars = max_chars
         self.selectors = selectors or [
             "div.post-body",
@@ -51,12 +97,23 @@ class HtmlTextExtractor:
             "pre",
             "blockquote",
         }
+        # XPath for each selector, or None when a selector is beyond the fast path.
+        self._selector_xpaths = self._compile_selectors(self.selectors)
+        self.use_lxml = backend != "html.parser" and self._selector_xpaths is not None
 
     def extract(self, html: str, base_url: str | None = None) -> ExtractedHtmlContent:
         """Extract content text and title from an HTML document."""
+        if self.use_lxml:
+            fast = self._extract_lxml(html, base_url)
+            if fast is not None:
+                return fast
+        return self._extract_soup(html, base_url)
+
+    def _extract_soup(self, html: str, base_url: str | None) -> ExtractedHtmlContent:
+        """Reference path: BeautifulSoup over the stdlib ``html.parser``."""
         soup = BeautifulSoup(html, "html.parser")
 
-        for node in soup.select("script, style, nav, footer, header, form, aside, noscript"):
+        for node in soup.select(", ".join(_BOILERPLATE_TAGS)):
             node.decompose()
 
         # TRACK-097: Strip navigation tables from Carnatic music blog pages.
@@ -78,30 +135,17 @@ class HtmlTextExtractor:
                 title = title_text
 
         raw_text = self._extract_structured_text(main_element, base_url=base_url)
+        return self._finish(raw_text, title)
+
+    def _finish(self, raw_text: str, title: str | None) -> ExtractedHtmlContent:
         cleaned = self._normalize_text(raw_text)
         trimmed = cleaned[: self.max_chars] if len(cleaned) > self.max_chars else cleaned
-
         return ExtractedHtmlContent(text=trimmed, title=title)
 
     def _extract_structured_text(self, root: Tag, base_url: str | None = None) -> str:
-        chunks: list[str] = []
-
-        def last_char() -> str | None:
-            if not chunks:
-                return None
-            return chunks[-1][-1] if chunks[-1] else None
-
-        def append_newline() -> None:
-            if chunks and last_char() != "\n":
-                chunks.append("\n")
-
-        def append_text(text: str) -> None:
-            normalized = text.strip()
-            if not normalized:
-                return
-            if chunks and last_char() not in {"\n", " "}:
-                chunks.append(" ")
-            chunks.append(normalized)
+        out = _TextBuilder()
+        append_newline = out.append_newline
+        append_text = out.append_text
 
         def walk(node: Tag | NavigableString) -> None:
             if isinstance(node, NavigableString):
@@ -119,28 +163,13 @@ class HtmlTextExtractor:
             if tag == "br":
                 append_newline()
             elif tag == "a":
-                link_text = node.get_text(" ", strip=True)
-                # TRACK-097: Skip navigation/boilerplate links that
-                # produce false metadata boundaries (e.g. "Meaning of Kriti-1")
-                if link_text and self._is_navigation_link(link_text):
-                    pass  # silently drop
-                elif link_text:
-                    href_attr = node.get("href")
-                    href = (href_attr if isinstance(href_attr, str) else "").strip()
-                    # TRACK-097: For inline links within lyrics (e.g. variation
-                    # references like <a href="#V1">mAyUra nAtha</a>), output
-                    # only the link text — the URL is noise in lyric content.
-                    # Only include URL for truly external links.
-                    is_fragment = href.startswith("#")
-                    is_same_page = href.startswith(base_url or "") if base_url else False
-                    if is_fragment or is_same_page:
-                        append_text(link_text)
-                    else:
-                        absolute = urljoin(base_url, href) if href and base_url else href
-                        if absolute:
-                            append_text(f"{link_text} ({absolute})")
-                        else:
-                            append_text(link_text)
+                href_attr = node.get("href")
+                self._append_link(
+                    out,
+                    node.get_text(" ", strip=True),
+                    href_attr if isinstance(href_attr, str) else "",
+                    base_url,
+                )
             else:
                 for child in node.children:
                     if isinstance(child, Tag | NavigableString):
@@ -150,7 +179,169 @@ class HtmlTextExtractor:
                 append_newline()
 
         walk(root)
-        return "".join(chunks)
+        return out.text()
+
+    def _append_link(self, out: _TextBuilder, link_text: str, href: str, base_url: str | None) -> None:
+        # TRACK-097: Skip navigation/boilerplate links that
+        # produce false metadata boundaries (e.g. "Meaning of Kriti-1")
+        if not link_text or self._is_navigation_link(link_text):
+            return
+        href = href.strip()
+        # TRACK-097: For inline links within lyrics (e.g. variation
+        # references like <a href="#V1">mAyUra nAtha</a>), output
+        # only the link text — the URL is noise in lyric content.
+        # Only include URL for truly external links.
+        is_fragment = href.startswith("#")
+        is_same_page = href.startswith(base_url or "") if base_url else False
+        if is_fragment or is_same_page:
+            out.append_text(link_text)
+            return
+        absolute = urljoin(base_url, href) if href and base_url else href
+        if absolute:
+            out.append_text(f"{link_text} ({absolute})")
+        else:
+            out.append_text(link_text)
+
+    # ─── Fast path: native lxml tree ──────────────────────────────────────
+    @staticmethod
+    def _compile_selectors(selectors: list[str]) -> list[str] | None:
+        """XPath equivalents of ``tag``/``tag.class`` selectors; None if any is more complex."""
+        xpaths: list[str] = []
+        for selector in selectors:
+            match = _SIMPLE_SELECTOR.match(selector)
+            if match is None:
+                return None
+            tag, css_class = match.groups()
+            if css_class:
+                xpaths.append(f"(//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')])[1]")
+            else:
+                xpaths.append(f"(//{tag})[1]")
+        return xpaths
+
+    def _extract_lxml(self, html: str, base_url: str | None) -> ExtractedHtmlContent | None:
+        """Same extraction as `_extract_soup` over an lxml tree; None to defer to it.
+
+        Only pages where a content selector matches are handled here: without
+        one, the reference path walks the whole soup, whose shape (implied
+        ``<body>``, stray head content) differs between parsers. The
+        result is checked against html.parser's nesting of the same region
+        (`_matches_reference_nesting`), since the parsers repair broken markup
+        differently.
+        """
+        try:
+            root = lxml.html.document_fromstring(html)
+        except etree.ParserError:
+            # Empty or whitespace-only document.
+            return None
+        except ValueError:
+            # str input carrying an XML encoding declaration.
+            return None
+
+        for element in list(root.iter(*_BOILERPLATE_TAGS)):
+            _lxml_decompose(element)
+        self._strip_navigation_tables_lxml(root)
+
+        main_element = None
+        examined = []
+        for xpath in self._selector_xpaths or []:
+            for candidate in root.xpath(xpath):
+                examined.append(candidate)
+                if _lxml_text(candidate):
+                    main_element = candidate
+                break
+            if main_element is not None:
+                break
+        if main_element is None:
+            return None
+
+        title = None
+        title_element = next(root.iter("title"), None)
+        if title_element is not None:
+            title = _lxml_text(title_element) or None
+
+        out = _TextBuilder()
+        self._walk_lxml(main_element, out, base_url)
+        raw_text = out.text()
+        if not self._matches_reference_nesting(html, examined, raw_text, base_url):
+            return None
+        return self._finish(raw_text, title)
+
+    def _matches_reference_nesting(self, html: str, examined: list[Any], raw_text: str, base_url: str | None) -> bool:
+        """Whether html.parser's nesting of the examined candidates yields the same selection and text.
+
+        `examined` are the candidates the selection looked at, the last one
+        chosen. They sit in a tree already stripped by `_lxml_decompose`, which
+        swaps nodes for placeholders one for one, so each one's child-index path
+        leads to its twin in a fresh parse, and the twin's start-tag ordinal
+        picks the same element out of `_ReferenceNesting`. Each rebuilt region is
+        stripped and walked like the fast path: earlier candidates must still be
+        empty and the chosen one must produce `raw_text`.
+        """
+        pristine = lxml.html.document_fromstring(html)
+        keys = []
+        for element in examined:
+            path = []
+            node = element
+            while (parent := node.getparent()) is not None:
+                path.append(parent.index(node))
+                node = parent
+            twin = pristine
+            for index in reversed(path):
+                twin = twin[index]
+            keys.append((element.tag, next(i for i, el in enumerate(pristine.iter(element.tag)) if el is twin)))
+
+        targets: dict[str, set[int]] = {}
+        for tag, ordinal in keys:
+            targets.setdefault(tag, set()).add(ordinal)
+        scan = _ReferenceNesting(targets)
+        try:
+            scan.feed(html)
+            scan.close()
+        except _NestingScanDone:
+            pass
+        except ValueError:
+            # Names, text or comments lxml refuses (control characters, "--").
+            return False
+
+        if any(key not in scan.regions for key in keys):
+            return False
+        regions = [scan.regions[key] for key in keys]
+        for region in regions:
+            for element in list(region.iter(*_BOILERPLATE_TAGS)):
+                _lxml_decompose(element)
+            self._strip_navigation_tables_lxml(region)
+        *rejected, chosen = regions
+        if any(_lxml_text(region) for region in rejected):
+            return False
+        out = _TextBuilder()
+        self._walk_lxml(chosen, out, base_url)
+        return out.text() == raw_text
+
+    def _walk_lxml(self, node: Any, out: _TextBuilder, base_url: str | None) -> None:
+        """Mirror of the soup `walk`: element text, children, then each child's tail."""
+        tag = node.tag
+        is_block = tag in self._block_tags
+        if is_block:
+            out.append_newline()
+
+        if tag == "br":
+            out.append_newline()
+        elif tag == "a":
+            self._append_link(out, " ".join(_lxml_strings(node)), node.get("href") or "", base_url)
+        else:
+            if node.text:
+                out.append_text(node.text)
+            for child in node:
+                if isinstance(child.tag, str):
+                    self._walk_lxml(child, out, base_url)
+                elif child.tag is etree.Comment and child.text:
+                    # html.parser yields comments as strings, and `walk` keeps them.
+                    out.append_text(child.text)
+                if child.tail:
+                    out.append_text(child.tail)
+
+        if is_block:
+            out.append_newline()
 
     # ─── TRACK-097: Navigation / boilerplate link patterns ────────────────
     _NAV_LINK_PATTERN = re.compile(
@@ -188,6 +379,9 @@ class HtmlTextExtractor:
         known language labels or the table id matches a language label.
         """
         for table in soup.find_all("table"):
+            if table.decomposed:
+                # Nested inside a navigation table removed earlier in this loop.
+                continue
             # Fast path: table id matches a language label (guru-guha pattern)
             table_id_attr = table.get("id")
             table_id = (table_id_attr if isinstance(table_id_attr, str) else "").strip().lower()
@@ -203,9 +397,163 @@ class HtmlTextExtractor:
             if len(cells) > 0 and nav_count / len(cells) >= 0.5:
                 table.decompose()
 
+    def _strip_navigation_tables_lxml(self, root: Any) -> None:
+        """`_strip_navigation_tables` over an lxml tree."""
+        for table in list(root.iter("table")):
+            table_id = (table.get("id") or "").strip().lower()
+            if table_id in self._LANGUAGE_NAV_LABELS:
+                _lxml_decompose(table)
+                continue
+
+            cells = list(table.iter("td"))
+            if not cells:
+                continue
+            nav_count = sum(1 for cell in cells if _lxml_text(cell).lower() in self._LANGUAGE_NAV_LABELS)
+            if nav_count / len(cells) >= 0.5:
+                _lxml_decompose(table)
+
     def _is_navigation_link(self, link_text: str) -> bool:
         """Return True if a link's text is navigation boilerplate, not lyric content."""
         return bool(self._NAV_LINK_PATTERN.match(link_text.strip()))
 
     def _normalize_text(self, raw: str) -> str:
         return re.sub(r"\n\s*\n+", "\n\n", re.sub(r" +", " ", re.sub(r"[\t\u000B\u000C\r]+", " ", raw))).strip()
+
+
+class _TextBuilder:
+    """Accumulates walked text, collapsing separators the way both walkers need."""
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+
+    def _last_char(self) -> str | None:
+        if not self._chunks:
+            return None
+        return self._chunks[-1][-1] if self._chunks[-1] else None
+
+    def append_newline(self) -> None:
+        if self._chunks and self._last_char() != "\n":
+            self._chunks.append("\n")
+
+    def append_text(self, text: str) -> None:
+        normalized = text.strip()
+        if not normalized:
+            return
+        if self._chunks and self._last_char() not in {"\n", " "}:
+            self._chunks.append(" ")
+        self._chunks.append(normalized)
+
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+
+class _ReferenceNesting(HTMLParser):
+    """Rebuilds chosen elements as BeautifulSoup's html.parser builder nests them.
+
+    Replays the stdlib tokenizer with bs4's tree-building rules: an end tag
+    closes the nearest open element of that name, and everything opened inside
+    it, or is ignored when none is open; void elements close as they open,
+    swallowing one later stray end tag of the same name. Only the `targets`
+    (tag name -> start-tag ordinals) are built, as detached lxml trees in
+    `regions`, keeping just what the extraction reads: tags, text, comments,
+    ``id`` and ``href``. Raises ValueError on content lxml cannot hold.
+    """
+
+    def __init__(self, targets: dict[str, set[int]]) -> None:
+        super().__init__(convert_charrefs=True)
+        self.regions: dict[tuple[str, int], Any] = {}
+        self._targets = targets
+        self._pending = sum(len(ordinals) for ordinals in targets.values())
+        self._seen: Counter[str] = Counter()
+        self._stack: list[str] = []
+        self._open: Counter[str] = Counter()
+        self._already_closed: list[str] = []
+        # Per region still open: its root's depth in `_stack` and its open elements.
+        self._building: list[tuple[int, list[Any]]] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._push(tag, attrs)
+        if tag in _VOID_TAGS:
+            self._pop_to(tag)
+            self._already_closed.append(tag)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._push(tag, attrs)
+        self._pop_to(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._already_closed:
+            self._already_closed.remove(tag)
+        else:
+            self._pop_to(tag)
+
+    def handle_data(self, data: str) -> None:
+        for _, elements in self._building:
+            parent = elements[-1]
+            if len(parent):
+                parent[-1].tail = (parent[-1].tail or "") + data
+            else:
+                parent.text = (parent.text or "") + data
+
+    def handle_comment(self, data: str) -> None:
+        for _, elements in self._building:
+            elements[-1].append(etree.Comment(data))
+
+    def _push(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        name = tag if _ELEMENT_NAME.match(tag) else "span"
+        kept = {key: value or "" for key, value in attrs if key in ("id", "href")}
+        for _, elements in self._building:
+            elements.append(etree.SubElement(elements[-1], name, kept))
+        ordinal = self._seen[tag]
+        self._seen[tag] += 1
+        if ordinal in self._targets.get(tag, ()):
+            root = etree.Element(name, kept)
+            self.regions[(tag, ordinal)] = root
+            self._building.append((len(self._stack), [root]))
+            self._pending -= 1
+        self._stack.append(tag)
+        self._open[tag] += 1
+
+    def _pop_to(self, tag: str) -> None:
+        if not self._open[tag]:
+            return
+        while self._stack:
+            popped = self._stack.pop()
+            self._open[popped] -= 1
+            for base, elements in self._building:
+                if len(self._stack) >= base:
+                    elements.pop()
+            self._building = [region for region in self._building if region[1]]
+            if popped == tag:
+                break
+        if not self._pending and not self._building:
+            raise _NestingScanDone
+
+
+class _NestingScanDone(Exception):
+    """Every target element has been closed; the rest of the page is irrelevant."""
+
+
+def _lxml_decompose(element: Any) -> None:
+    """Remove an element the way bs4 ``decompose`` does.
+
+    lxml's ``drop_tree`` merges the element's tail into the preceding text,
+    whereas bs4 leaves the strings on either side separate, and the walk joins
+    separate strings with a space. An empty comment keeps the tail detached.
+    """
+    parent = element.getparent()
+    if parent is None:
+        return
+    placeholder = etree.Comment("")
+    placeholder.tail = element.tail
+    parent.replace(element, placeholder)
+
+
+def _lxml_strings(element: Any) -> list[str]:
+    """Stripped, non-empty text pieces under an element (comments excluded), like bs4 `stripped_strings`."""
+    return [piece for text in element.itertext() if (piece := text.strip())]
+
+
+def _lxml_text(element: Any) -> str:
+    """bs4 ``get_text(strip=True)`` for an lxml element."""
+    return "".join(_lxml_strings(element))
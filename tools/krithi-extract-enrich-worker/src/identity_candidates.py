@@ -12,6 +12,7 @@ import unicodedata
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import Any
 
 from .heuristics.transliteration_collapse import IDENTITY_COLLAPSE_RULES, apply_collapse
@@ -40,8 +41,32 @@ def _strip_diacritics(value: str) -> str:
     return "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
 
 
+# Distinct identity keys kept: every reference composer/raga name and alias is
+# re-keyed on each discovery, so this must hold the whole reference catalog.
+IDENTITY_CACHE_SIZE = 16384
+
+
 def normalize_identity_text(value: str) -> str:
-    """Normalize free text into a stable fuzzy-matching key."""
+    """Normalize free text into a stable fuzzy-matching key (memoized)."""
+    return _identity_key(value)
+
+
+def normalize_identity_texts(values: Iterable[str]) -> list[str]:
+    """Identity keys for a list of values, in order."""
+    return [_identity_key(value) for value in values]
+
+
+def identity_cache_info() -> Any:
+    """`functools` cache counters for the identity-key memo."""
+    return _identity_key.cache_info()
+
+
+def clear_identity_cache() -> None:
+    _identity_key.cache_clear()
+
+
+@lru_cache(maxsize=IDENTITY_CACHE_SIZE)
+def _identity_key(value: str) -> str:
     cleaned = _strip_diacritics(value).lower().strip()
     cleaned = re.sub(r"[^a-z0-9\s]", " ", cleaned)
     cleaned = re.sub(r"\s+", " ", cleaned).strip()
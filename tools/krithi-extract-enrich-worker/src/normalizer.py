@@ -1,12 +1,23 @@
-"""Consolidated normalization helpers for extraction-time matching keys."""
+"""Consolidated normalization helpers for extraction-time matching keys.
+
+Matching keys are pure functions of ``(text, entity_type)``, and an anthology
+repeats the same composer, raga and tala strings on every Krithi, so keys are
+memoized in a bounded LRU. `normalize_many_for_matching` keys a whole list
+(duplicates computed once), and `normalization_cache_stats` reports hit rates
+for this cache and the identity-key cache in `identity_candidates`.
+"""
 
 from __future__ import annotations
 
 import re
 import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 
 from .diacritic_normalizer import normalize_garbled_diacritics as _legacy_normalize_garbled_diacritics
 from .heuristics.transliteration_collapse import MATCHING_COLLAPSE_RULES, apply_collapse
+from .identity_candidates import clear_identity_cache, identity_cache_info
 
 _HONORIFIC_RE = re.compile(r"\b(?:saint|sri|swami|sir|dr|prof|smt)\b", re.IGNORECASE)
 _NON_ALNUM_SPACE_RE = re.compile(r"[^a-z0-9\s]")
@@ -20,6 +31,9 @@ _DOUBLE_CONSONANT_RE = re.compile(r"([bcdfghjklmnpqrstvwxyz])\1+")
 _DEITY_PREFIX_RE = re.compile(r"^(?:(?:lord|goddess|sri|arulmigu)\s+)+")
 _TEMPLE_PREFIX_RE = re.compile(r"^(?:(?:sri|arulmigu|tiru)\s+)+")
 
+# Distinct (text, entity_type) keys kept; a large anthology has a few thousand.
+MATCHING_CACHE_SIZE = 8192
+
 
 def _strip_diacritics(text: str) -> str:
     return "".join(char for char in unicodedata.normalize("NFD", text) if unicodedata.category(char) != "Mn")
@@ -29,7 +43,18 @@ def normalize_for_matching(text: str, entity_type: str = "title") -> str:
     """Produce a canonical matching key for deduplication and variant matching."""
     if not text:
         return ""
+    return _matching_key(text, entity_type)
+
+
+def normalize_many_for_matching(texts: Iterable[str], entity_type: str = "title") -> list[str]:
+    """Matching keys for a list of values of one entity type, in order."""
+    values = list(texts)
+    keys = {text: normalize_for_matching(text, entity_type) for text in dict.fromkeys(values)}
+    return [keys[text] for text in values]
 
+
+@lru_cache(maxsize=MATCHING_CACHE_SIZE)
+def _matching_key(text: str, entity_type: str) -> str:
     # 1. NFD decomposition + strip combining marks
     result = _strip_diacritics(text)
     # 2. Lowercase
@@ -78,6 +103,36 @@ def normalize_for_matching(text: str, entity_type: str = "title") -> str:
     return result
 
 
+@dataclass(frozen=True)
+class NormalizerCacheStats:
+    """Hit/miss counters for one memoized normalizer."""
+
+    name: str
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def normalization_cache_stats() -> list[NormalizerCacheStats]:
+    """Counters for the matching-key and identity-key caches."""
+    stats = []
+    for name, info in (("matching", _matching_key.cache_info()), ("identity", identity_cache_info())):
+        stats.append(NormalizerCacheStats(name, info.hits, info.misses, info.currsize, info.maxsize or 0))
+    return stats
+
+
+def clear_normalization_caches() -> None:
+    """Drop memoized keys (e.g. after the collapse tables change in tests)."""
+    _matching_key.cache_clear()
+    clear_identity_cache()
+
+
 def normalize_garbled_diacritics(text: str) -> str:
     """Keep the existing garbled diacritic cleanup from diacritic_normalizer.py."""
     return _legacy_normalize_garbled_diacritics(text)
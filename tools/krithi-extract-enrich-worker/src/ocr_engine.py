@@ -0,0 +1,115 @@
+"""OCR engine backends for `OcrFallback`.
+
+``pytesseract`` shells out per page: it writes the image to a temp file, forks
+the ``tesseract`` binary, and that process reloads the traineddata for every
+page. For Indic packs (``san+eng``, ``tam+eng``) the model load costs about as
+much as the recognition itself.
+
+`TesserocrEngine` keeps one in-process Tesseract API handle for the life of the
+worker: the traineddata is loaded once, and each page's pixmap samples are
+passed straight from memory. `PytesseractEngine` is the original subprocess
+path, used when ``tesserocr`` is not installed or its API cannot initialise
+(``PyTessBaseAPI`` raises RuntimeError when the traineddata for a requested
+language is missing from its tessdata directory).
+
+A Tesseract API handle is not thread-safe; each worker process owns its own
+engine through its `OcrFallback`.
+"""
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Literal
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+OcrBackend = Literal["auto", "tesserocr", "pytesseract"]
+
+# Same page-segmentation mode on both backends: a uniform block of text.
+PAGE_SEGMENTATION_MODE = 6
+
+
+class OcrEngine(ABC):
+    """Recognize text in rendered page images."""
+
+    name: str
+
+    @abstractmethod
+    def recognize(self, pixmap: fitz.Pixmap) -> str:
+        """Return the text in an RGB pixmap."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook; stateless engines hold nothing
+        """Release engine resources. The engine is unusable afterwards."""
+
+
+class TesserocrEngine(OcrEngine):
+    """Long-lived in-process Tesseract API; traineddata loaded once."""
+
+    name = "tesserocr"
+
+    def __init__(self, lang: str) -> None:
+        import tesserocr
+
+        self.lang = lang
+        self._api: Any = tesserocr.PyTessBaseAPI(lang=lang, psm=tesserocr.PSM(PAGE_SEGMENTATION_MODE))
+
+    def recognize(self, pixmap: fitz.Pixmap) -> str:
+        self._api.SetImageBytes(pixmap.samples, pixmap.width, pixmap.height, pixmap.n, pixmap.stride)
+        text: str = self._api.GetUTF8Text()
+        return text
+
+    def close(self) -> None:
+        self._api.End()
+
+
+class PytesseractEngine(OcrEngine):
+    """The ``tesseract`` CLI through pytesseract: one subprocess per page."""
+
+    name = "pytesseract"
+
+    def __init__(self, lang: str) -> None:
+        import pytesseract
+        from PIL import Image
+
+        self.lang = lang
+        self._pytesseract: Any = pytesseract
+        self._image: Any = Image
+
+    def recognize(self, pixmap: fitz.Pixmap) -> str:
+        img = self._image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+        text: str = self._pytesseract.image_to_string(
+            img,
+            lang=self.lang,
+            config=f"--psm {PAGE_SEGMENTATION_MODE}",
+        )
+        return text
+
+
+def create_ocr_engine(lang: str, backend: OcrBackend = "auto") -> OcrEngine | None:
+    """Build the requested engine, or the best available one for ``auto``.
+
+    Returns None when no OCR stack is installed.
+    """
+    if backend in ("auto", "tesserocr"):
+        try:
+            return TesserocrEngine(lang)
+        except ImportError:
+            if backend == "tesserocr":
+                raise
+            logger.debug("tesserocr not installed; falling back to pytesseract")
+        except RuntimeError as exc:
+            if backend == "tesserocr":
+                raise
+            logger.warning(
+                "tesserocr could not initialise; falling back to pytesseract",
+                extra={"lang": lang, "error": str(exc)},
+            )
+    try:
+        return PytesseractEngine(lang)
+    except ImportError:
+        if backend == "pytesseract":
+            raise
+        return None
@@ -3,15 +3,28 @@
 Invoked as a fallback when PyMuPDF text extraction returns empty or garbled
 text (>50% non-printable characters). Supports Indic language packs:
 Sanskrit (Devanagari), Tamil, Telugu, Kannada, Malayalam.
+
+Recognition goes through an `OcrEngine` (see :mod:`src.ocr_engine`) created on
+first use and kept for the life of this object, so the persistent backend
+loads its traineddata once per worker process.
+
+Each page first goes through the :mod:`src.ocr_preflight` analysis: blank
+pages and plates are skipped, and text pages are rendered clipped to their
+text region. Counts for the last document are kept in `last_stats`.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable, Mapping
 from pathlib import Path
 
 import fitz  # PyMuPDF — for rendering pages to images
 
+from . import task_metrics
+from .ocr_engine import OcrBackend, OcrEngine, create_ocr_engine
+from .ocr_preflight import OcrPageStats, PageLayout, analyze_page
+
 logger = logging.getLogger(__name__)
 
 # Language codes for Tesseract Indic packs
@@ -29,21 +42,53 @@ TESSERACT_LANG_MAP = {
 class OcrFallback:
     """OCR extraction for scanned or image-based PDF pages."""
 
-    def __init__(self, languages: list[str] | None = None, dpi: int = 300) -> None:
+    def __init__(
+        self,
+        languages: list[str] | None = None,
+        dpi: int = 300,
+        backend: OcrBackend = "auto",
+        preflight: bool = True,
+    ) -> None:
         """Initialize OCR with specified languages.
 
         Args:
             languages: List of language codes (sa, ta, te, kn, ml, en).
                        Defaults to Sanskrit + English.
             dpi: Resolution for rendering PDF pages to images.
+            backend: OCR engine: ``tesserocr`` (persistent), ``pytesseract``
+                     (subprocess per page), or ``auto`` for the best installed.
+            preflight: Skip blank/plate pages and crop text pages before OCR.
         """
         self.languages = languages or ["sa", "en"]
         self.dpi = dpi
+        self.backend = backend
+        self.preflight = preflight
+        self._engine: OcrEngine | None = None
+        # Preflight counts for the most recent extract_document_text call.
+        self.last_stats = OcrPageStats()
 
         # Build Tesseract language string
         tesseract_langs = [TESSERACT_LANG_MAP.get(lang, lang) for lang in self.languages]
         self.tesseract_lang_str = "+".join(tesseract_langs)
 
+    def engine(self) -> OcrEngine | None:
+        """The OCR engine, created on first use; None when no OCR stack is installed."""
+        if self._engine is None:
+            # An explicitly requested backend that is not installed raises here.
+            self._engine = create_ocr_engine(self.tesseract_lang_str, self.backend)
+            if self._engine is not None:
+                logger.info(
+                    "OCR engine ready",
+                    extra={"backend": self._engine.name, "languages": self.tesseract_lang_str},
+                )
+        return self._engine
+
+    def close(self) -> None:
+        """Release the OCR engine. A later extraction creates a new one."""
+        if self._engine is not None:
+            self._engine.close()
+        self._engine = None
+
     def extract_page_text(self, pdf_path: str | Path, page_number: int) -> str:
         """Extract text from a single PDF page using OCR.
 
@@ -62,6 +107,9 @@ class OcrFallback:
         self,
         pdf_path: str | Path,
         page_range: tuple[int, int] | None = None,
+        *,
+        completed: Mapping[int, str] | None = None,
+        on_page: Callable[[int, str], None] | None = None,
     ) -> dict[int, str]:
         """Extract text from multiple pages using OCR.
 
@@ -73,11 +121,16 @@ class OcrFallback:
         Args:
             pdf_path: Path to the PDF file.
             page_range: Optional (start, end) page numbers (0-based, inclusive).
+            completed: Text of pages already recognized by an earlier attempt;
+                       these are returned as given without rendering or OCR.
+            on_page: Called with each newly processed page and its text, as
+                     soon as it is ready (used for task checkpoints).
 
         Returns:
             Dict mapping page number to extracted text.
         """
         results: dict[int, str] = {}
+        stats = self.last_stats = OcrPageStats()
 
         with fitz.open(str(pdf_path)) as doc:
             total_pages = len(doc)
@@ -86,27 +139,34 @@ class OcrFallback:
             end = page_range[1] if page_range else total_pages - 1
             end = min(end, total_pages - 1)
 
-            try:
-                import pytesseract
-                from PIL import Image
-            except ImportError:
+            engine = self.engine()
+            if engine is None:
                 # Preserve the previous degraded behaviour: without the OCR stack
                 # the caller still gets one empty string per requested page, not {}.
-                logger.error("pytesseract or Pillow not installed; OCR unavailable")
+                logger.error("No OCR backend installed (tesserocr or pytesseract + Pillow); OCR unavailable")
                 return dict.fromkeys(range(start, end + 1), "")
 
             mat = fitz.Matrix(self.dpi / 72, self.dpi / 72)
 
             for page_num in range(start, end + 1):
+                if completed is not None and page_num in completed:
+                    results[page_num] = completed[page_num]
+                    continue
                 page = doc[page_num]
-                pix = page.get_pixmap(matrix=mat)
-                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
-
-                text: str = pytesseract.image_to_string(
-                    img,
-                    lang=self.tesseract_lang_str,
-                    config="--psm 6",  # Assume uniform block of text
-                )
+                layout = analyze_page(page) if self.preflight else PageLayout(kind="text", ink_ratio=0.0)
+                stats.record(page_num, layout)
+                if layout.kind != "text":
+                    # Keep one entry per requested page; an empty page yields no Krithi.
+                    logger.debug("OCR skipped page", extra={"page": page_num, "kind": layout.kind})
+                    results[page_num] = ""
+                    if on_page is not None:
+                        on_page(page_num, "")
+                    continue
+
+                with task_metrics.stage("ocr_render"):
+                    pix = page.get_pixmap(matrix=mat, clip=layout.clip)
+                with task_metrics.stage("ocr_recognize"):
+                    text = engine.recognize(pix)
 
                 logger.info(
                     "OCR extracted text",
@@ -117,7 +177,11 @@ class OcrFallback:
                     },
                 )
                 results[page_num] = text
+                if on_page is not None:
+                    on_page(page_num, text)
 
+        if self.preflight:
+            logger.info("OCR preflight", extra=stats.as_log_extra())
         return results
 
     @staticmethod
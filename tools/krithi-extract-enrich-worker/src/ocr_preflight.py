@@ -0,0 +1,147 @@
+"""Cheap page analysis ahead of OCR.
+
+Scanned anthologies carry blank separator leaves, ornamental plates and
+photographs. Full-page Tesseract on those costs as much as on a page of
+lyrics and yields nothing (or noise). Before OCR, each page is rendered as a
+small grayscale thumbnail and its ink is profiled by row and column:
+
+- almost no ink: a blank page, skipped outright;
+- ink over a large share of the page: a plate or photograph, skipped;
+- otherwise the inked rows/columns give the text region, and only that
+  region (plus a margin) is rendered at OCR resolution.
+
+Scanner borders (rows or columns that are nearly solid ink) are ignored so a
+dark page edge neither inflates the ink ratio nor widens the crop. The
+profile is a byte-level histogram over a 72 DPI thumbnail (a few ms per
+page), a small fraction of a single OCR call.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Literal
+
+import fitz  # PyMuPDF
+
+PageKind = Literal["blank", "plate", "text"]
+
+ANALYSIS_DPI = 72
+# Gray level below which a thumbnail pixel counts as ink; anti-aliased strokes
+# at thumbnail resolution are mid-gray, so this sits well above 50%.
+INK_LEVEL = 160
+# Share of inked pixels under which a page is blank, and over which it is a plate.
+# Low enough that a lone title line ("Part II") still counts as text.
+BLANK_INK_RATIO = 0.0001
+PLATE_INK_RATIO = 0.40
+# A row/column inked across more than this share is a scanner border, not content.
+BORDER_INK_RATIO = 0.90
+# Thumbnail pixels a row/column needs to count towards the text region (drops lone specks).
+MIN_LINE_INK = 2
+# Fewer inked rows than this is dust, not a line of text (12pt is ~12 rows at 72 DPI).
+MIN_TEXT_ROWS = 4
+# Margin kept around the detected text region, in PDF points.
+CROP_MARGIN_PT = 18.0
+# Crops that keep most of the page are not worth a clip.
+MAX_CROP_AREA_RATIO = 0.90
+
+_INK_TABLE = bytes(1 if level < INK_LEVEL else 0 for level in range(256))
+
+
+@dataclass(frozen=True)
+class PageLayout:
+    """Pre-OCR verdict for one page."""
+
+    kind: PageKind
+    ink_ratio: float
+    # Region to OCR, in page coordinates; None means the whole page.
+    clip: fitz.Rect | None = None
+
+
+@dataclass
+class OcrPageStats:
+    """Per-document counts of what the preflight saved."""
+
+    pages: int = 0
+    ocr_pages: int = 0
+    cropped_pages: int = 0
+    skipped_blank: int = 0
+    skipped_plate: int = 0
+    skipped_page_numbers: list[int] = field(default_factory=list)
+
+    def record(self, page_number: int, layout: PageLayout) -> None:
+        self.pages += 1
+        if layout.kind == "blank":
+            self.skipped_blank += 1
+            self.skipped_page_numbers.append(page_number)
+        elif layout.kind == "plate":
+            self.skipped_plate += 1
+            self.skipped_page_numbers.append(page_number)
+        else:
+            self.ocr_pages += 1
+            if layout.clip is not None:
+                self.cropped_pages += 1
+
+    def as_log_extra(self) -> dict[str, int]:
+        return {
+            "pages": self.pages,
+            "ocr_pages": self.ocr_pages,
+            "cropped_pages": self.cropped_pages,
+            "skipped_blank": self.skipped_blank,
+            "skipped_plate": self.skipped_plate,
+        }
+
+
+def analyze_page(page: fitz.Page) -> PageLayout:
+    """Classify a page and locate its text region from a grayscale thumbnail."""
+    scale = ANALYSIS_DPI / 72
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csGRAY, alpha=False)
+    width, height, stride = pix.width, pix.height, pix.stride
+    if width == 0 or height == 0:
+        return PageLayout(kind="blank", ink_ratio=0.0)
+
+    ink = pix.samples.translate(_INK_TABLE)
+    row_ink = [ink[y * stride : y * stride + width].count(1) for y in range(height)]
+    col_ink = [ink[x : height * stride : stride].count(1) for x in range(width)]
+
+    border_rows = {y for y, count in enumerate(row_ink) if count > width * BORDER_INK_RATIO}
+    border_cols = {x for x, count in enumerate(col_ink) if count > height * BORDER_INK_RATIO}
+    content_rows = [
+        0 if y in border_rows else count - sum(ink[y * stride + x] for x in border_cols)
+        for y, count in enumerate(row_ink)
+    ]
+    content_cols = [
+        0 if x in border_cols else count - sum(ink[y * stride + x] for y in border_rows)
+        for x, count in enumerate(col_ink)
+    ]
+    content_area = (height - len(border_rows)) * (width - len(border_cols))
+    if content_area <= 0:
+        return PageLayout(kind="plate", ink_ratio=1.0)
+
+    ink_ratio = sum(content_rows) / content_area
+    if ink_ratio < BLANK_INK_RATIO:
+        return PageLayout(kind="blank", ink_ratio=ink_ratio)
+    if ink_ratio > PLATE_INK_RATIO:
+        return PageLayout(kind="plate", ink_ratio=ink_ratio)
+
+    inked_rows = [y for y, count in enumerate(content_rows) if count >= MIN_LINE_INK]
+    inked_cols = [x for x, count in enumerate(content_cols) if count >= MIN_LINE_INK]
+    if len(inked_rows) < MIN_TEXT_ROWS or not inked_cols:
+        return PageLayout(kind="blank", ink_ratio=ink_ratio)
+    if page.rotation:
+        # The clip would need remapping through the rotation: OCR the whole page.
+        return PageLayout(kind="text", ink_ratio=ink_ratio)
+
+    to_points = 72 / ANALYSIS_DPI
+    page_rect = page.rect
+    region = (
+        fitz.Rect(
+            inked_cols[0] * to_points - CROP_MARGIN_PT,
+            inked_rows[0] * to_points - CROP_MARGIN_PT,
+            (inked_cols[-1] + 1) * to_points + CROP_MARGIN_PT,
+            (inked_rows[-1] + 1) * to_points + CROP_MARGIN_PT,
+        )
+        & page_rect
+    )
+    if region.get_area() >= page_rect.get_area() * MAX_CROP_AREA_RATIO:
+        return PageLayout(kind="text", ink_ratio=ink_ratio)
+    return PageLayout(kind="text", ink_ratio=ink_ratio, clip=region)
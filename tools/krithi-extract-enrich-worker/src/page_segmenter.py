@@ -21,8 +21,8 @@ logger = logging.getLogger(__name__)
 class KrithiSegment:
     """A segment of a PDF corresponding to a single Krithi."""
 
-    start_page: int  # 0-based
-    end_page: int  # 0-based, inclusive
+    start_page: int  # 0-based, absolute in the source PDF
+    end_page: int  # 0-based, absolute in the source PDF, inclusive
     title_text: str
     header_blocks: list[TextBlock] = field(default_factory=list)
     body_blocks: list[TextBlock] = field(default_factory=list)
@@ -344,9 +344,11 @@ class PageSegmenter:
                     body_blocks.append(block)
                     body_text_parts.append(block.text)
 
+            # Report absolute page numbers: for a page-range task, document.pages
+            # starts mid-PDF and a list index would mislabel every segment.
             segment = KrithiSegment(
-                start_page=page_idx,
-                end_page=end_page,
+                start_page=document.pages[page_idx].page_number,
+                end_page=document.pages[end_page].page_number,
                 title_text=title_block.text.strip(),
                 header_blocks=[title_block],
                 body_blocks=body_blocks,
@@ -363,8 +365,8 @@ class PageSegmenter:
         title = all_blocks[0].text.strip() if all_blocks else "Unknown"
 
         return KrithiSegment(
-            start_page=0,
-            end_page=len(document.pages) - 1,
+            start_page=document.pages[0].page_number,
+            end_page=document.pages[-1].page_number,
             title_text=title,
             header_blocks=all_blocks[:1],
             body_blocks=all_blocks[1:],
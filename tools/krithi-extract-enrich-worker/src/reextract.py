@@ -0,0 +1,292 @@
+"""Bulk re-extraction of DONE tasks after an extractor version bump.
+
+Refreshing the corpus used to take a one-off migration (V42/V43) that reset
+rows to PENDING, after which the polling loop re-fetched and re-processed
+them one at a time, rewriting every payload whether it changed or not.
+`CorpusReextractor` instead walks the DONE rows whose `extractor_version`
+is older than the running worker's, in keyset-paginated batches, and:
+
+1. runs each batch through the normal strategies on a process pool. Sources
+   come from the artifact store and PDFs start from the document cache
+   (`SG_DOCUMENT_CACHE=reparse`), so a parser-only bump costs no download,
+   PyMuPDF or OCR work for anything extracted before;
+2. diffs the new results against the stored payload, ignoring
+   `extractionTimestamp`;
+3. writes back only the changed tasks, one transaction per batch. Unchanged
+   tasks just have their `extractor_version` bumped.
+
+With `dry_run` nothing is written and the returned `ReextractionStats`
+report what would change. Rows stay DONE throughout, so the backend can keep
+ingesting while a refresh runs; a row it ingests mid-batch is left alone.
+Finalization runs exactly as in the worker, so identity discovery and Gemini
+enrichment follow the usual settings.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import re
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+from uuid import UUID
+
+from .config import ExtractorConfig
+from .db import DoneExtraction, ExtractionTask, RewrittenResults
+from .worker import ExtractionWorker
+
+logger = logging.getLogger(__name__)
+
+# Stamped at extraction time; differs on every run, so it never counts as a change.
+_VOLATILE_FIELDS = frozenset({"extractionTimestamp"})
+
+
+def version_is_older(version: str | None, current: str) -> bool:
+    """Whether a row's `extractor_version` predates `current`.
+
+    Versions are compared on the numeric parts of their tag
+    (``krithi-extract-enrich-worker:1.10.0`` > ``...:1.9.2``). A missing or
+    unparseable version counts as older; a newer one (left by a worker that
+    was since rolled back) does not.
+    """
+    if not version:
+        return True
+    parts = _version_parts(version)
+    return not parts or parts < _version_parts(current)
+
+
+def _version_parts(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in re.findall(r"\d+", version.rpartition(":")[2]))
+
+
+def diff_results(old: Sequence[dict[str, Any]], new: Sequence[dict[str, Any]]) -> Counter[str]:
+    """Count differing top-level fields between two result lists, paired by position.
+
+    Results present on only one side count as ``+result`` / ``-result``. An
+    empty counter means the lists are equivalent.
+    """
+    changes: Counter[str] = Counter()
+    for before, after in zip(old, new, strict=False):
+        for key in (before.keys() | after.keys()) - _VOLATILE_FIELDS:
+            if before.get(key) != after.get(key):
+                changes[key] += 1
+    if len(new) > len(old):
+        changes["+result"] += len(new) - len(old)
+    elif len(old) > len(new):
+        changes["-result"] += len(old) - len(new)
+    return changes
+
+
+@dataclass
+class ReextractionStats:
+    """What a re-extraction run found (and, unless dry-run, wrote)."""
+
+    scanned: int = 0
+    skipped_newer: int = 0
+    unchanged: int = 0
+    changed: int = 0
+    failed: int = 0
+    written: int = 0
+    results_before: int = 0
+    results_after: int = 0
+    field_changes: Counter[str] = field(default_factory=Counter)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "scanned": self.scanned,
+            "skipped_newer": self.skipped_newer,
+            "unchanged": self.unchanged,
+            "changed": self.changed,
+            "failed": self.failed,
+            "written": self.written,
+            "results_before": self.results_before,
+            "results_after": self.results_after,
+            "field_changes": dict(self.field_changes.most_common()),
+        }
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    """A re-extracted task as returned from a pool process."""
+
+    task_id: UUID
+    results: list[dict[str, Any]] | None
+    extraction_method: str | None
+    error: str | None = None
+
+
+class DoneResultsStore(Protocol):
+    """The queue calls `CorpusReextractor` makes; `ExtractionQueueDB` provides them."""
+
+    def list_done_extractions(
+        self,
+        *,
+        exclude_version: str,
+        after_id: UUID | None,
+        limit: int,
+        source_format: str | None = None,
+    ) -> list[DoneExtraction]:
+        """A page of DONE tasks not completed by `exclude_version`, in id order."""
+
+    def rewrite_done_results(
+        self,
+        changed: Sequence[RewrittenResults],
+        unchanged: Sequence[UUID],
+        *,
+        as_rows: bool = False,
+    ) -> int:
+        """Write a batch of re-extracted results back; returns the changed rows written."""
+
+
+class CorpusReextractor:
+    """Re-extracts stale DONE tasks in batches on a process pool."""
+
+    def __init__(
+        self,
+        config: ExtractorConfig,
+        db: DoneResultsStore,
+        *,
+        workers: int = 1,
+        batch_size: int = 50,
+        dry_run: bool = False,
+        limit: int | None = None,
+        source_format: str | None = None,
+    ) -> None:
+        self.config = config
+        self.db = db
+        self.workers = workers
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.limit = limit
+        self.source_format = source_format
+
+    def run(self) -> ReextractionStats:
+        """Walk every stale DONE task once; returns the run's statistics."""
+        stats = ReextractionStats()
+        pool_config = _pool_config(self.config)
+        if self.workers <= 1:
+            _init_process(pool_config)
+            self._run_batches(map, stats)
+        else:
+            # Spawned rather than forked: pool processes must not inherit the
+            # parent's DB connection.
+            with ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process,
+                initargs=(pool_config,),
+            ) as pool:
+                self._run_batches(pool.map, stats)
+        logger.info("Re-extraction finished", extra={"dry_run": self.dry_run, **stats.as_dict()})
+        return stats
+
+    def _run_batches(
+        self,
+        map_tasks: Callable[[Callable[[ExtractionTask], _Outcome], list[ExtractionTask]], Iterator[_Outcome]],
+        stats: ReextractionStats,
+    ) -> None:
+        for batch in self._stale_batches(stats):
+            outcomes = map_tasks(_reextract_task, [done.task for done in batch])
+            changed, unchanged = self._compare(batch, outcomes, stats)
+            if not self.dry_run and (changed or unchanged):
+                stats.written += self.db.rewrite_done_results(
+                    changed, unchanged, as_rows=self.config.result_persistence == "rows"
+                )
+            logger.info("Re-extraction batch done", extra=stats.as_dict())
+
+    def _stale_batches(self, stats: ReextractionStats) -> Iterator[list[DoneExtraction]]:
+        current = self.config.extractor_version
+        after_id: UUID | None = None
+        while self.limit is None or stats.scanned < self.limit:
+            page_size = self.batch_size if self.limit is None else min(self.batch_size, self.limit - stats.scanned)
+            page = self.db.list_done_extractions(
+                exclude_version=current, after_id=after_id, limit=page_size, source_format=self.source_format
+            )
+            if not page:
+                return
+            after_id = page[-1].task.id
+            stats.scanned += len(page)
+            batch = [done for done in page if version_is_older(done.extractor_version, current)]
+            stats.skipped_newer += len(page) - len(batch)
+            if batch:
+                yield batch
+
+    def _compare(
+        self,
+        batch: list[DoneExtraction],
+        outcomes: Iterator[_Outcome],
+        stats: ReextractionStats,
+    ) -> tuple[list[RewrittenResults], list[UUID]]:
+        changed: list[RewrittenResults] = []
+        unchanged: list[UUID] = []
+        for done, outcome in zip(batch, outcomes, strict=True):
+            if outcome.results is None or outcome.extraction_method is None:
+                stats.failed += 1
+                logger.warning(
+                    "Re-extraction failed; keeping stored results",
+                    extra={"task_id": str(outcome.task_id), "error": outcome.error},
+                )
+                continue
+            stats.results_before += len(done.result_payload)
+            stats.results_after += len(outcome.results)
+            changes = diff_results(done.result_payload, outcome.results)
+            if not changes:
+                stats.unchanged += 1
+                unchanged.append(outcome.task_id)
+                continue
+            stats.changed += 1
+            stats.field_changes.update(changes)
+            logger.info(
+                "Re-extraction changed results",
+                extra={"task_id": str(outcome.task_id), "source_url": done.task.source_url, "changes": dict(changes)},
+            )
+            changed.append(
+                RewrittenResults(
+                    task_id=outcome.task_id,
+                    result_documents=[json.dumps(result, ensure_ascii=False) for result in outcome.results],
+                    extraction_method=outcome.extraction_method,
+                )
+            )
+        return changed, unchanged
+
+
+def _pool_config(config: ExtractorConfig) -> ExtractorConfig:
+    """The settings pool processes extract with.
+
+    PDFs start from cached text (anything not cached yet is extracted and
+    cached), and checkpoints are off: a DONE row is never retried, so its
+    progress log would only linger until pruned.
+    """
+    return config.model_copy(update={"document_cache": "reparse", "task_checkpoints": False})
+
+
+# One ExtractionWorker per pool process, built by the pool initializer.
+_process_worker: ExtractionWorker | None = None
+
+
+def _init_process(config: ExtractorConfig) -> None:
+    global _process_worker
+    _process_worker = ExtractionWorker(config)
+    if config.enable_identity_discovery:
+        # Identity candidates need the reference catalog, as in the worker.
+        _process_worker.db.connect()
+
+
+def _reextract_task(task: ExtractionTask) -> _Outcome:
+    """Run one task through its strategy; failures are returned, not raised."""
+    worker = _process_worker
+    if worker is None:
+        raise RuntimeError("Re-extraction process was not initialized")
+    try:
+        strategy = worker.strategies.get(task.source_format)
+        if strategy is None:
+            raise ValueError(f"Unsupported source format: {task.source_format}")
+        results = strategy.extract(task)
+    except Exception as exc:
+        return _Outcome(task.id, None, None, error=f"{type(exc).__name__}: {exc}")
+    method = results[0].extraction_method if results else strategy.default_extraction_method
+    return _Outcome(task.id, [result.to_json_dict() for result in results], method.value)
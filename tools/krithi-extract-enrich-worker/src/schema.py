@@ -181,3 +181,7 @@ class CanonicalExtraction(BaseModel):
     def to_json_dict(self) -> dict[str, Any]:
         """Serialize to JSON-compatible dict using camelCase aliases (for Kotlin interop)."""
         return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    def to_json(self) -> str:
+        """Serialize straight to JSON text, same shape as `to_json_dict` (no intermediate dict)."""
+        return self.model_dump_json(by_alias=True, exclude_none=True)
@@ -11,7 +11,10 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass, field
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from hashlib import sha256
 
 from .schema import (
     CanonicalLyricSection,
@@ -23,8 +26,12 @@ from .schema import (
 
 logger = logging.getLogger(__name__)
 
+# Part of the parse-cache key: bump whenever a heuristic change alters parse
+# output, so a long-lived caching parser never serves results of older rules.
+PARSER_VERSION = 1
 
-@dataclass
+
+@dataclass(frozen=True)
 class DetectedSection:
     """A lyric section detected in extracted text."""
 
@@ -36,7 +43,7 @@ class DetectedSection:
     end_pos: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class DetectedLyricVariant:
     """A full lyric variant in one language/script."""
 
@@ -45,7 +52,7 @@ class DetectedLyricVariant:
     sections: list[DetectedSection] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True)
 class MetadataBoundary:
     """Start/end offsets for non-lyric metadata blocks in source text."""
 
@@ -54,7 +61,7 @@ class MetadataBoundary:
     end_pos: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class RagamalikaSubsection:
     """A detected raga subsection within a ragamalika composition."""
 
@@ -64,7 +71,7 @@ class RagamalikaSubsection:
     order: int
 
 
-@dataclass
+@dataclass(frozen=True)
 class StructureParseResult:
     """Frozen parser contract emitted by the extraction layer."""
 
@@ -74,11 +81,27 @@ class StructureParseResult:
     ragamalika_subsections: list[RagamalikaSubsection] = field(default_factory=list)
 
 
+def _copy_result(result: StructureParseResult) -> StructureParseResult:
+    """A result with fresh lists, so a caller's mutation cannot reach the parse cache."""
+    return StructureParseResult(
+        sections=list(result.sections),
+        lyric_variants=[
+            DetectedLyricVariant(variant.language, variant.script, list(variant.sections))
+            for variant in result.lyric_variants
+        ],
+        metadata_boundaries=list(result.metadata_boundaries),
+        ragamalika_subsections=list(result.ragamalika_subsections),
+    )
+
+
 @dataclass
 class _LineToken:
     text: str
     start_pos: int
     end_pos: int
+    # Section header carried by a language-header remainder, resolved when the
+    # block was built so re-parsing a language block does not detect it again.
+    section_header: _HeaderMatch | None = None
 
 
 @dataclass
@@ -95,6 +118,62 @@ class _HeaderMatch:
     remainder: str
 
 
+@dataclass(frozen=True, slots=True)
+class _ParseContext:
+    """Per-call gates for the context-dependent inline header abbreviations.
+
+    Derived from the text window being parsed, never stored on the parser, so
+    one parser can serve cached and concurrent calls.
+    """
+
+    inline_pa_enabled: bool = False
+    inline_indic_pac_enabled: bool = False
+
+    @classmethod
+    def for_text(cls, text: str) -> _ParseContext:
+        return cls(
+            inline_pa_enabled=bool(_INLINE_CHARANAM_PROBE.search(text)),
+            inline_indic_pac_enabled=bool(_INLINE_INDIC_PAC_PROBE.search(text)),
+        )
+
+
+_NO_INLINE_HEADERS = _ParseContext()
+
+
+@dataclass(frozen=True, slots=True)
+class _HeaderCandidates:
+    """Header matches for one line, before the inline-abbreviation gates are known.
+
+    The inline P/A/C and Indic abbreviation patterns only count when the window
+    being parsed contains such markers, and the lyric window and the whole
+    document can disagree; each family is matched once and resolved per window.
+    """
+
+    header: _HeaderMatch | None = None
+    inline_pac: _HeaderMatch | None = None
+    inline_indic_pac: _HeaderMatch | None = None
+
+    def resolve(self, context: _ParseContext) -> _HeaderMatch | None:
+        if self.header is not None:
+            return self.header
+        if context.inline_pa_enabled and self.inline_pac is not None:
+            return self.inline_pac
+        if context.inline_indic_pac_enabled:
+            return self.inline_indic_pac
+        return None
+
+
+@dataclass(slots=True)
+class _SourceLine:
+    """A non-blank source line, normalized and classified once per parse."""
+
+    token: _LineToken
+    boilerplate: bool
+    header: _HeaderCandidates | None = None
+    # Section header inside a language header's remainder ("Tamil: பல்லவி").
+    remainder_header: _HeaderCandidates | None = None
+
+
 LANGUAGE_LABELS = {
     "DEVANAGARI",
     "TAMIL",
@@ -306,6 +385,35 @@ METADATA_BOUNDARY_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
     ("VARIATIONS", re.compile(r"^\s*(?:variations?|alternate\s*reading)\b", re.IGNORECASE | re.MULTILINE)),
 ]
 
+_LINE_START = r"^\s*"
+
+
+def _fuse_boundary_patterns(
+    patterns: list[tuple[str, re.Pattern[str]]],
+) -> tuple[re.Pattern[str], list[tuple[str, re.Pattern[str]]]]:
+    """One alternation over all boundary patterns, plus each keyword body on its own.
+
+    Every pattern is ``^\\s*`` followed by a keyword body; the fused pattern
+    shares the line-start prefix and puts each body in a group named after its
+    label, so a single `finditer` yields the boundaries in order. The bare
+    bodies let the caller check later labels for a longer match at the same
+    start, which the alternation (first branch wins) would not prefer.
+    """
+    flags = {pattern.flags for _, pattern in patterns}
+    if len(flags) != 1:
+        raise ValueError("metadata boundary patterns must share their flags")
+    bodies: list[tuple[str, re.Pattern[str]]] = []
+    for label, pattern in patterns:
+        if not pattern.pattern.startswith(_LINE_START):
+            raise ValueError(f"metadata boundary pattern {label!r} must start with {_LINE_START!r}")
+        bodies.append((label, re.compile(pattern.pattern[len(_LINE_START) :], pattern.flags)))
+    branches = "|".join(f"(?P<{label}>{body.pattern})" for label, body in bodies)
+    return re.compile(f"{_LINE_START}(?:{branches})", flags.pop()), bodies
+
+
+_METADATA_BOUNDARY_SCAN, _METADATA_BOUNDARY_BODIES = _fuse_boundary_patterns(METADATA_BOUNDARY_PATTERNS)
+_METADATA_BOUNDARY_RANK = {label: rank for rank, (label, _) in enumerate(_METADATA_BOUNDARY_BODIES)}
+
 # Inline P/A patterns are context-dependent: only activated when the document
 # also contains inline C/C\d+ labels (thyagaraja-vaibhavam blog format).
 # Without this guard, "A jagadamba" in a document using full-word headers
@@ -369,6 +477,80 @@ METADATA_KEYWORDS = (
     "language",
 )
 
+# Footer/navigation chrome from blog templates, and transliteration-chart
+# rows, matched anywhere in the lowercased line.
+BOILERPLATE_MARKERS = (
+    "a i i u u",
+    "ch j jh",
+    "ph b bh m",
+    "pronunciation guide",
+    "powered by blogger",
+    "newer post",
+    "older post",
+    "subscribe to",
+    "post a comment",
+    "blog archive",
+    "link to this post",
+    "posted by",
+    "all rights reserved",
+    "copyright",
+    "skip to main",
+    "related posts",
+)
+
+
+class _LineClassifier:
+    """Boilerplate and metadata-keyword classification of a single line.
+
+    The checks `StructureParser` used to run one by one are folded into three
+    compiled patterns over the lowercased line: one anchored match for every
+    whole-line form (navigation links, the nOTTu-svara header, the Indic
+    transliteration-chart rows), one search for the literal footer and chart
+    markers, and one search for the metadata keywords. The anchored forms sit
+    in their own pattern so the marker search does not retry them at every
+    offset of a long line.
+    """
+
+    def __init__(
+        self,
+        markers: tuple[str, ...] = BOILERPLATE_MARKERS,
+        metadata_keywords: tuple[str, ...] = METADATA_KEYWORDS,
+    ) -> None:
+        # None of the Indic-chart forms involves a cased letter, so they hold
+        # on the lowercased line as well.
+        self._line_forms = re.compile(
+            # TRACK-103: standalone "Back" navigation and "Meaning of Kriti" links
+            r"back\Z|meaning of kriti|updated on "
+            # nOTTu-svara header — metadata, not lyric content
+            r"|\s*\(?n[oō]t+u[\s-]*svara\s+s[aā]hityam?\)?\.?\s*$"
+            # Transliteration-key preamble lines (Modified HK chart at the top of
+            # each script block on Govindan blogs — ADR-015 head-capture fix).
+            # Three forms, all impossible in single-script lyric:
+            #   1. a comma-separated Indic consonant chart ("க,ச,ட,த,ப - 2-ख …");
+            r"|[\u0900-\u0D7F]\s*,\s*[\u0900-\u0D7F]"
+            #   2. a cross-script mapping row — Devanagari mixed with another
+            #      Indic script ("ஸ1 श - शिव - சிவன்"); lyric is one script per line;
+            r"|(?s:(?=.*?[\u0900-\u097F])(?=.*?[\u0B00-\u0D7F]))"
+            #   3. a parenthesised sandhi mapping, whole line ("(ச3 - ஜ)"); lyric
+            #      refrains like "(வேங்க)" carry no ' - ' mapping arrow.
+            r"|\s*\([^)]*\s-\s[^)]*\)\s*$"
+        )
+        self._markers = re.compile("|".join(re.escape(marker) for marker in markers))
+        # Devanagari vowel/consonant mapping lines (e.g. "ऎ,कॆ,चॆ.. - e,ke,ce..(short)")
+        self._vowel_length_row = re.compile(r"[\u0900-\u097F].*-\s*[a-zA-Z]")
+        self._metadata = re.compile("|".join(re.escape(keyword) for keyword in metadata_keywords))
+
+    def is_boilerplate(self, line: str) -> bool:
+        lowered = line.lower()
+        if self._line_forms.match(lowered) or self._markers.search(lowered):
+            return True
+        return ("(short)" in lowered or "(long)" in lowered) and self._vowel_length_row.search(line) is not None
+
+    def is_meta_line(self, line: str) -> bool:
+        if RAGA_SUBSECTION_PATTERN.search(line) or VILOMA_SUBSECTION_PATTERN.search(line):
+            return False
+        return self._metadata.search(line.lower()) is not None
+
 
 # Inline pronunciation-disambiguation digit (Modified HK): a digit glued to an Indic
 # consonant, e.g. "க3" (ga), "பா4" (bha), "விது4லு". Transliterated Carnatic lyric is
@@ -429,14 +611,59 @@ def strip_refrain_trailer(sections: list[DetectedSection]) -> list[DetectedSecti
 
 
 class StructureParser:
-    """Deterministic structure parser with Kotlin-parity heuristics."""
+    """Deterministic structure parser with Kotlin-parity heuristics.
+
+    Reentrant: per-parse state (the inline-abbreviation gates, annotated lines,
+    blocks) lives in locals and a `_ParseContext`, and the instance holds only
+    compiled matchers, configuration and the optional locked result cache, so
+    one parser can be shared by threads parsing different documents.
+    """
 
-    # When False, the translation-trailer strip is skipped. The repair tooling
-    # parses twice (with and without) to isolate exactly what the strip removed and
-    # confirm it is prose, never lyric. Production parsing leaves this True.
+    # When False (``trailer_strip=False``), the translation-trailer strip is
+    # skipped. The repair tooling parses twice (with and without) to isolate
+    # exactly what the strip removed and confirm it is prose, never lyric.
+    # Production parsing leaves this True.
     _trailer_strip_enabled = True
 
+    def __init__(self, cache_size: int = 0, *, trailer_strip: bool = True) -> None:
+        """``cache_size`` > 0 memoizes that many parse results (LRU).
+
+        Every caller gets its own lists: a cached result is handed out as a
+        copy of its (and its variants') lists, sharing only the frozen items.
+        """
+        self._line_classifier = _LineClassifier()
+        self._trailer_strip_enabled = trailer_strip
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, bool, int], StructureParseResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def parse(self, text: str) -> StructureParseResult:
+        if self._cache_size <= 0:
+            return self._parse(text)
+        key = (
+            sha256(text.encode("utf-8", "surrogatepass")).hexdigest(),
+            self._trailer_strip_enabled,
+            PARSER_VERSION,
+        )
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return _copy_result(cached)
+            self.cache_misses += 1
+        # Parsed outside the lock; threads missing on the same text at once each
+        # parse it, and the results are equal.
+        result = self._parse(text)
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return _copy_result(result)
+
+    def _parse(self, text: str) -> StructureParseResult:
         if not text.strip():
             return StructureParseResult()
 
@@ -464,16 +691,25 @@ class StructureParser:
         lyric_window_end = effective_boundaries[0].start_pos if effective_boundaries else len(source_text)
         lyric_text = source_text[:lyric_window_end]
 
-        blocks = self._build_blocks(lyric_text)
-        sections, ragamalika_subsections = self._extract_sections(blocks, lyric_text)
-        lyric_variants = self._extract_lyric_variants(blocks, lyric_text, sections)
+        # Lines are classified once; the lyric window and the post-boundary pass
+        # assemble their blocks from the same annotated lines. The inline
+        # abbreviation gates are probed on the whole document so every line
+        # carries the candidates either window may need.
+        document = _ParseContext.for_text(source_text)
+        lines = self._tokenize(lyric_text, 0, document)
+
+        context = _ParseContext.for_text(lyric_text)
+        blocks = self._build_blocks(lines, lyric_text, context)
+        sections, ragamalika_subsections = self._extract_sections(blocks, lyric_text, context)
+        lyric_variants = self._extract_lyric_variants(blocks, lyric_text, sections, context)
 
         # TRACK-100: Extract Indic-script variants from post-boundary region.
         # On many blogs, Indic scripts appear AFTER the first metadata boundary.
         if effective_boundaries and sections:
+            lines += self._tokenize(source_text[lyric_window_end:], lyric_window_end, document)
             existing_scripts = {v.script for v in lyric_variants}
             post_variants = self._extract_post_boundary_variants(
-                source_text, lyric_window_end, sections, existing_scripts
+                lines, source_text, document, lyric_window_end, sections, existing_scripts
             )
             lyric_variants.extend(post_variants)
 
@@ -490,16 +726,11 @@ class StructureParser:
     def parse_ragamalika_subsections(self, text: str) -> list[RagamalikaSubsection]:
         return self.parse(text).ragamalika_subsections
 
-    def _build_blocks(self, raw_text: str) -> list[_TextBlock]:
-        if not raw_text.strip():
-            return []
-
-        self._inline_pa_enabled = bool(_INLINE_CHARANAM_PROBE.search(raw_text))
-        self._inline_indic_pac_enabled = bool(_INLINE_INDIC_PAC_PROBE.search(raw_text))
-
-        tokens: list[_LineToken] = []
-        offset = 0
-        for raw_line in raw_text.splitlines(keepends=True):
+    def _tokenize(self, text: str, base_offset: int, document: _ParseContext) -> list[_SourceLine]:
+        """Annotate the non-blank lines of ``text`` (which starts at ``base_offset``)."""
+        lines: list[_SourceLine] = []
+        offset = base_offset
+        for raw_line in text.splitlines(keepends=True):
             line_without_newline = raw_line.rstrip("\n")
             stripped = line_without_newline.strip()
             if not stripped:
@@ -512,16 +743,30 @@ class StructureParser:
             offset += len(raw_line)
 
             normalized = self._normalize_line(stripped)
-            if not normalized or self._is_boilerplate(normalized):
+            if not normalized:
                 continue
-            tokens.append(_LineToken(text=normalized, start_pos=start_pos, end_pos=end_pos))
+            token = _LineToken(text=normalized, start_pos=start_pos, end_pos=end_pos)
+            if self._is_boilerplate(normalized):
+                lines.append(_SourceLine(token=token, boilerplate=True))
+                continue
+            header = self._header_candidates(normalized, document, language=True)
+            remainder_header = None
+            if header.header is not None and header.header.label in LANGUAGE_LABELS and header.header.remainder:
+                remainder_header = self._header_candidates(header.header.remainder, document)
+            lines.append(_SourceLine(token=token, boilerplate=False, header=header, remainder_header=remainder_header))
+        return lines
+
+    def _build_blocks(self, lines: list[_SourceLine], window_text: str, context: _ParseContext) -> list[_TextBlock]:
+        if not window_text.strip():
+            return []
 
-        if not tokens:
+        lines = [line for line in lines if not line.boilerplate]
+        if not lines:
             return []
 
         blocks: list[_TextBlock] = []
         current_label = "UNLABELED"
-        current_start = tokens[0].start_pos
+        current_start = lines[0].token.start_pos
         current_lines: list[_LineToken] = []
 
         def flush() -> None:
@@ -539,18 +784,23 @@ class StructureParser:
                 )
                 current_lines = []
 
-        for token in tokens:
-            header = self._detect_header(token.text)
+        for line in lines:
+            token = line.token
+            header = line.header.resolve(context) if line.header else None
             if header is not None:
                 flush()
                 current_label = header.label
                 current_start = token.start_pos
                 if header.remainder:
+                    remainder_header = (
+                        line.remainder_header.resolve(context) if line.remainder_header is not None else None
+                    )
                     current_lines.append(
                         _LineToken(
                             text=header.remainder,
                             start_pos=token.start_pos,
                             end_pos=token.end_pos,
+                            section_header=remainder_header,
                         )
                     )
                 continue
@@ -560,11 +810,18 @@ class StructureParser:
         flush()
         return blocks
 
-    def _detect_header(self, line: str) -> _HeaderMatch | None:
-        language = self._detect_language_header(line)
-        if language is not None:
-            return language
-        return self._detect_section_header(line)
+    def _header_candidates(self, line: str, context: _ParseContext, *, language: bool = False) -> _HeaderCandidates:
+        header = self._detect_language_header(line) if language else None
+        if header is None:
+            header = self._match_section_header(line)
+        if header is not None:
+            return _HeaderCandidates(header=header)
+        return _HeaderCandidates(
+            inline_pac=self._match_inline_header(INLINE_PAC_PATTERNS, line) if context.inline_pa_enabled else None,
+            inline_indic_pac=(
+                self._match_inline_header(INLINE_INDIC_PAC_PATTERNS, line) if context.inline_indic_pac_enabled else None
+            ),
+        )
 
     def _detect_language_header(self, line: str) -> _HeaderMatch | None:
         lowered = line.lower()
@@ -579,7 +836,10 @@ class StructureParser:
                 return _HeaderMatch(label=label, remainder=remainder)
         return None
 
-    def _detect_section_header(self, line: str) -> _HeaderMatch | None:
+    def _detect_section_header(self, line: str, context: _ParseContext = _NO_INLINE_HEADERS) -> _HeaderMatch | None:
+        return self._header_candidates(line, context).resolve(context)
+
+    def _match_section_header(self, line: str) -> _HeaderMatch | None:
         for pattern, label in SECTION_HEADER_PATTERNS:
             if pattern.search(line):
                 remainder = pattern.sub("", line, count=1).strip()
@@ -587,22 +847,19 @@ class StructureParser:
                 # TRACK-101: Strip residual numbers from "caraNam 1" / "svara sAhitya 2" headers
                 remainder = re.sub(r"^\d+\s*", "", remainder).strip()
                 return _HeaderMatch(label=label, remainder=remainder)
-        if getattr(self, "_inline_pa_enabled", False):
-            for pattern, label in INLINE_PAC_PATTERNS:
-                if pattern.search(line):
-                    remainder = pattern.sub("", line, count=1).strip()
-                    remainder = re.sub(r"^\d+\s*", "", remainder).strip()
-                    return _HeaderMatch(label=label, remainder=remainder)
-        if getattr(self, "_inline_indic_pac_enabled", False):
-            for pattern, label in INLINE_INDIC_PAC_PATTERNS:
-                if pattern.search(line):
-                    remainder = pattern.sub("", line, count=1).strip()
-                    remainder = re.sub(r"^\d+\s*", "", remainder).strip()
-                    return _HeaderMatch(label=label, remainder=remainder)
+        return None
+
+    @staticmethod
+    def _match_inline_header(patterns: list[tuple[re.Pattern[str], str]], line: str) -> _HeaderMatch | None:
+        for pattern, label in patterns:
+            if pattern.search(line):
+                remainder = pattern.sub("", line, count=1).strip()
+                remainder = re.sub(r"^\d+\s*", "", remainder).strip()
+                return _HeaderMatch(label=label, remainder=remainder)
         return None
 
     def _extract_sections(
-        self, blocks: list[_TextBlock], lyric_text: str
+        self, blocks: list[_TextBlock], lyric_text: str, context: _ParseContext
     ) -> tuple[list[DetectedSection], list[RagamalikaSubsection]]:
         ragamalika_subsections: list[RagamalikaSubsection] = []
 
@@ -666,11 +923,10 @@ class StructureParser:
             )
 
         # Assign sequential order to ragamalika subsections
-        for i, sub in enumerate(ragamalika_subsections):
-            sub.order = i + 1
+        ragamalika_subsections = [replace(sub, order=i + 1) for i, sub in enumerate(ragamalika_subsections)]
 
         if sections:
-            sections = self._demote_mks(sections)
+            sections = self._demote_mks(sections, context)
             sections = self._merge_dual_format(sections)
             return sections, ragamalika_subsections
 
@@ -688,7 +944,7 @@ class StructureParser:
             )
         ], []
 
-    def _demote_mks(self, sections: list[DetectedSection]) -> list[DetectedSection]:
+    def _demote_mks(self, sections: list[DetectedSection], context: _ParseContext) -> list[DetectedSection]:
         """Rule 1: MKS is never a top-level section — attach to preceding parent.
 
         If the MKS block contains an inline section header (e.g. చరణమ్ for Charanam),
@@ -698,7 +954,7 @@ class StructureParser:
         for section in sections:
             if section.section_type == SectionType.MADHYAMA_KALA:
                 # Check for inline section headers within MKS text
-                split_sections = self._split_mks_inline_headers(section)
+                split_sections = self._split_mks_inline_headers(section, context)
                 if split_sections:
                     mks_text, new_sections = split_sections
                     # Attach MKS text to parent
@@ -751,14 +1007,16 @@ class StructureParser:
             )
         return result
 
-    def _split_mks_inline_headers(self, mks_section: DetectedSection) -> tuple[str, list[DetectedSection]] | None:
+    def _split_mks_inline_headers(
+        self, mks_section: DetectedSection, context: _ParseContext
+    ) -> tuple[str, list[DetectedSection]] | None:
         """Check if MKS text contains inline section headers (e.g. చరణమ్).
 
         Returns (mks_text_before_header, [new_sections]) or None if no inline header found.
         """
         lines = mks_section.text.splitlines()
         for i, line in enumerate(lines):
-            header = self._detect_section_header(line.strip())
+            header = self._detect_section_header(line.strip(), context)
             if header is not None and header.label not in METADATA_LABELS:
                 section_type = SECTION_LABEL_TO_TYPE.get(header.label)
                 if section_type and section_type != SectionType.MADHYAMA_KALA:
@@ -867,16 +1125,18 @@ class StructureParser:
         blocks: list[_TextBlock],
         lyric_text: str,
         canonical_sections: list[DetectedSection],
+        context: _ParseContext,
     ) -> list[DetectedLyricVariant]:
         language_blocks_seen = any(block.label in LANGUAGE_LABELS - METADATA_LABELS for block in blocks)
         if language_blocks_seen:
-            return self._extract_language_header_variants(blocks, canonical_sections)
+            return self._extract_language_header_variants(blocks, canonical_sections, context)
         return self._extract_script_split_variants(lyric_text, canonical_sections)
 
     def _extract_language_header_variants(
         self,
         blocks: list[_TextBlock],
         canonical_sections: list[DetectedSection],
+        context: _ParseContext,
     ) -> list[DetectedLyricVariant]:
         variants: list[DetectedLyricVariant] = []
         current_label: str | None = None
@@ -887,7 +1147,7 @@ class StructureParser:
             if current_label is None:
                 return
             language, script = self._language_script_for_label(current_label)
-            sections = self._sections_from_variant_blocks(current_blocks, canonical_sections)
+            sections = self._sections_from_variant_blocks(current_blocks, canonical_sections, context)
             if sections:
                 variants.append(DetectedLyricVariant(language=language, script=script, sections=sections))
             current_label = None
@@ -915,13 +1175,15 @@ class StructureParser:
 
     def _extract_post_boundary_variants(
         self,
+        lines: list[_SourceLine],
         source_text: str,
+        context: _ParseContext,
         boundary_pos: int,
         canonical_sections: list[DetectedSection],
         existing_scripts: set[str],
     ) -> list[DetectedLyricVariant]:
         """TRACK-100: Extract Indic-script variants from text after the metadata boundary."""
-        all_blocks = self._build_blocks(source_text)
+        all_blocks = self._build_blocks(lines, source_text, context)
         post_blocks = [b for b in all_blocks if b.start_pos >= boundary_pos]
         if not post_blocks:
             return []
@@ -938,7 +1200,7 @@ class StructureParser:
                 return
             language, script = self._language_script_for_label(current_label)
             if script not in existing_scripts:
-                sections = self._sections_from_variant_blocks(current_blocks, canonical_sections)
+                sections = self._sections_from_variant_blocks(current_blocks, canonical_sections, context)
                 if sections:
                     variants.append(DetectedLyricVariant(language=language, script=script, sections=sections))
             current_label = None
@@ -971,6 +1233,7 @@ class StructureParser:
         self,
         blocks: list[_TextBlock],
         canonical_sections: list[DetectedSection],
+        context: _ParseContext,
     ) -> list[DetectedSection]:
         if not blocks:
             return []
@@ -996,7 +1259,7 @@ class StructureParser:
             )
 
         # Apply MKS demotion and dual-format merging to variant too
-        raw_sections = self._demote_mks(raw_sections)
+        raw_sections = self._demote_mks(raw_sections, context)
         raw_sections = self._merge_dual_format(raw_sections)
 
         # Map to canonical structure by matching type and sequential occurrence
@@ -1010,12 +1273,12 @@ class StructureParser:
         # after the language header without a "पल्लवि" section header.
         promoted_count = 0
         canonical_iter = iter(canonical_sections)
-        for s in raw_sections:
+        for i, s in enumerate(raw_sections):
             if s.section_type != SectionType.OTHER:
                 break
             canon = next(canonical_iter, None)
             if canon is not None:
-                s.section_type = canon.section_type
+                raw_sections[i] = replace(s, section_type=canon.section_type)
                 promoted_count += 1
 
         # Merge promoted sections into the following typed section when both
@@ -1084,8 +1347,10 @@ class StructureParser:
                 )
                 current_lines = []
 
+        # Lines straight from the source were already found not to be headers
+        # when the block was built; only a language header's remainder can be.
         for line in lines:
-            header = self._detect_section_header(line.text)
+            header = line.section_header
             if header is not None:
                 flush()
                 current_label = header.label
@@ -1164,15 +1429,18 @@ class StructureParser:
         return variants
 
     def _find_metadata_boundaries(self, text: str) -> list[MetadataBoundary]:
-        boundaries_by_pos: dict[int, MetadataBoundary] = {}
-        for label, pattern in METADATA_BOUNDARY_PATTERNS:
-            for match in pattern.finditer(text):
-                start = match.start()
-                existing = boundaries_by_pos.get(start)
-                candidate = MetadataBoundary(label=label, start_pos=start, end_pos=match.end())
-                if existing is None or candidate.end_pos > existing.end_pos:
-                    boundaries_by_pos[start] = candidate
-        return [boundaries_by_pos[pos] for pos in sorted(boundaries_by_pos)]
+        boundaries: list[MetadataBoundary] = []
+        for match in _METADATA_BOUNDARY_SCAN.finditer(text):
+            label = match.lastgroup or ""
+            end = match.end()
+            keyword_start = match.start(label)
+            # Longest match wins at a shared start; ties keep the earlier label.
+            for other_label, body in _METADATA_BOUNDARY_BODIES[_METADATA_BOUNDARY_RANK[label] + 1 :]:
+                other = body.match(text, keyword_start)
+                if other is not None and other.end() > end:
+                    label, end = other_label, other.end()
+            boundaries.append(MetadataBoundary(label=label, start_pos=match.start(), end_pos=end))
+        return boundaries
 
     def _normalize_line(self, line: str) -> str:
         if not line:
@@ -1180,62 +1448,10 @@ class StructureParser:
         return re.sub(r"[\u2080-\u2089]", "", line)
 
     def _is_boilerplate(self, line: str) -> bool:
-        lowered = line.lower()
-        # TRACK-103: Standalone "Back" navigation and "Meaning of Kriti" links
-        if lowered == "back":
-            return True
-        if lowered.startswith("meaning of kriti"):
-            return True
-        if "a i i u u" in lowered or "ch j jh" in lowered or "ph b bh m" in lowered:
-            return True
-        if "pronunciation guide" in lowered:
-            return True
-        # Devanagari vowel/consonant mapping lines (e.g. "ऎ,कॆ,चॆ.. - e,ke,ce..(short)")
-        if ("(short)" in lowered or "(long)" in lowered) and re.search(r"[\u0900-\u097F].*-\s*[a-zA-Z]", line):
-            return True
-        # Transliteration-key preamble lines (Modified HK chart at the top of each
-        # script block on Govindan blogs \u2014 ADR-015 head-capture fix). Three forms,
-        # all impossible in single-script lyric:
-        #   1. a comma-separated Indic consonant chart ("\u0B95,\u0B9A,\u0B9F,\u0BA4,\u0BAA - 2-\u0916 \u2026")
-        if re.match(r"^[\u0900-\u0D7F]\s*,\s*[\u0900-\u0D7F]", line):
-            return True
-        #   2. a cross-script mapping row \u2014 Devanagari mixed with another Indic
-        #      script ("\u0BB81 \u0936 - \u0936\u093F\u0935 - \u0B9A\u0BBF\u0BB5\u0BA9\u0BCD");
-        #      lyric is always one script per line.
-        if re.search(r"[\u0900-\u097F]", line) and re.search(r"[\u0B00-\u0D7F]", line):
-            return True
-        #   3. a parenthesised sandhi mapping, whole line ("(\u0B9A3 - \u0B9C)"); lyric
-        #      refrains like "(\u0BB5\u0BC7\u0B99\u0BCD\u0B95)" carry no ' - ' mapping arrow.
-        if re.match(r"^\s*\([^)]*\s-\s[^)]*\)\s*$", line):
-            return True
-        # Filter nOTTu-svara header — it's metadata not lyric content
-        if re.match(r"^\s*\(?n[oō]t+u[\s-]*svara\s+s[aā]hityam?\)?\.?\s*$", lowered):
-            return True
-        if lowered.startswith("updated on "):
-            return True
-        return any(
-            marker in lowered
-            for marker in (
-                "powered by blogger",
-                "newer post",
-                "older post",
-                "subscribe to",
-                "post a comment",
-                "blog archive",
-                "link to this post",
-                "posted by",
-                "all rights reserved",
-                "copyright",
-                "skip to main",
-                "related posts",
-            )
-        )
+        return self._line_classifier.is_boilerplate(line)
 
     def _is_meta_line(self, line: str) -> bool:
-        if RAGA_SUBSECTION_PATTERN.search(line) or VILOMA_SUBSECTION_PATTERN.search(line):
-            return False
-        lowered = line.lower()
-        return any(keyword in lowered for keyword in METADATA_KEYWORDS)
+        return self._line_classifier.is_meta_line(line)
 
     def _language_script_for_label(self, label: str) -> tuple[str, str]:
         mapping = {
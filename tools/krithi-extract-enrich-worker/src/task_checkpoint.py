@@ -0,0 +1,145 @@
+"""Durable per-task progress, so a retried PDF task resumes where it stopped.
+
+A claim only increments ``attempts``; without a record of partial work, a
+worker that dies on page 400 of a 500-page OCR task hands the retry nothing
+and it starts again from page 0. With checkpoints enabled, every OCR'd page
+and every finished Krithi segment is appended to a log as it is produced::
+
+    <cache_dir>/checkpoints/<task_id>.jsonl
+
+The first line identifies what the log is valid for: the source checksum and
+a fingerprint of the extraction settings (page range, OCR languages, DPI,
+extractor version...). A retry whose checksum or fingerprint differs starts a
+fresh log, so a changed source or an upgraded worker never reuses stale
+pages. Records are flushed as they are written; a record torn by a crash mid
+write is ignored on load. The worker discards the log once the task's
+results are committed, and logs of tasks that never finished are pruned by
+age.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import IO, Any
+from uuid import UUID
+
+from .schema import CanonicalExtraction
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCheckpoint:
+    """Append-only progress log for one task: OCR page text and finished segments."""
+
+    def __init__(self, path: Path, header: dict[str, str]) -> None:
+        self.path = path
+        # Page number (0-based) -> OCR text.
+        self.pages: dict[int, str] = {}
+        # Segment key -> finished extraction; None records a segment that was skipped.
+        self.segments: dict[str, CanonicalExtraction | None] = {}
+        self._file: IO[str] | None = None
+        if self._load(header):
+            self._file = path.open("a", encoding="utf-8")
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = path.open("w", encoding="utf-8")
+            self._append(header)
+
+    @property
+    def resumed(self) -> bool:
+        """Whether an earlier attempt left any completed work."""
+        return bool(self.pages or self.segments)
+
+    def record_page(self, page_num: int, text: str) -> None:
+        self.pages[page_num] = text
+        self._append({"page": page_num, "text": text})
+
+    def record_segment(self, key: str, extraction: CanonicalExtraction | None) -> None:
+        self.segments[key] = extraction
+        self._append({"segment": key, "result": extraction.to_json_dict() if extraction else None})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            raise RuntimeError(f"Checkpoint {self.path} is closed")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def _load(self, header: dict[str, str]) -> bool:
+        """Read an earlier attempt's log; False if there is none or it belongs to other input."""
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return False
+        torn = bool(lines) and not lines[-1].endswith("\n")
+        if torn:
+            # The process died mid write: drop the partial record.
+            lines.pop()
+        try:
+            if not lines or json.loads(lines[0]) != header:
+                return False
+            records = [json.loads(line) for line in lines[1:]]
+        except ValueError:
+            return False
+        for record in records:
+            if "page" in record:
+                self.pages[record["page"]] = record["text"]
+            elif record["result"] is None:
+                self.segments[record["segment"]] = None
+            else:
+                self.segments[record["segment"]] = CanonicalExtraction.model_validate(record["result"])
+        if torn:
+            self.path.write_text("".join(lines), encoding="utf-8")
+        return True
+
+
+class CheckpointStore:
+    """Checkpoint logs for in-flight tasks under ``<cache_dir>/checkpoints``."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def open(self, task_id: UUID, checksum: str, fingerprint: str) -> TaskCheckpoint:
+        """The task's checkpoint, resumed if an earlier attempt processed the same input."""
+        checkpoint = TaskCheckpoint(
+            self._path(task_id),
+            {"task_id": str(task_id), "checksum": checksum, "fingerprint": fingerprint},
+        )
+        if checkpoint.resumed:
+            logger.info(
+                "Resuming task from checkpoint",
+                extra={
+                    "task_id": str(task_id),
+                    "pages_done": len(checkpoint.pages),
+                    "segments_done": len(checkpoint.segments),
+                },
+            )
+        return checkpoint
+
+    def discard(self, task_id: UUID) -> None:
+        """Remove a task's log once its results are committed."""
+        self._path(task_id).unlink(missing_ok=True)
+
+    def prune(self, max_age_s: float) -> int:
+        """Remove logs untouched for ``max_age_s`` (tasks that failed for good); returns the count."""
+        cutoff = time.time() - max_age_s
+        removed = 0
+        for path in self.root.glob("*.jsonl"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
+
+    def _path(self, task_id: UUID) -> Path:
+        return self.root / f"{task_id}.jsonl"
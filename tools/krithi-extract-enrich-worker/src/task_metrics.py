@@ -0,0 +1,83 @@
+"""Per-task stage timings and counters.
+
+A task's total `duration_ms` does not say whether it was slow in the
+download, PyMuPDF, OCR, parsing, identity discovery or Gemini. The worker
+wraps each task in `collect()`; code anywhere below it marks its work with
+`stage()` and `count()` and it is attributed to that task without threading
+a collector through every strategy, parser and enricher signature::
+
+    with task_metrics.collect() as metrics:
+        with task_metrics.stage("download"):
+            ...
+        task_metrics.count("segments", len(segments))
+    metrics.as_dict()  # {"stages_ms": {"download": 12.4}, "counters": {"segments": 3}}
+
+Stage times are wall-clock and inclusive; a stage entered repeatedly (once
+per segment, say) accumulates. Outside `collect()`, as in the CLI or the
+unit tests, both calls are no-ops. The collector lives in a context
+variable, so threads and asyncio tasks never see each other's metrics.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+
+class TaskMetrics:
+    """Accumulated stage durations (ms) and counters for one task."""
+
+    def __init__(self) -> None:
+        self.stages_ms: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+    def add_time(self, name: str, elapsed_ms: float) -> None:
+        self.stages_ms[name] = self.stages_ms.get(name, 0.0) + elapsed_ms
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready snapshot, as persisted to `extraction_queue.stage_metrics`."""
+        return {
+            "stages_ms": {name: round(ms, 1) for name, ms in self.stages_ms.items()},
+            "counters": dict(self.counters),
+        }
+
+
+_current: ContextVar[TaskMetrics | None] = ContextVar("task_metrics", default=None)
+
+
+@contextmanager
+def collect() -> Iterator[TaskMetrics]:
+    """Attribute every `stage()` and `count()` in the block to a fresh `TaskMetrics`."""
+    metrics = TaskMetrics()
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a block into the current task's named stage."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_time(name, (time.perf_counter() - started) * 1000)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add to one of the current task's counters."""
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.count(name, n)
@@ -0,0 +1,110 @@
+"""Opt-in cProfile capture for individual queue tasks.
+
+Stage timings (:mod:`src.task_metrics`) say *which* stage of a slow task
+was slow; when a single source makes `StructureParser` crawl or a PDF's
+segmentation explode, the next question is which functions. A task is
+profiled when `SG_PROFILE_TASKS` samples it (a ratio, 0.0-1.0) or its
+request payload carries `"profile": true`::
+
+    if task_profiler.wants_profile(task, config.profile_tasks):
+        with task_profiler.TaskProfile(task.id, profile_dir) as profile:
+            ...
+        profile.summary  # {"path": ".../<task id>.pstats", "total_ms": ..., "top": [...]}
+
+The full pstats file (`python -m pstats <file>`, snakeviz, ...) is written
+under the cache directory keyed by task id; a later attempt of the same task
+overwrites it, and `prune_profiles` removes files older than
+`SG_PROFILE_MAX_AGE_S` after each new one is written. `summary` keeps the top functions by cumulative time for the
+task's diagnostics. cProfile sees only the thread that enabled it, so HTML
+prefetch workers are not included. With sampling off and no payload flag a
+task runs exactly as before: no profiler is created or enabled.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import random
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from uuid import UUID
+
+from .db import ExtractionTask
+
+# Functions kept in the persisted summary, by cumulative time.
+TOP_FUNCTIONS = 15
+
+
+def wants_profile(task: ExtractionTask, ratio: float) -> bool:
+    """Whether this task should run under the profiler."""
+    if task.request_payload.get("profile") is True:
+        return True
+    return ratio > 0 and random.random() < ratio
+
+
+def prune_profiles(directory: Path, max_age_s: float) -> int:
+    """Remove pstats files older than ``max_age_s``; returns the count."""
+    cutoff = time.time() - max_age_s
+    removed = 0
+    for path in directory.glob("*.pstats"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+def _label(key: tuple[str, int, str]) -> str:
+    filename, line, name = key
+    if filename == "~":
+        return name  # builtins, e.g. "<built-in method builtins.sorted>"
+    return f"{Path(filename).name}:{line}({name})"
+
+
+class TaskProfile:
+    """Profiles the enclosed block and writes `<directory>/<task_id>.pstats` on exit."""
+
+    def __init__(self, task_id: UUID, directory: Path, *, top: int = TOP_FUNCTIONS) -> None:
+        self.path = directory / f"{task_id}.pstats"
+        self.top = top
+        self.summary: dict[str, Any] = {}
+        self._profiler = cProfile.Profile()
+        self._started = 0.0
+
+    def __enter__(self) -> TaskProfile:
+        self._started = time.perf_counter()
+        self._profiler.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._profiler.disable()
+        total_ms = (time.perf_counter() - self._started) * 1000
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._profiler.dump_stats(str(self.path))
+
+        # (file, line, function) -> (primitive calls, calls, tottime, cumtime, callers); untyped in typeshed.
+        # get_stats_profile() is typed but keys by bare function name, merging same-named methods.
+        stats = pstats.Stats(self._profiler).stats  # type: ignore[attr-defined]
+        ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[: self.top]
+        self.summary = {
+            "path": str(self.path),
+            "total_ms": round(total_ms, 1),
+            "top": [
+                {
+                    "function": _label(key),
+                    "calls": calls,
+                    "tottime_ms": round(tottime * 1000, 1),
+                    "cumtime_ms": round(cumtime * 1000, 1),
+                }
+                for key, (_, calls, tottime, cumtime, _) in ranked
+            ],
+        }
@@ -0,0 +1,160 @@
+"""Split large anthology PDFs into page-range shard tasks.
+
+A whole-document `extraction_queue` row is processed by a single worker, so a
+900-page anthology keeps one worker busy while the others idle. This module
+plans page-range shards for such documents; the worker enqueues them as child
+tasks (``parent_extraction_id``) that any worker can claim.
+
+Shard boundaries must never cut a composition in half. For born-digital PDFs
+the planner runs a fast title scan (the `PageSegmenter` title heuristics over
+line-level text, no Velthuis decoding or per-span blocks) and only cuts at
+pages where a Krithi title opens the page. Scanned PDFs go through OCR, which
+already emits one result per page, so any page boundary is safe there.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from .extractor import DocumentContent, PageContent, TextBlock
+from .page_segmenter import PageSegmenter
+
+logger = logging.getLogger(__name__)
+
+
+class TaskSplitter:
+    """Plan page-range shards for a large PDF, aligned to Krithi starts."""
+
+    # A title counts as opening its page when it sits in the top band, matching
+    # the "near the top of a page" rule in PageSegmenter._has_metadata_nearby.
+    TOP_OF_PAGE_FRACTION = 0.15
+
+    def __init__(
+        self,
+        page_segmenter: PageSegmenter,
+        page_threshold: int = 200,
+        target_pages: int = 50,
+    ) -> None:
+        """Initialize the splitter.
+
+        Args:
+            page_segmenter: Segmenter whose title heuristics locate Krithi starts.
+            page_threshold: Documents with at most this many pages are not split.
+            target_pages: Preferred shard size; boundaries snap to the next
+                          Krithi start at or after this many pages.
+        """
+        self.page_segmenter = page_segmenter
+        self.page_threshold = page_threshold
+        self.target_pages = target_pages
+
+    def plan(self, pdf_path: str | Path, *, text_extractable: bool) -> list[tuple[int, int]]:
+        """Return 0-based inclusive shard ranges, or [] when the PDF should not be split.
+
+        Args:
+            pdf_path: Path to the PDF file.
+            text_extractable: Whether the document takes the native text path.
+                              False routes to OCR, where any page boundary is safe.
+        """
+        with fitz.open(str(pdf_path)) as doc:
+            total_pages = len(doc)
+            if total_pages <= self.page_threshold:
+                return []
+
+            if text_extractable:
+                boundaries = self._title_start_pages(doc)
+            else:
+                boundaries = list(range(1, total_pages))
+
+        shards = self._group(boundaries, total_pages)
+        logger.info(
+            "Planned document shards",
+            extra={
+                "path": str(pdf_path),
+                "total_pages": total_pages,
+                "candidate_boundaries": len(boundaries),
+                "shards": len(shards),
+            },
+        )
+        return shards if len(shards) >= 2 else []
+
+    def _title_start_pages(self, doc: fitz.Document) -> list[int]:
+        """Pages (0-based) whose first Krithi title opens the page."""
+        document = self._scan_document(doc)
+        segments = self.page_segmenter.segment(document)
+        if len(segments) < 2:
+            # No titles found: the document is one opaque block and cannot be
+            # split without risking a cut through a composition.
+            return []
+
+        heights = {page.page_number: page.height for page in document.pages}
+        starts: list[int] = []
+        seen_pages: set[int] = set()
+        for segment in segments:
+            if segment.start_page in seen_pages or not segment.header_blocks:
+                continue
+            seen_pages.add(segment.start_page)
+            title = segment.header_blocks[0]
+            if segment.start_page > 0 and title.y0 <= heights[segment.start_page] * self.TOP_OF_PAGE_FRACTION:
+                starts.append(segment.start_page)
+        return starts
+
+    @staticmethod
+    def _scan_document(doc: fitz.Document) -> DocumentContent:
+        """Line-level text with font metadata — enough for title detection.
+
+        One TextBlock per line rather than per span, no image blocks and no
+        Velthuis decoding: the scan only needs font size, boldness and position.
+        """
+        pages: list[PageContent] = []
+        for page_num, page in enumerate(doc):
+            blocks: list[TextBlock] = []
+            for block in page.get_text("dict", flags=0).get("blocks", []):
+                for line in block.get("lines", []):
+                    spans = [span for span in line.get("spans", []) if span.get("text", "").strip()]
+                    if not spans:
+                        continue
+                    x0, y0, x1, y1 = line.get("bbox", (0, 0, 0, 0))
+                    blocks.append(
+                        TextBlock(
+                            text=" ".join(span["text"].strip() for span in spans),
+                            page_number=page_num,
+                            x0=x0,
+                            y0=y0,
+                            x1=x1,
+                            y1=y1,
+                            font_size=max(span.get("size", 0.0) for span in spans),
+                            font_name=spans[0].get("font", ""),
+                            is_bold=any(
+                                span.get("flags", 0) & 16 or "bold" in span.get("font", "").lower() for span in spans
+                            ),
+                        )
+                    )
+            pages.append(
+                PageContent(
+                    page_number=page_num,
+                    text="\n".join(block.text for block in blocks),
+                    blocks=blocks,
+                    width=page.rect.width,
+                    height=page.rect.height,
+                )
+            )
+        return DocumentContent(pages=pages, total_pages=len(doc), checksum="", source_path=doc.name)
+
+    def _group(self, boundaries: list[int], total_pages: int) -> list[tuple[int, int]]:
+        """Greedily cut at the first safe boundary once a shard reaches the target size."""
+        shards: list[tuple[int, int]] = []
+        start = 0
+        for boundary in sorted(set(boundaries)):
+            if boundary - start >= self.target_pages:
+                shards.append((start, boundary - 1))
+                start = boundary
+        shards.append((start, total_pages - 1))
+
+        # Fold a small tail into its predecessor rather than spend a task on it.
+        if len(shards) >= 2 and shards[-1][1] - shards[-1][0] + 1 < self.target_pages // 2:
+            tail = shards.pop()
+            shards[-1] = (shards[-1][0], tail[1])
+        return shards
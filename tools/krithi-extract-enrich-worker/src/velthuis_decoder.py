@@ -145,29 +145,42 @@ _GLYPH_MAP: dict[int, str] = {
     46: ".",  # period / danda placeholder
 }
 
-# Characters that are left-side mātrās in Devanagari (drawn before
-# consonant visually, but encoded after consonant in Unicode)
-_LEFT_MATRAS = {"\u093f"}  # ि (i-mātrā)
-
-# Devanagari consonant range (U+0915–U+0939) and virāma
-_CONSONANT_RANGE = range(0x0915, 0x093A)
-_VIRAMA = "\u094d"
-
-
-def _is_consonant(ch: str) -> bool:
-    return len(ch) == 1 and ord(ch) in _CONSONANT_RANGE
-
+_GLYPH_TABLE = str.maketrans({chr(code): text for code, text in _GLYPH_MAP.items()})
+
+# Left-side i-mātrā (ि): drawn before its consonant cluster, so Velthuis emits
+# it first, while Unicode stores it after the cluster. The cluster is a run of
+# consonants (U+0915–U+0939), each optionally followed by a virāma.
+_I_MATRA = "\u093f"
+_LEFT_MATRA_CLUSTER = re.compile("\u093f((?:[\u0915-\u0939]\u094d?)+)")
+
+# Independent vowel + mātrā split across spans: अ+ा → आ, इ+ी → ई, उ+ू → ऊ.
+_VOWEL_MERGES = {
+    "\u0905\u093e": "\u0906",
+    "\u0907\u0940": "\u0908",
+    "\u0909\u0942": "\u090a",
+}
+_VOWEL_PAIR = re.compile("|".join(_VOWEL_MERGES))
 
-def _is_half_form(s: str) -> bool:
-    """Check if a string is a half-form (consonant + virāma)."""
-    return len(s) == 2 and _is_consonant(s[0]) and s[1] == _VIRAMA
+# Decoded spans kept per decoder. Anthologies repeat the same words, section
+# labels and headers on every page, so most spans after the first few pages
+# are hits.
+DECODE_CACHE_SIZE = 4096
 
 
 class VelthuisDecoder:
     """Decode text from Velthuis-dvng* TeX fonts to Unicode Devanagari."""
 
-    def __init__(self) -> None:
-        self._glyph_map = dict(_GLYPH_MAP)
+    def __init__(self, cache_size: int = DECODE_CACHE_SIZE, glyph_map: dict[int, str] | None = None) -> None:
+        """Initialize the decoder.
+
+        Args:
+            cache_size: Decoded spans memoized before the memo is reset.
+            glyph_map: Glyph code → Unicode for a specific font (see
+                       `FontEncodingRegistry`); defaults to the dvng10 map.
+        """
+        self._table = _GLYPH_TABLE if glyph_map is None else str.maketrans({chr(c): t for c, t in glyph_map.items()})
+        self._cache: dict[str, str] = {}
+        self._cache_size = cache_size
 
     def decode_text(self, raw_text: str) -> str:
         """Decode a raw text string from Velthuis font to Unicode Devanagari.
@@ -178,79 +191,48 @@ class VelthuisDecoder:
         Returns:
             Unicode Devanagari string with mātrā reordering applied.
         """
-        # Step 1: Map each byte/char to its Unicode equivalent
-        decoded_parts: list[str] = []
-        for ch in raw_text:
-            code = ord(ch)
-            if code in self._glyph_map:
-                decoded_parts.append(self._glyph_map[code])
-            else:
-                # Unknown glyph — pass through (could be punctuation from
-                # another font that bled into this span)
-                decoded_parts.append(ch)
-
-        result = "".join(decoded_parts)
+        cached = self._cache.get(raw_text)
+        if cached is not None:
+            return cached
+
+        # Step 1: Map each glyph code to Unicode; unknown glyphs pass through
+        # (punctuation from another font that bled into this span).
+        result = raw_text.translate(self._table)
 
         # Step 2: Reorder left-side mātrās
-        result = self._reorder_matras(result)
+        if _I_MATRA in result:
+            result = self._reorder_matras(result)
 
         # Step 3: Merge independent vowel + mātrā sequences
         result = self._merge_vowels(result)
 
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+        self._cache[raw_text] = result
         return result
 
-    def _reorder_matras(self, text: str) -> str:
+    @staticmethod
+    def _reorder_matras(text: str) -> str:
         """Reorder left-side mātrā (ि) to appear after its consonant cluster.
 
         In Velthuis font encoding, i-mātrā appears BEFORE the consonant
         in the byte stream (visual order).  Unicode requires it AFTER.
 
         For consonant clusters like न्ति (halfna + ta + imatra), the
-        mātrā needs to be placed after the entire cluster.
+        mātrā needs to be placed after the entire cluster. The mātrā moves
+        past every consonant (with or without virāma) that follows it, in
+        one left-to-right pass.
         """
-        result: list[str] = list(text)
-        i = 0
-        while i < len(result):
-            if result[i] in _LEFT_MATRAS:
-                matra = result[i]
-                # Find the end of the consonant cluster following the mātrā
-                j = i + 1
-                while j < len(result):
-                    ch = result[j]
-                    if _is_consonant(ch):
-                        # Check if next char is virāma (making this a half-form)
-                        if j + 1 < len(result) and result[j + 1] == _VIRAMA:
-                            j += 2  # Skip consonant + virāma, continue cluster
-                        else:
-                            j += 1  # Final consonant of cluster
-                            break
-                    else:
-                        break
-
-                if j > i + 1:
-                    # Move mātrā to after the consonant cluster
-                    del result[i]
-                    result.insert(j - 1, matra)
-                else:
-                    i += 1
-                    continue
-            i += 1
-
-        return "".join(result)
-
-    def _merge_vowels(self, text: str) -> str:
-        """Merge independent vowel अ + ā-mātrā ा → आ.
+        return _LEFT_MATRA_CLUSTER.sub(r"\1" + _I_MATRA, text)
+
+    @staticmethod
+    def _merge_vowels(text: str) -> str:
+        """Merge independent vowel + mātrā pairs (अ + ा → आ, इ + ी → ई, उ + ू → ऊ).
 
         When a vowel and its mātrā appear in separate spans, the decoder
         produces अा instead of आ.
         """
-        # अ + ा → आ
-        text = text.replace("\u0905\u093e", "\u0906")
-        # इ + ी → ई  (less common but possible)
-        text = text.replace("\u0907\u0940", "\u0908")
-        # उ + ू → ऊ
-        text = text.replace("\u0909\u0942", "\u090a")
-        return text
+        return _VOWEL_PAIR.sub(lambda match: _VOWEL_MERGES[match.group()], text)
 
     @staticmethod
     def is_velthuis_font(font_name: str) -> bool:
@@ -271,6 +253,8 @@ class VelthuisDecoder:
         Returns:
             Dict mapping byte positions to glyph names, or None.
         """
+        from .font_encoding import parse_encoding_vector
+
         try:
             import fitz
 
@@ -280,11 +264,7 @@ class VelthuisDecoder:
             # bug class, followed up after that track's named-file scope).
             with fitz.open(pdf_path) as doc:
                 stream = doc.xref_stream_raw(xref)
-            decompressed = zlib.decompress(stream)
-            # First ~4200 bytes contain the encoding vector
-            header = decompressed[:5000].decode("latin-1")
-            entries = re.findall(r"dup\s+(\d+)\s+/(\S+)\s+put", header)
-            return {int(pos): name for pos, name in entries} if entries else None
+            return parse_encoding_vector(zlib.decompress(stream))
         except Exception:
             logger.debug("Could not extract encoding from xref %d", xref, exc_info=True)
             return None
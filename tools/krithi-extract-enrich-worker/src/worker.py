@@ -17,6 +17,31 @@ Environment variables:
     SG_ENABLE_GEMINI_ENRICHMENT: Enable optional Gemini metadata fill for missing fields
     SG_ENABLE_IDENTITY_DISCOVERY: Enable RapidFuzz identity candidates for composer/raga
     EXTRACTION_POLL_INTERVAL_S: Seconds between poll attempts (default: 5)
+    SG_ENABLE_TASK_SHARDING: Split large whole-document PDF tasks into page-range shards
+    SG_SHARD_PAGE_THRESHOLD: Page count above which a PDF is sharded (default: 200)
+    SG_SHARD_TARGET_PAGES: Preferred pages per shard (default: 50)
+    SG_STALE_CLAIM_TIMEOUT_S: Requeue PROCESSING claims older than this; roll up stalled parents (default: 6h)
+    SG_TASK_CHECKPOINTS: Log OCR pages/finished segments so a retried PDF task resumes (default: false)
+    SG_CHECKPOINT_MAX_AGE_S: Age after which abandoned task checkpoints are pruned (default: 7 days)
+    SG_DOCUMENT_CACHE: off, write (cache extracted PDF text) or reparse (start from it) (default: off)
+    SG_DOCUMENT_CACHE_MAX_BYTES: Document cache budget before LRU eviction (default: 2 GiB, 0 = unbounded)
+    SG_RESULT_PERSISTENCE: payload (one result_payload JSONB) or rows (COPY into extraction_results) (default: payload)
+    EXTRACTION_CACHE_DIR: Source artifact store root (default: /app/cache)
+    EXTRACTION_CACHE_MAX_BYTES: Artifact store budget before LRU eviction (default: 10 GiB, 0 = unbounded)
+    EXTRACTION_CACHE_REVALIDATE: Revalidate cached sources with conditional GETs (default: false)
+    SG_PREFETCH_BATCH_SIZE: Pending HTML pages to fetch concurrently on a cache miss (default: 0 = off)
+    SG_FETCH_PER_HOST_LIMIT: Concurrent requests per source host when prefetching (default: 4)
+    SG_FETCH_HOST_DELAY_S: Minimum seconds between request starts to one host (default: 0.25)
+    SG_PDF_STRIP_RUNNING_HEADERS: Drop recurring header/footer lines from born-digital PDF text (default: false)
+    SG_PDF_FONT_ENCODINGS: Derive glyph maps for legacy Type 1 fonts from embedded encodings (default: true)
+    SG_OCR_BACKEND: OCR engine: auto, tesserocr (persistent) or pytesseract (default: auto)
+    SG_OCR_PREFLIGHT: Skip blank/plate pages and crop to text regions before OCR (default: true)
+    SG_METRICS_PORT: Port for /metrics, /healthz and /readyz (default: 9108, 0 = off)
+    SG_METRICS_HOST: Interface the metrics endpoint binds (default: 0.0.0.0)
+    SG_QUEUE_STATS_INTERVAL_S: Seconds between queue-depth samples for /metrics (default: 30)
+    SG_LIVENESS_MAX_STALL_S: Seconds without loop progress before /healthz fails (default: 3600)
+    SG_PROFILE_TASKS: Fraction of tasks run under cProfile, as does payload "profile": true (default: 0 = off)
+    SG_PROFILE_MAX_AGE_S: Age after which written pstats files are removed (default: 7 days, 0 = keep)
     LOG_LEVEL: Logging level (default: INFO)
 """
 
@@ -25,10 +50,14 @@ import signal
 import sys
 import time
 import traceback
+import urllib.request
+from pathlib import Path
 from types import FrameType
 
+from . import task_metrics, task_profiler
 from .config import ExtractorConfig, load_config
 from .db import ExtractionQueueDB, ExtractionTask
+from .document_cache import DocumentCache
 from .extraction_strategies import (
     DocxExtractionStrategy,
     ExtractionStrategy,
@@ -37,19 +66,30 @@ from .extraction_strategies import (
     PdfExtractionStrategy,
 )
 from .extractor import PdfExtractor
+from .font_encoding import FontEncodingRegistry
 from .gemini_enricher import GeminiEnricherConfig, GeminiMetadataEnricher
 from .html_extractor import HtmlTextExtractor
 from .identity_candidates import IdentityCandidateDiscovery, ReferenceEntity
 from .metadata_parser import MetadataParser
-from .normalizer import normalize_for_matching
+from .normalizer import normalization_cache_stats, normalize_for_matching
 from .ocr_fallback import OcrFallback
 from .page_segmenter import PageSegmenter
 from .schema import CanonicalExtraction, CanonicalIdentityCandidates
 from .structure_parser import StructureParser
+from .task_checkpoint import CheckpointStore
+from .task_splitter import TaskSplitter
 from .transliterator import Transliterator
+from .worker_metrics import MetricsServer, TaskOutcome, WorkerMetrics
 
 logger = logging.getLogger(__name__)
 
+# Confidence recorded for pattern-matched results; a Gemini enrichment that
+# was applied reports its own.
+PATTERN_MATCH_CONFIDENCE = 0.7
+
+# Seconds between sweeps for stale claims and stalled sharded parents.
+REAP_INTERVAL_S = 300
+
 
 class ExtractionWorker:
     """Queue coordinator: polls extraction_queue and dispatches tasks to strategies."""
@@ -67,19 +107,49 @@ class ExtractionWorker:
         self._identity_discovery: IdentityCandidateDiscovery | None = None
         self._identity_catalog_loaded_at_monotonic = 0.0
         self._shutdown = False
+        self.metrics = WorkerMetrics(liveness_max_stall_s=config.liveness_max_stall_s)
+        self.metrics.identity_catalog_age = self._identity_catalog_age
+        self._metrics_server: MetricsServer | None = None
+        self._next_queue_sample = 0.0
+        self._next_reap = 0.0
 
+        self.checkpoints = CheckpointStore(Path(config.cache_dir) / "checkpoints") if config.task_checkpoints else None
         structure_parser = StructureParser()
         metadata_parser = MetadataParser()
         transliterator = Transliterator()
+        page_segmenter = PageSegmenter()
         self.pdf_strategy = PdfExtractionStrategy(
             config,
             self._finalize_extraction,
-            pdf_extractor=PdfExtractor(),
-            page_segmenter=PageSegmenter(),
-            ocr_fallback=OcrFallback(),
+            pdf_extractor=PdfExtractor(
+                strip_running_headers=config.pdf_strip_running_headers,
+                font_registry=(
+                    FontEncodingRegistry(Path(config.cache_dir) / "font-encodings")
+                    if config.pdf_font_encodings
+                    else None
+                ),
+            ),
+            page_segmenter=page_segmenter,
+            ocr_fallback=OcrFallback(backend=config.ocr_backend, preflight=config.ocr_preflight),
             structure_parser=structure_parser,
             metadata_parser=metadata_parser,
             transliterator=transliterator,
+            task_splitter=(
+                TaskSplitter(
+                    page_segmenter,
+                    page_threshold=config.shard_page_threshold,
+                    target_pages=config.shard_target_pages,
+                )
+                if config.enable_task_sharding
+                else None
+            ),
+            checkpoints=self.checkpoints,
+            document_cache=(
+                DocumentCache(Path(config.cache_dir) / "documents", max_bytes=config.document_cache_max_bytes)
+                if config.document_cache != "off"
+                else None
+            ),
+            reparse=config.document_cache == "reparse",
         )
         self.html_strategy = HtmlExtractionStrategy(
             config,
@@ -110,7 +180,15 @@ class ExtractionWorker:
             },
         )
 
+        if self.config.metrics_port:
+            self._metrics_server = MetricsServer(self.metrics, self.config.metrics_host, self.config.metrics_port)
+            self._metrics_server.start()
+
         self.db.connect()
+        if self.checkpoints is not None and self.config.checkpoint_max_age_s:
+            pruned = self.checkpoints.prune(self.config.checkpoint_max_age_s)
+            if pruned:
+                logger.info("Pruned abandoned task checkpoints", extra={"count": pruned})
 
         # Register signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._signal_handler)
@@ -118,8 +196,13 @@ class ExtractionWorker:
 
         while not self._shutdown:
             try:
+                self._sample_queue_stats()
+                self._reap_queue()
                 task = self.db.claim_pending_task()
-                if task:
+                self.metrics.heartbeat(db_ready=True)
+                if task and task_profiler.wants_profile(task, self.config.profile_tasks):
+                    self._process_task_profiled(task)
+                elif task:
                     self._process_task(task)
                 else:
                     time.sleep(self.config.poll_interval_s)
@@ -128,6 +211,7 @@ class ExtractionWorker:
                 break
             except Exception:
                 logger.exception("Unexpected error in worker loop")
+                self.metrics.heartbeat(db_ready=False)
                 # Rollback to clear any aborted transaction state
                 try:
                     self.db.conn.rollback()
@@ -136,10 +220,24 @@ class ExtractionWorker:
                 time.sleep(self.config.poll_interval_s)
 
         self.close()
+        for stats in normalization_cache_stats():
+            logger.info(
+                "Normalizer cache",
+                extra={
+                    "cache": stats.name,
+                    "hits": stats.hits,
+                    "misses": stats.misses,
+                    "size": stats.size,
+                    "hit_rate": round(stats.hit_rate, 3),
+                },
+            )
         logger.info("Worker stopped")
 
     def close(self) -> None:
-        """Release worker-owned resources: strategy HTTP pools, then the DB."""
+        """Release worker-owned resources: the metrics endpoint, strategy HTTP pools, then the DB."""
+        if self._metrics_server is not None:
+            self._metrics_server.close()
+            self._metrics_server = None
         for strategy in self.strategies.values():
             strategy.close()
         self.db.close()
@@ -148,9 +246,55 @@ class ExtractionWorker:
         """Handle SIGTERM/SIGINT for graceful shutdown."""
         logger.info(f"Received signal {signum}, initiating graceful shutdown")
         self._shutdown = True
+        self.metrics.shutting_down()
+
+    def _sample_queue_stats(self) -> None:
+        """Refresh the queue-depth gauges at most once per SG_QUEUE_STATS_INTERVAL_S."""
+        if not self._metrics_server or time.monotonic() < self._next_queue_sample:
+            return
+        self._next_queue_sample = time.monotonic() + self.config.queue_stats_interval_s
+        self.metrics.set_queue_stats(self.db.get_queue_stats())
+
+    def _reap_queue(self) -> None:
+        """Requeue stale claims and finish stalled sharded parents, at most once per REAP_INTERVAL_S."""
+        if not self.config.stale_claim_timeout_s or time.monotonic() < self._next_reap:
+            return
+        self._next_reap = time.monotonic() + REAP_INTERVAL_S
+        requeued = self.db.requeue_stale_claims(self.config.stale_claim_timeout_s)
+        rolled_up = self.db.roll_up_stalled_parents()
+        if requeued or rolled_up:
+            logger.info("Queue sweep", extra={"requeued_claims": requeued, "rolled_up_parents": rolled_up})
+
+    def _identity_catalog_age(self) -> float | None:
+        if self._identity_discovery is None:
+            return None
+        return time.monotonic() - self._identity_catalog_loaded_at_monotonic
+
+    def _process_task_profiled(self, task: ExtractionTask) -> None:
+        """Process a task under cProfile, then attach its top functions to the task's stage_metrics."""
+        profile_dir = Path(self.config.cache_dir) / "profiles"
+        with task_profiler.TaskProfile(task.id, profile_dir) as profile:
+            self._process_task(task)
+        logger.info(
+            "Task profile written",
+            extra={"task_id": str(task.id), "path": profile.summary["path"], "total_ms": profile.summary["total_ms"]},
+        )
+        if self.config.profile_max_age_s:
+            pruned = task_profiler.prune_profiles(profile_dir, self.config.profile_max_age_s)
+            if pruned:
+                logger.info("Pruned old task profiles", extra={"count": pruned})
+        try:
+            self.db.attach_profile(task.id, profile.summary)
+        except Exception:
+            # The task outcome is already committed; the pstats file remains on disk.
+            logger.exception("Failed to record profile for task %s", task.id)
+            try:
+                self.db.conn.rollback()
+            except Exception:
+                pass
 
     def _process_task(self, task: ExtractionTask) -> None:
-        """Process a single extraction task."""
+        """Process a single extraction task, recording per-stage metrics with its outcome."""
         start_time = time.monotonic()
         logger.info(
             "Processing task",
@@ -162,54 +306,149 @@ class ExtractionWorker:
             },
         )
 
-        try:
-            strategy = self.strategies.get(task.source_format)
-            if strategy is None:
-                raise ValueError(f"Unsupported source format: {task.source_format}")
-
-            results = strategy.extract(task)
-
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            result_dicts = [r.to_json_dict() for r in results]
-            extraction_method = results[0].extraction_method if results else strategy.default_extraction_method
+        outcome: TaskOutcome = "failed"
+        with task_metrics.collect() as metrics:
+            try:
+                outcome = self._run_task(task, start_time, metrics)
+            except Exception as e:
+                duration_ms = int((time.monotonic() - start_time) * 1000)
+                logger.error(
+                    "Task %s failed after %dms: %s",
+                    task.id,
+                    duration_ms,
+                    e,
+                    exc_info=True,
+                )
+                error_detail = {
+                    "message": str(e),
+                    "type": type(e).__name__,
+                    "traceback": traceback.format_exc(),
+                    "duration_ms": duration_ms,
+                    "attempt": task.attempts,
+                }
+                self.db.mark_failed(task.id, error_detail, stage_metrics=metrics.as_dict())
+        self.metrics.observe_task(task.source_format, outcome, time.monotonic() - start_time, metrics)
+        self.metrics.heartbeat(db_ready=True)
 
-            # Calculate average confidence
-            avg_confidence = 0.7  # Default confidence for pattern-matched extraction
+        if task.parent_extraction_id is not None:
+            try:
+                self.db.complete_parent_if_ready(task.parent_extraction_id)
+            except Exception:
+                # The shard's own outcome is already committed; the parent stays
+                # PROCESSING and any later shard completion retries the roll-up.
+                logger.exception("Failed to roll up sharded parent %s", task.parent_extraction_id)
+                try:
+                    self.db.conn.rollback()
+                except Exception:
+                    pass
 
-            self.db.mark_done(
+    def _run_task(self, task: ExtractionTask, start_time: float, metrics: task_metrics.TaskMetrics) -> TaskOutcome:
+        strategy = self.strategies.get(task.source_format)
+        if strategy is None:
+            raise ValueError(f"Unsupported source format: {task.source_format}")
+
+        if task.parent_extraction_id is None and self.db.has_shards(task.id):
+            # A reclaimed parent (backend retry, expired claim) resumes the split
+            # it already has: no download, no new plan, and never a whole-document
+            # extraction that would ingest its shards' Krithis a second time.
+            self.db.enqueue_shards(task, [])
+            return "sharded"
+        shard_ranges = strategy.plan_shards(task)
+        if shard_ranges:
+            # The parent stays PROCESSING; whichever worker finishes the last
+            # shard rolls it up via complete_parent_if_ready.
+            self.db.enqueue_shards(task, shard_ranges)
+            return "sharded"
+
+        with task_metrics.stage("prefetch"):
+            self._prefetch_sources(strategy, task)
+        with task_metrics.stage("extract"):
+            results = strategy.extract(task)
+        task_metrics.count("results", len(results))
+
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        extraction_method = results[0].extraction_method if results else strategy.default_extraction_method
+        confidence = self._average_confidence(results)
+        stage_metrics = metrics.as_dict()
+
+        artifact = strategy.source_artifact(task.source_url)
+        source_checksum = artifact.checksum if artifact else (results[0].checksum if results else None)
+        cached_artifact_path = str(artifact.path) if artifact else None
+        persist_started = time.perf_counter()
+        if self.config.result_persistence == "rows":
+            self.db.mark_done_rows(
                 task_id=task.id,
-                result_payload=result_dicts,
+                result_documents=(r.to_json() for r in results),
                 extraction_method=extraction_method.value,
-                confidence=avg_confidence,
+                confidence=confidence,
                 duration_ms=duration_ms,
+                source_checksum=source_checksum,
+                cached_artifact_path=cached_artifact_path,
+                stage_metrics=stage_metrics,
             )
-
-            logger.info(
-                "Task completed successfully",
-                extra={
-                    "task_id": str(task.id),
-                    "result_count": len(results),
-                    "duration_ms": duration_ms,
-                },
+        else:
+            self.db.mark_done(
+                task_id=task.id,
+                result_payload=[r.to_json_dict() for r in results],
+                extraction_method=extraction_method.value,
+                confidence=confidence,
+                duration_ms=duration_ms,
+                source_checksum=source_checksum,
+                cached_artifact_path=cached_artifact_path,
+                stage_metrics=stage_metrics,
             )
+        if self.checkpoints is not None:
+            # Results are committed; a later retry must not resume from this run.
+            self.checkpoints.discard(task.id)
 
-        except Exception as e:
-            duration_ms = int((time.monotonic() - start_time) * 1000)
-            logger.error(
-                "Task %s failed after %dms: %s",
-                task.id,
-                duration_ms,
-                e,
-                exc_info=True,
-            )
-            error_detail = {
-                "message": str(e),
-                "type": type(e).__name__,
-                "traceback": traceback.format_exc(),
+        logger.info(
+            "Task completed successfully",
+            extra={
+                "task_id": str(task.id),
+                "result_count": len(results),
                 "duration_ms": duration_ms,
-                "attempt": task.attempts,
-            }
-            self.db.mark_failed(task.id, error_detail)
+                # Persisting cannot time itself into the row it writes; it is logged only.
+                "persist_ms": round((time.perf_counter() - persist_started) * 1000, 1),
+                **stage_metrics,
+            },
+        )
+        return "done"
+
+    @staticmethod
+    def _average_confidence(results: list[CanonicalExtraction]) -> float:
+        """Mean per-result confidence: an applied Gemini enrichment's own, else the pattern-match default."""
+        if not results:
+            return PATTERN_MATCH_CONFIDENCE
+        scores = [
+            enrichment.confidence
+            if (enrichment := result.metadata_enrichment) is not None
+            and enrichment.applied
+            and enrichment.confidence is not None
+            else PATTERN_MATCH_CONFIDENCE
+            for result in results
+        ]
+        return round(sum(scores) / len(scores), 3)
+
+    def _prefetch_sources(self, strategy: ExtractionStrategy, task: ExtractionTask) -> None:
+        """Warm the artifact store with this and the next pending HTML pages.
+
+        Only on a cache miss, so steady state costs one alias lookup per task.
+        Best effort: a failed prefetch leaves the task's own download to retry
+        and report the error.
+        """
+        if self.config.prefetch_batch_size <= 0 or strategy is not self.html_strategy:
+            return
+        if strategy.source_artifact(task.source_url) is not None:
+            return
+        try:
+            upcoming = self.db.peek_pending_source_urls(task.source_format, self.config.prefetch_batch_size)
+            strategy.prefetch_sources([task.source_url, *upcoming])
+        except Exception:
+            logger.exception("Source prefetch failed for task %s", task.id)
+            try:
+                self.db.conn.rollback()
+            except Exception:
+                pass
 
     def _finalize_extraction(
         self,
@@ -218,23 +457,26 @@ class ExtractionWorker:
         source_format: str,
     ) -> CanonicalExtraction:
         """Apply optional Phase 3 identity and enrichment signals."""
-        identity_candidates = self._discover_identity_candidates(extraction)
+        with task_metrics.stage("identity_discovery"):
+            identity_candidates = self._discover_identity_candidates(extraction)
         if identity_candidates is not None:
             extraction.identity_candidates = identity_candidates
 
-        enrichment = self.gemini_enricher.enrich(
-            extraction,
-            source_text,
-            source_format=source_format,
-        )
+        with task_metrics.stage("gemini"):
+            enrichment = self.gemini_enricher.enrich(
+                extraction,
+                source_text,
+                source_format=source_format,
+            )
         if enrichment is not None:
             extraction.metadata_enrichment = enrichment
 
-        primary_raga = extraction.ragas[0].name if extraction.ragas else ""
-        extraction.title_normalized = normalize_for_matching(extraction.title, "title")
-        extraction.composer_normalized = normalize_for_matching(extraction.composer, "composer")
-        extraction.raga_normalized = normalize_for_matching(primary_raga, "raga")
-        extraction.tala_normalized = normalize_for_matching(extraction.tala, "tala")
+        with task_metrics.stage("normalize"):
+            primary_raga = extraction.ragas[0].name if extraction.ragas else ""
+            extraction.title_normalized = normalize_for_matching(extraction.title, "title")
+            extraction.composer_normalized = normalize_for_matching(extraction.composer, "composer")
+            extraction.raga_normalized = normalize_for_matching(primary_raga, "raga")
+            extraction.tala_normalized = normalize_for_matching(extraction.tala, "tala")
 
         return extraction
 
@@ -304,8 +546,21 @@ class ExtractionWorker:
 
 
 def health_check() -> None:
-    """Health check function called by Docker HEALTHCHECK."""
+    """Health check function called by Docker HEALTHCHECK.
+
+    With the metrics endpoint enabled the probe asks the running worker's
+    /healthz, which answers from in-process state; otherwise it falls back to
+    opening a database connection of its own.
+    """
     config = load_config()
+    if config.metrics_port:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{config.metrics_port}/healthz", timeout=5) as response:
+                if response.status != 200:
+                    sys.exit(1)
+        except Exception:
+            sys.exit(1)
+        return
     db = ExtractionQueueDB(config)
     try:
         db.connect()
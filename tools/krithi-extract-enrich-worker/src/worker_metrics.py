@@ -0,0 +1,240 @@
+"""Process-wide worker metrics and the HTTP endpoint that serves them.
+
+`WorkerMetrics` aggregates what the polling loop already knows: every task's
+outcome and its `TaskMetrics` stage breakdown, the queue depth sampled from
+`get_queue_stats`, and the loop's own heartbeat. `MetricsServer` serves it on
+a daemon thread:
+
+    /metrics   Prometheus text exposition (version 0.0.4)
+    /healthz   liveness: the loop has made progress within the stall limit
+    /readyz    readiness: connected to the database and not shutting down
+
+Probes are answered from this in-process state, so they cost no database
+connection. The exposition is written by hand (a few counters, gauges and
+histograms) rather than pulling in a client library.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Literal
+
+from .db import QueueStats
+from .task_metrics import TaskMetrics
+
+logger = logging.getLogger(__name__)
+
+TaskOutcome = Literal["done", "failed", "sharded"]
+
+# Seconds; stages range from sub-millisecond parses to multi-minute OCR runs.
+_STAGE_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 180.0, 600.0)
+_TASK_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 180.0, 600.0, 1800.0, 3600.0)
+
+
+class _Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def render(self, name: str, labels: str) -> Iterable[str]:
+        sep = "," if labels else ""
+        for bound, count in zip(self.buckets, self.counts, strict=True):
+            yield f'{name}_bucket{{{labels}{sep}le="{bound:g}"}} {count}'
+        yield f'{name}_bucket{{{labels}{sep}le="+Inf"}} {self.count}'
+        yield f"{name}_sum{{{labels}}} {self.total:.6f}"
+        yield f"{name}_count{{{labels}}} {self.count}"
+
+
+class WorkerMetrics:
+    """Thread-safe aggregate of the worker's activity since start."""
+
+    def __init__(self, *, liveness_max_stall_s: float) -> None:
+        self.liveness_max_stall_s = liveness_max_stall_s
+        # Seconds since the identity reference catalog was loaded, or None.
+        self.identity_catalog_age: Callable[[], float | None] = lambda: None
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._heartbeat_at = self._started_at
+        self._db_ready = False
+        self._shutting_down = False
+        self._tasks: dict[tuple[str, str], int] = {}
+        self._task_seconds: dict[str, _Histogram] = {}
+        self._stage_seconds: dict[str, _Histogram] = {}
+        self._counters: dict[str, int] = {}
+        self._ocr_seconds = 0.0
+        self._queue: QueueStats | None = None
+
+    def observe_task(
+        self, source_format: str, outcome: TaskOutcome, duration_s: float, task_metrics: TaskMetrics
+    ) -> None:
+        """Fold one finished task, and its stage breakdown, into the totals."""
+        with self._lock:
+            key = (source_format, outcome)
+            self._tasks[key] = self._tasks.get(key, 0) + 1
+            self._task_seconds.setdefault(source_format, _Histogram(_TASK_BUCKETS)).observe(duration_s)
+            for stage, elapsed_ms in task_metrics.stages_ms.items():
+                self._stage_seconds.setdefault(stage, _Histogram(_STAGE_BUCKETS)).observe(elapsed_ms / 1000)
+            for name, n in task_metrics.counters.items():
+                self._counters[name] = self._counters.get(name, 0) + n
+            self._ocr_seconds += task_metrics.stages_ms.get("ocr", 0.0) / 1000
+
+    def heartbeat(self, *, db_ready: bool) -> None:
+        """Record loop progress and whether the last database round trip succeeded."""
+        with self._lock:
+            self._heartbeat_at = time.monotonic()
+            self._db_ready = db_ready
+
+    def set_queue_stats(self, stats: QueueStats) -> None:
+        with self._lock:
+            self._queue = stats
+
+    def shutting_down(self) -> None:
+        with self._lock:
+            self._shutting_down = True
+
+    def is_live(self) -> bool:
+        with self._lock:
+            return time.monotonic() - self._heartbeat_at < self.liveness_max_stall_s
+
+    def is_ready(self) -> bool:
+        with self._lock:
+            return self._db_ready and not self._shutting_down
+
+    def render(self) -> str:
+        """The Prometheus text exposition of everything recorded so far."""
+        identity_age = self.identity_catalog_age()
+        live, ready = self.is_live(), self.is_ready()
+        with self._lock:
+            lines = [
+                "# HELP sangita_worker_up Whether the worker loop is live (made progress recently).",
+                "# TYPE sangita_worker_up gauge",
+                f"sangita_worker_up {int(live)}",
+                "# HELP sangita_worker_ready Whether the worker is connected and accepting tasks.",
+                "# TYPE sangita_worker_ready gauge",
+                f"sangita_worker_ready {int(ready)}",
+                "# HELP sangita_worker_uptime_seconds Seconds since the worker started.",
+                "# TYPE sangita_worker_uptime_seconds gauge",
+                f"sangita_worker_uptime_seconds {time.monotonic() - self._started_at:.3f}",
+                "# HELP sangita_worker_tasks_total Tasks finished, by source format and outcome.",
+                "# TYPE sangita_worker_tasks_total counter",
+            ]
+            for (source_format, outcome), n in sorted(self._tasks.items()):
+                lines.append(f'sangita_worker_tasks_total{{source_format="{source_format}",outcome="{outcome}"}} {n}')
+            lines += [
+                "# HELP sangita_worker_task_duration_seconds Wall-clock task duration, by source format.",
+                "# TYPE sangita_worker_task_duration_seconds histogram",
+            ]
+            for source_format, histogram in sorted(self._task_seconds.items()):
+                lines += histogram.render("sangita_worker_task_duration_seconds", f'source_format="{source_format}"')
+            lines += [
+                "# HELP sangita_worker_stage_duration_seconds Time a task spent in each pipeline stage.",
+                "# TYPE sangita_worker_stage_duration_seconds histogram",
+            ]
+            for stage, histogram in sorted(self._stage_seconds.items()):
+                lines += histogram.render("sangita_worker_stage_duration_seconds", f'stage="{stage}"')
+            lines += [
+                "# HELP sangita_worker_events_total Pipeline counters (OCR pages, segments, cache hits, ...).",
+                "# TYPE sangita_worker_events_total counter",
+            ]
+            for name, n in sorted(self._counters.items()):
+                lines.append(f'sangita_worker_events_total{{event="{name}"}} {n}')
+            ocr_pages = self._counters.get("ocr_pages", 0)
+            lines += [
+                "# HELP sangita_worker_ocr_pages_per_second OCR throughput over the worker's lifetime.",
+                "# TYPE sangita_worker_ocr_pages_per_second gauge",
+                f"sangita_worker_ocr_pages_per_second {ocr_pages / self._ocr_seconds if self._ocr_seconds else 0:.3f}",
+                "# HELP sangita_worker_gemini_calls_total Gemini generate_content calls, including retries.",
+                "# TYPE sangita_worker_gemini_calls_total counter",
+                f"sangita_worker_gemini_calls_total {self._counters.get('gemini_calls', 0)}",
+                "# HELP sangita_worker_gemini_rate_limited_total Gemini calls rejected with 429 ResourceExhausted.",
+                "# TYPE sangita_worker_gemini_rate_limited_total counter",
+                f"sangita_worker_gemini_rate_limited_total {self._counters.get('gemini_rate_limited', 0)}",
+            ]
+            if self._queue is not None:
+                lines += [
+                    "# HELP sangita_worker_queue_tasks extraction_queue rows by status, as last sampled.",
+                    "# TYPE sangita_worker_queue_tasks gauge",
+                ]
+                for field in fields(self._queue):
+                    depth = getattr(self._queue, field.name)
+                    lines.append(f'sangita_worker_queue_tasks{{status="{field.name.upper()}"}} {depth}')
+        if identity_age is not None and math.isfinite(identity_age):
+            lines += [
+                "# HELP sangita_worker_identity_catalog_age_seconds Age of the cached identity reference catalog.",
+                "# TYPE sangita_worker_identity_catalog_age_seconds gauge",
+                f"sangita_worker_identity_catalog_age_seconds {identity_age:.3f}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves a `WorkerMetrics` over HTTP on a daemon thread."""
+
+    def __init__(self, metrics: WorkerMetrics, host: str, port: int) -> None:
+        self.metrics = metrics
+        self._server = ThreadingHTTPServer((host, port), _handler_for(metrics))
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """The bound port (useful when constructed with port 0)."""
+        return int(self._server.server_address[1])
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+        logger.info("Metrics endpoint listening", extra={"port": self.port})
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+
+def _handler_for(metrics: WorkerMetrics) -> type[BaseHTTPRequestHandler]:
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server dispatch name
+            if self.path == "/metrics":
+                self._reply(200, metrics.render(), "text/plain; version=0.0.4; charset=utf-8")
+            elif self.path == "/healthz":
+                live = metrics.is_live()
+                self._reply(200 if live else 503, "ok\n" if live else "stalled\n")
+            elif self.path == "/readyz":
+                ready = metrics.is_ready()
+                self._reply(200 if ready else 503, "ready\n" if ready else "not ready\n")
+            else:
+                self._reply(404, "not found\n")
+
+        def _reply(self, status: int, body: str, content_type: str = "text/plain; charset=utf-8") -> None:
+            payload = body.encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: object) -> None:
+            # Probes arrive every few seconds; keep them out of the worker log.
+            logger.debug("metrics request: " + format, *args)
+
+    return _Handler
@@ -18,6 +18,7 @@ import subprocess
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
+from uuid import UUID
 
 import pytest
 
@@ -113,7 +114,7 @@ def insert_pending_task(
     max_attempts: int = 3,
     attempts: int = 0,
     status: str = "PENDING",
-) -> str:
+) -> UUID:
     """Insert a queue row the way the Kotlin backend does; returns the task id."""
     db.ensure_connected()
     with db.conn.cursor() as cur:
@@ -142,7 +143,7 @@ def insert_pending_task(
     return task_id
 
 
-def fetch_task_row(db: ExtractionQueueDB, task_id: str) -> dict[str, Any]:
+def fetch_task_row(db: ExtractionQueueDB, task_id: UUID) -> dict[str, Any]:
     db.ensure_connected()
     with db.conn.cursor() as cur:
         cur.execute("SELECT * FROM extraction_queue WHERE id = %(id)s", {"id": task_id})
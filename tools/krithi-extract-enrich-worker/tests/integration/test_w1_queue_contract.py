@@ -9,9 +9,11 @@ same DDL (V27 + V31) both sides run in production.
 from __future__ import annotations
 
 import json
+from typing import Any
+from uuid import UUID
 
 from src.config import ExtractorConfig
-from src.db import ExtractionQueueDB
+from src.db import ExtractionQueueDB, RewrittenResults
 
 from .conftest import fetch_task_row, insert_pending_task
 
@@ -166,3 +168,357 @@ def test_result_payload_jsonb_roundtrip_preserves_unicode(queue_db: ExtractionQu
     # And it is real jsonb, not a double-encoded string
     assert not isinstance(row["result_payload"], str)
     json.dumps(row["result_payload"])  # sanity: JSON-serializable as returned
+
+
+def test_sharded_parent_rolls_up_when_last_shard_finishes(queue_db: ExtractionQueueDB) -> None:
+    """Shards inherit the parent's request; the parent turns DONE only after the last one."""
+    parent_id = insert_pending_task(queue_db, source_url="https://example.org/anthology.pdf", source_format="PDF")
+    parent = queue_db.claim_pending_task()
+    assert parent is not None and parent.id == parent_id
+
+    child_ids = queue_db.enqueue_shards(parent, ["1-50", "51-90"])
+    assert len(child_ids) == 2
+
+    first = queue_db.claim_pending_task()
+    second = queue_db.claim_pending_task()
+    assert first is not None and second is not None
+    assert {first.id, second.id} == set(child_ids)
+    assert first.parent_extraction_id == parent_id
+    assert first.request_payload == {"composerHint": "Dikshitar"}
+
+    shards = {first.page_range: first, second.page_range: second}
+    queue_db.mark_done(shards["51-90"].id, [{"title": "later"}], "PDF_PYMUPDF", 0.7, 20)
+    assert queue_db.complete_parent_if_ready(parent_id) is False
+    assert fetch_task_row(queue_db, parent_id)["status"] == "PROCESSING"
+
+    queue_db.mark_done(shards["1-50"].id, [{"title": "first"}, {"title": "second"}], "PDF_PYMUPDF", 0.7, 30)
+    assert queue_db.complete_parent_if_ready(parent_id) is True
+
+    row = fetch_task_row(queue_db, parent_id)
+    assert row["status"] == "DONE"
+    assert row["result_count"] == 3
+    assert row["result_payload"] is None
+    # The parent carries no results; the backend ingests each shard on its own.
+    assert queue_db.has_shards(parent_id)
+    assert not queue_db.has_shards(first.id)
+
+
+def test_sharded_parent_fails_when_a_shard_fails(queue_db: ExtractionQueueDB) -> None:
+    parent_id = insert_pending_task(queue_db, source_url="https://example.org/anthology.pdf", source_format="PDF")
+    parent = queue_db.claim_pending_task()
+    assert parent is not None
+    queue_db.enqueue_shards(parent, ["1-50", "51-90"])
+
+    first = queue_db.claim_pending_task()
+    second = queue_db.claim_pending_task()
+    assert first is not None and second is not None
+    queue_db.mark_done(first.id, [], "PDF_PYMUPDF", 0.7, 10)
+    queue_db.mark_failed(second.id, {"message": "boom", "type": "RuntimeError"})
+
+    assert queue_db.complete_parent_if_ready(parent_id) is True
+    row = fetch_task_row(queue_db, parent_id)
+    assert row["status"] == "FAILED"
+    assert row["error_detail"]["type"] == "ShardFailure"
+    assert [s["page_range"] for s in row["error_detail"]["failed_shards"]] == [second.page_range]
+
+
+def _backend_retry(db: ExtractionQueueDB, task_id: UUID) -> None:
+    """What ExtractionQueueRepository.retry does to a FAILED row."""
+    with db.conn.cursor() as cur:
+        cur.execute(
+            "UPDATE extraction_queue SET status = 'PENDING', attempts = 0, updated_at = NOW() WHERE id = %(id)s",
+            {"id": task_id},
+        )
+    db.conn.commit()
+
+
+def _shard_rows(db: ExtractionQueueDB, parent_id: UUID) -> list[dict[str, Any]]:
+    with db.conn.cursor() as cur:
+        cur.execute(
+            """
+            SELECT id, page_range, status::text AS status, attempts
+            FROM extraction_queue WHERE parent_extraction_id = %(id)s ORDER BY page_range
+            """,
+            {"id": parent_id},
+        )
+        rows = cur.fetchall()
+    db.conn.rollback()
+    return rows
+
+
+def test_reclaimed_sharded_parent_resumes_its_existing_shards(queue_db: ExtractionQueueDB) -> None:
+    parent_id = insert_pending_task(queue_db, source_url="https://example.org/anthology.pdf", source_format="PDF")
+    parent = queue_db.claim_pending_task()
+    assert parent is not None
+    child_ids = queue_db.enqueue_shards(parent, ["1-50", "51-90"])
+    first = queue_db.claim_pending_task()
+    second = queue_db.claim_pending_task()
+    assert first is not None and second is not None
+    queue_db.mark_done(first.id, [{"title": "first"}], "PDF_PYMUPDF", 0.7, 10)
+    queue_db.mark_failed(second.id, {"message": "boom", "type": "RuntimeError"})
+    with queue_db.conn.cursor() as cur:
+        cur.execute("UPDATE extraction_queue SET status = 'INGESTED' WHERE id = %(id)s", {"id": first.id})
+    queue_db.conn.commit()
+    assert queue_db.complete_parent_if_ready(parent_id) is True
+    assert fetch_task_row(queue_db, parent_id)["status"] == "FAILED"
+
+    # The backend retries the parent and a worker claims it a second time,
+    # possibly planning a different split.
+    _backend_retry(queue_db, parent_id)
+    reclaimed = queue_db.claim_pending_task()
+    assert reclaimed is not None and reclaimed.id == parent_id
+    assert set(queue_db.enqueue_shards(reclaimed, ["1-30", "31-60", "61-90"])) == set(child_ids)
+
+    shards = {row["page_range"]: row for row in _shard_rows(queue_db, parent_id)}
+    assert set(shards) == {"1-50", "51-90"}
+    assert shards["1-50"]["status"] == "INGESTED"
+    assert (shards["51-90"]["status"], shards["51-90"]["attempts"]) == ("PENDING", 0)
+
+    retried = queue_db.claim_pending_task()
+    assert retried is not None and retried.id == second.id
+    queue_db.mark_done(retried.id, [{"title": "later"}], "PDF_PYMUPDF", 0.7, 20)
+    assert queue_db.complete_parent_if_ready(parent_id) is True
+    row = fetch_task_row(queue_db, parent_id)
+    assert (row["status"], row["result_count"]) == ("DONE", 2)
+
+
+def test_roll_up_ignores_superseded_shards(queue_db: ExtractionQueueDB) -> None:
+    parent_id = insert_pending_task(queue_db, source_url="https://example.org/anthology.pdf", source_format="PDF")
+    parent = queue_db.claim_pending_task()
+    assert parent is not None
+    [stale] = queue_db.enqueue_shards(parent, ["1-90"])
+    # A duplicate split from before shards were resumed: the newest child per range wins.
+    with queue_db.conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE extraction_queue SET status = 'FAILED', created_at = created_at - INTERVAL '1 day'
+            WHERE id = %(id)s
+            """,
+            {"id": stale},
+        )
+        cur.execute(
+            """
+            INSERT INTO extraction_queue (source_url, source_format, source_name, source_tier, request_payload,
+                                          page_range, status, result_payload, result_count, parent_extraction_id)
+            VALUES ('https://example.org/anthology.pdf', 'PDF', 'guruguha.org', 2, '{}'::jsonb,
+                    '1-90', 'DONE', '[{"title": "current"}]'::jsonb, 1, %(parent)s)
+            """,
+            {"parent": parent_id},
+        )
+    queue_db.conn.commit()
+
+    assert queue_db.complete_parent_if_ready(parent_id) is True
+    row = fetch_task_row(queue_db, parent_id)
+    assert (row["status"], row["result_count"]) == ("DONE", 1)
+
+
+def test_queue_sweep_requeues_stale_claims_and_rolls_up_stalled_parents(queue_db: ExtractionQueueDB) -> None:
+    parent_id = insert_pending_task(queue_db, source_url="https://example.org/anthology.pdf", source_format="PDF")
+    parent = queue_db.claim_pending_task()
+    assert parent is not None
+    queue_db.enqueue_shards(parent, ["1-90"])
+    shard = queue_db.claim_pending_task()
+    assert shard is not None
+    # The shard worker commits its result but dies before rolling the parent up.
+    queue_db.mark_done(shard.id, [], "PDF_PYMUPDF", 0.7, 10)
+
+    crashed_id = insert_pending_task(queue_db)
+    crashed = queue_db.claim_pending_task()
+    assert crashed is not None and crashed.id == crashed_id
+    with queue_db.conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE extraction_queue SET claimed_at = NOW() - INTERVAL '2 hours'
+            WHERE id = ANY(%(ids)s)
+            """,
+            {"ids": [parent_id, crashed_id]},
+        )
+    queue_db.conn.commit()
+
+    assert queue_db.requeue_stale_claims(3600) == 1
+    assert queue_db.roll_up_stalled_parents() == 1
+    crashed_row = fetch_task_row(queue_db, crashed_id)
+    assert (crashed_row["status"], crashed_row["error_detail"]["type"]) == ("PENDING", "StaleClaim")
+    assert fetch_task_row(queue_db, parent_id)["status"] == "DONE"
+
+
+def _result_rows(db: ExtractionQueueDB, task_id: UUID) -> list[dict[str, Any]]:
+    with db.conn.cursor() as cur:
+        cur.execute(
+            "SELECT ordinal, result FROM extraction_results WHERE extraction_id = %(id)s ORDER BY ordinal",
+            {"id": task_id},
+        )
+        rows = cur.fetchall()
+    db.conn.rollback()
+    return rows
+
+
+def test_mark_done_rows_streams_one_row_per_result(queue_db: ExtractionQueueDB) -> None:
+    task_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    documents = [{"title": "वातापि गणपतिं"}, {"title": "tab\there \\ back\\slash"}]
+
+    queue_db.mark_done_rows(task.id, (json.dumps(d, ensure_ascii=False) for d in documents), "PDF_PYMUPDF", 0.7, 40)
+
+    row = fetch_task_row(queue_db, task_id)
+    assert row["status"] == "DONE"
+    assert row["result_payload"] is None
+    assert row["result_count"] == 2
+    assert [(r["ordinal"], r["result"]) for r in _result_rows(queue_db, task_id)] == list(enumerate(documents))
+
+
+def test_mark_done_rows_replaces_rows_from_an_earlier_attempt(queue_db: ExtractionQueueDB) -> None:
+    task_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    queue_db.mark_done_rows(task.id, ['{"title": "a"}', '{"title": "b"}'], "PDF_PYMUPDF", 0.7, 40)
+
+    queue_db.mark_done_rows(task.id, ['{"title": "c"}'], "PDF_PYMUPDF", 0.7, 40)
+
+    assert [r["result"] for r in _result_rows(queue_db, task_id)] == [{"title": "c"}]
+    assert fetch_task_row(queue_db, task_id)["result_count"] == 1
+
+
+def test_mark_done_rows_without_results_records_an_empty_payload(queue_db: ExtractionQueueDB) -> None:
+    task_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+
+    queue_db.mark_done_rows(task.id, iter(()), "HTML_JSOUP", 0.7, 5)
+
+    row = fetch_task_row(queue_db, task_id)
+    assert row["result_payload"] == []
+    assert row["result_count"] == 0
+
+
+def test_roll_up_counts_inline_payloads_and_result_rows(queue_db: ExtractionQueueDB) -> None:
+    parent_id = insert_pending_task(queue_db, source_url="https://example.org/anthology.pdf", source_format="PDF")
+    parent = queue_db.claim_pending_task()
+    assert parent is not None
+    queue_db.enqueue_shards(parent, ["1-50", "51-90"])
+    first = queue_db.claim_pending_task()
+    second = queue_db.claim_pending_task()
+    assert first is not None and second is not None
+    shards = {first.page_range: first, second.page_range: second}
+
+    queue_db.mark_done_rows(shards["1-50"].id, ['{"title": "first"}', '{"title": "second"}'], "PDF_PYMUPDF", 0.7, 30)
+    queue_db.mark_done(shards["51-90"].id, [{"title": "later"}], "PDF_PYMUPDF", 0.7, 20)
+
+    assert queue_db.complete_parent_if_ready(parent_id) is True
+    assert fetch_task_row(queue_db, parent_id)["result_count"] == 3
+
+
+def test_mark_done_records_cached_artifact(queue_db: ExtractionQueueDB) -> None:
+    task_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+
+    queue_db.mark_done(
+        task.id,
+        [],
+        "HTML_JSOUP",
+        0.7,
+        5,
+        source_checksum="ab" * 32,
+        cached_artifact_path="/app/cache/objects/ab/" + "ab" * 32 + ".html",
+    )
+
+    row = fetch_task_row(queue_db, task_id)
+    assert row["source_checksum"] == "ab" * 32
+    assert row["cached_artifact_path"].endswith(".html")
+
+
+def _complete_with_version(queue_db: ExtractionQueueDB, results: list[str], version: str, *, as_rows: bool) -> UUID:
+    task_id = insert_pending_task(queue_db, source_url=f"https://example.org/{version}/{len(results)}/{as_rows}")
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    if as_rows:
+        queue_db.mark_done_rows(task.id, results, "HTML_JSOUP", 0.7, 5)
+    else:
+        queue_db.mark_done(task.id, [json.loads(r) for r in results], "HTML_JSOUP", 0.7, 5)
+    with queue_db.conn.cursor() as cur:
+        cur.execute("UPDATE extraction_queue SET extractor_version = %s WHERE id = %s", (version, task_id))
+    queue_db.conn.commit()
+    return task_id
+
+
+def test_list_done_extractions_pages_through_other_versions(queue_db: ExtractionQueueDB) -> None:
+    current = ExtractorConfig().extractor_version
+    inline = _complete_with_version(queue_db, ['{"title": "a"}'], "worker:0.9.0", as_rows=False)
+    rows = _complete_with_version(queue_db, ['{"title": "b"}', '{"title": "c"}'], "worker:0.9.0", as_rows=True)
+    _complete_with_version(queue_db, ['{"title": "d"}'], current, as_rows=False)
+
+    first = queue_db.list_done_extractions(exclude_version=current, after_id=None, limit=1)
+    rest = queue_db.list_done_extractions(exclude_version=current, after_id=first[0].task.id, limit=10)
+
+    listed = {done.task.id: done for done in first + rest}
+    assert set(listed) == {inline, rows}
+    assert listed[inline].result_payload == [{"title": "a"}]
+    assert listed[rows].result_payload == [{"title": "b"}, {"title": "c"}]
+    assert listed[rows].extractor_version == "worker:0.9.0"
+
+
+def test_rewrite_done_results_writes_changes_and_bumps_unchanged(queue_db: ExtractionQueueDB) -> None:
+    current = ExtractorConfig().extractor_version
+    changed = _complete_with_version(queue_db, ['{"title": "old"}'], "worker:0.9.0", as_rows=True)
+    unchanged = _complete_with_version(queue_db, ['{"title": "same"}'], "worker:0.9.0", as_rows=False)
+    ingested = _complete_with_version(queue_db, ['{"title": "ingested"}'], "worker:0.9.0", as_rows=False)
+    with queue_db.conn.cursor() as cur:
+        cur.execute("UPDATE extraction_queue SET status = 'INGESTED' WHERE id = %s", (ingested,))
+    queue_db.conn.commit()
+
+    written = queue_db.rewrite_done_results(
+        [
+            RewrittenResults(changed, ['{"title": "new"}', '{"title": "newer"}'], "PDF_PYMUPDF"),
+            RewrittenResults(ingested, ['{"title": "late"}'], "PDF_PYMUPDF"),
+        ],
+        [unchanged],
+    )
+
+    assert written == 1
+    row = fetch_task_row(queue_db, changed)
+    assert row["result_payload"] == [{"title": "new"}, {"title": "newer"}]
+    assert (row["result_count"], row["extraction_method"], row["extractor_version"]) == (2, "PDF_PYMUPDF", current)
+    assert _result_rows(queue_db, changed) == []
+    assert fetch_task_row(queue_db, unchanged)["extractor_version"] == current
+    assert fetch_task_row(queue_db, unchanged)["result_payload"] == [{"title": "same"}]
+    assert fetch_task_row(queue_db, ingested)["result_payload"] == [{"title": "ingested"}]
+
+
+def test_stage_metrics_are_recorded_on_done_and_failed(queue_db: ExtractionQueueDB) -> None:
+    metrics = {"stages_ms": {"download": 12.5, "ocr": 840.0}, "counters": {"ocr_pages": 3}}
+    done_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    queue_db.mark_done(task.id, [], "PDF_OCR", 0.7, 860, stage_metrics=metrics)
+
+    failed_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    queue_db.mark_failed(task.id, {"message": "boom", "type": "RuntimeError"}, stage_metrics=metrics)
+
+    assert fetch_task_row(queue_db, done_id)["stage_metrics"] == metrics
+    assert fetch_task_row(queue_db, failed_id)["stage_metrics"] == metrics
+
+
+def test_attach_profile_merges_into_stage_metrics(queue_db: ExtractionQueueDB) -> None:
+    profile = {"path": "/app/cache/profiles/x.pstats", "total_ms": 91.0, "top": [{"function": "f", "calls": 1}]}
+    done_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    queue_db.mark_done(task.id, [], "PDF_OCR", 0.7, 91, stage_metrics={"stages_ms": {"ocr": 80.0}, "counters": {}})
+    queue_db.attach_profile(task.id, profile)
+
+    failed_id = insert_pending_task(queue_db)
+    task = queue_db.claim_pending_task()
+    assert task is not None
+    queue_db.mark_failed(task.id, {"message": "boom", "type": "RuntimeError"})
+    queue_db.attach_profile(task.id, profile)
+
+    assert fetch_task_row(queue_db, done_id)["stage_metrics"] == {
+        "stages_ms": {"ocr": 80.0},
+        "counters": {},
+        "profile": profile,
+    }
+    assert fetch_task_row(queue_db, failed_id)["stage_metrics"] == {"profile": profile}
@@ -0,0 +1,193 @@
+"""Content-addressed artifact store: atomic writes, dedup, and LRU eviction."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from src.artifact_store import ArtifactStore
+
+PAGES = {
+    "https://example.org/a.html": b"<html>vAtApi gaNapatim</html>",
+    "https://example.org/mirror/a.html": b"<html>vAtApi gaNapatim</html>",
+    "https://example.org/b.html": b"<html>akhilANDEzvari</html>",
+    "https://example.org/c.html": b"<html>kamalAmbikE</html>",
+}
+
+
+@pytest.fixture()
+def requests_seen() -> list[str]:
+    return []
+
+
+@pytest.fixture()
+def client(requests_seen):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(str(request.url))
+        return httpx.Response(200, content=PAGES[str(request.url)])
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as c:
+        yield c
+
+
+def test_fetch_streams_into_store_and_reuses_by_url(tmp_path, client, requests_seen) -> None:
+    store = ArtifactStore(tmp_path)
+    url = "https://example.org/a.html"
+
+    first = store.fetch(url, client, ".html")
+    second = store.fetch(url, client, ".html")
+
+    assert first == second
+    assert first.path.read_bytes() == PAGES[url]
+    assert first.checksum == hashlib.sha256(PAGES[url]).hexdigest()
+    assert first.path.name == f"{first.checksum}.html"
+    assert requests_seen == [url], "a cached URL must not be downloaded again"
+    assert not any((tmp_path / "tmp").iterdir()), "no temp files left behind"
+
+
+def test_identical_content_is_stored_once(tmp_path, client) -> None:
+    store = ArtifactStore(tmp_path)
+
+    a = store.fetch("https://example.org/a.html", client, ".html")
+    mirror = store.fetch("https://example.org/mirror/a.html", client, ".html")
+
+    assert a.path == mirror.path
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 1
+
+
+def test_interrupted_download_leaves_no_artifact(tmp_path) -> None:
+    class Truncated(httpx.SyncByteStream):
+        def __iter__(self):
+            yield b"partial body"
+            raise httpx.ReadError("connection reset")
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=Truncated())
+
+    store = ArtifactStore(tmp_path)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as broken:
+        with pytest.raises(httpx.ReadError):
+            store.fetch("https://example.org/a.html", broken, ".html")
+
+    assert store.lookup("https://example.org/a.html") is None
+    assert not list(tmp_path.glob("objects/*/*"))
+    assert not any((tmp_path / "tmp").iterdir())
+
+
+def test_least_recently_used_artifact_is_evicted(tmp_path, client, requests_seen) -> None:
+    size = len(PAGES["https://example.org/a.html"])
+    store = ArtifactStore(tmp_path, max_bytes=2 * size)
+
+    a = store.fetch("https://example.org/a.html", client, ".html")
+    b = store.fetch("https://example.org/b.html", client, ".html")
+    # Age both, then touch `a` so `b` becomes the least recently used.
+    os.utime(a.path, (1, 1))
+    os.utime(b.path, (2, 2))
+    store.lookup("https://example.org/a.html")
+
+    c = store.fetch("https://example.org/c.html", client, ".html")
+
+    assert a.path.exists() and c.path.exists()
+    assert not b.path.exists()
+    # An alias whose object was evicted is a miss, and re-fetching works.
+    assert store.lookup("https://example.org/b.html") is None
+    store.fetch("https://example.org/b.html", client, ".html")
+    assert requests_seen.count("https://example.org/b.html") == 2
+
+
+class _StubSource:
+    """A local HTTP server serving one page with ETag and Last-Modified validators."""
+
+    def __init__(self) -> None:
+        self.body = b"<html>first edition</html>"
+        self.etag = '"v1"'
+        self.last_modified = "Mon, 05 Oct 2026 10:00:00 GMT"
+        self.log: list[tuple[int, dict[str, str]]] = []
+
+
+@pytest.fixture()
+def stub_source() -> Iterator[tuple[_StubSource, str]]:
+    source = _StubSource()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            conditional = {
+                name: value
+                for name, value in self.headers.items()
+                if name.lower() in ("if-none-match", "if-modified-since")
+            }
+            if self.headers.get("If-None-Match") == source.etag:
+                source.log.append((304, conditional))
+                self.send_response(304)
+                self.send_header("ETag", source.etag)
+                self.end_headers()
+                return
+            source.log.append((200, conditional))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(source.body)))
+            self.send_header("ETag", source.etag)
+            self.send_header("Last-Modified", source.last_modified)
+            self.end_headers()
+            self.wfile.write(source.body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield source, f"http://127.0.0.1:{server.server_address[1]}/krithi.html"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_revalidation_reuses_local_copy_on_304(tmp_path, stub_source) -> None:
+    source, url = stub_source
+    store = ArtifactStore(tmp_path)
+
+    with httpx.Client() as http:
+        first = store.fetch(url, http, ".html", revalidate=True)
+        second = store.fetch(url, http, ".html", revalidate=True)
+
+    assert second == first
+    assert [status for status, _ in source.log] == [200, 304]
+    assert source.log[1][1] == {"If-None-Match": '"v1"', "If-Modified-Since": source.last_modified}
+
+
+def test_revalidation_picks_up_a_corrected_page(tmp_path, stub_source) -> None:
+    source, url = stub_source
+    store = ArtifactStore(tmp_path)
+
+    with httpx.Client() as http:
+        original = store.fetch(url, http, ".html", revalidate=True)
+        source.body, source.etag = b"<html>corrected edition</html>", '"v2"'
+        corrected = store.fetch(url, http, ".html", revalidate=True)
+        # The new validators are stored: the next check is a 304 again.
+        again = store.fetch(url, http, ".html", revalidate=True)
+
+    assert corrected.path.read_bytes() == b"<html>corrected edition</html>"
+    assert corrected.checksum != original.checksum
+    assert again == corrected
+    assert [status for status, _ in source.log] == [200, 200, 304]
+
+
+def test_without_revalidation_a_cached_url_is_never_refetched(tmp_path, stub_source) -> None:
+    source, url = stub_source
+    store = ArtifactStore(tmp_path)
+
+    with httpx.Client() as http:
+        store.fetch(url, http, ".html")
+        source.body, source.etag = b"<html>corrected edition</html>", '"v2"'
+        cached = store.fetch(url, http, ".html")
+
+    assert cached.path.read_bytes() == b"<html>first edition</html>"
+    assert len(source.log) == 1
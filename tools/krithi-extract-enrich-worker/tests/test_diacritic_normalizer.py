@@ -173,3 +173,44 @@ class TestRule8ConsonantDot:
         result = normalize_garbled_diacritics(text)
         assert "\npallavi" in result
         assert "pallavi" in result.split("\n")[1]
+
+
+# ── Equivalence with the original rule-by-rule passes ──
+
+_SEQUENTIAL_RULES = [
+    (r"¯\s*a", "ā"),
+    (r"¯\s*[iı]", "ī"),
+    (r"¯\s*u", "ū"),
+    (r"\s*˙\s*m", "ṁ"),
+    (r"\s*˙\s*n", "ṅ"),
+    (r"\s*˙\s*r", "ṛ"),
+    (r"´\s*s", "ś"),
+    (r"˜\s*n", "ñ"),
+    (r"✠", ""),
+    (r"\n\s*\d+\s*$", "\n"),
+    (r"ı", "i"),
+] + [(rf"(?<![A-Z]){consonant}\.[ \t]*", iast) for consonant, iast in zip("sndtlrh", "ṣṇḍṭḷṛḥ", strict=True)]
+
+
+def _sequential_normalize(text: str) -> str:
+    """The original one-`re.sub`-per-rule implementation, kept as the oracle."""
+    import re
+
+    for pattern, replacement in _SEQUENTIAL_RULES:
+        text = re.sub(pattern, replacement, text)
+    return text
+
+
+def test_single_pass_matches_sequential_rules_on_random_text() -> None:
+    import random
+
+    rng = random.Random(36)
+    alphabet = list("aiumnrsdtlhDSRA .\t\n5") + ["¯", "˙", "´", "˜", "✠", "ı"]
+    for _ in range(20000):
+        text = "".join(rng.choices(alphabet, k=rng.randint(0, 16)))
+        assert normalize_garbled_diacritics(text) == _sequential_normalize(text), repr(text)
+
+
+def test_text_without_triggers_is_returned_unchanged() -> None:
+    text = "pallavi\nvAtApi gaNapatim bhajEham"
+    assert normalize_garbled_diacritics(text) is text
@@ -0,0 +1,173 @@
+"""Document cache: extracted PDF text round-trips, and reparse mode starts from it."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import fitz
+import pytest
+
+from src.config import ExtractorConfig
+from src.db import ExtractionTask
+from src.document_cache import DocumentCache, decode_document, encode_document
+from src.extractor import PdfExtractor
+from src.ocr_engine import OcrEngine
+from src.worker import ExtractionWorker
+
+
+@pytest.fixture()
+def born_digital_pdf(tmp_path):
+    path = tmp_path / "anthology.pdf"
+    doc = fitz.open()
+    for title in ("SrI viSva nAthaM bhajEhaM", "vAtApi gaNapatiM bhajEhaM"):
+        page = doc.new_page()
+        page.insert_text((50, 50), title, fontsize=15)
+        page.insert_text((50, 72), "rAgaM: haMsadhvani  tALaM: Adi", fontsize=10)
+        page.insert_text((50, 100), "pallavi", fontsize=10)
+        page.insert_text((50, 114), "vAtApi gaNapatiM bhajEhaM vAraNAsyaM", fontsize=10, fontname="Times-Bold")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _task(pdf: Path) -> ExtractionTask:
+    return ExtractionTask(
+        id=uuid4(),
+        source_url=str(pdf),
+        source_format="PDF",
+        source_name="fixture",
+        source_tier=1,
+        request_payload={},
+        page_range=None,
+        import_batch_id=None,
+        import_task_run_id=None,
+        attempts=1,
+    )
+
+
+def _strategy(monkeypatch, cache_dir: Path, mode: str):
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv("SG_DOCUMENT_CACHE", mode)
+    monkeypatch.setenv("SG_OCR_PREFLIGHT", "false")
+    strategy = ExtractionWorker(ExtractorConfig()).pdf_strategy
+    strategy.ocr_fallback.dpi = 72
+    return strategy
+
+
+def _comparable(results):
+    return [r.model_copy(update={"extraction_timestamp": None}) for r in results]
+
+
+def test_round_trip_preserves_extracted_document(born_digital_pdf) -> None:
+    document = PdfExtractor().extract_document(born_digital_pdf)
+    assert {block.is_bold for page in document.pages for block in page.blocks} == {False, True}
+
+    cached = decode_document(encode_document("text", document), document.checksum, document.source_path)
+
+    assert cached.kind == "text"
+    assert cached.document == document
+
+
+def test_unreadable_entries_are_misses(tmp_path) -> None:
+    cache = DocumentCache(tmp_path)
+    assert cache.load("ab" * 32, "settings", "a.pdf") is None
+
+    path = tmp_path / "ab" / f"{'ab' * 32}-settings.sgdc"
+    path.parent.mkdir()
+    for garbage in (b"not a cache entry", b"SGDC\x01" + b"\x00" * 10):
+        path.write_bytes(garbage)
+        assert cache.load("ab" * 32, "settings", "a.pdf") is None
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch, born_digital_pdf) -> None:
+    document = PdfExtractor().extract_document(born_digital_pdf)
+    cache = DocumentCache(tmp_path / "documents")
+
+    def broken_encode(*_args):
+        raise RuntimeError("encode failed")
+
+    monkeypatch.setattr("src.document_cache.encode_document", broken_encode)
+    with pytest.raises(RuntimeError):
+        cache.store(document.checksum, "settings", "text", document)
+
+    assert [path for path in cache.root.rglob("*") if path.is_file()] == []
+
+
+def test_least_recently_used_entries_are_evicted_beyond_budget(tmp_path, born_digital_pdf) -> None:
+    document = PdfExtractor().extract_document(born_digital_pdf)
+    entry_bytes = len(encode_document("text", document))
+    cache = DocumentCache(tmp_path, max_bytes=2 * entry_bytes)
+    checksums = [f"{index:02d}" * 32 for index in range(3)]
+
+    for age, checksum in zip((300, 200), checksums, strict=False):
+        cache.store(checksum, "settings", "text", document)
+        os.utime(cache._path(checksum, "settings"), (time.time() - age, time.time() - age))
+    assert cache.load(checksums[0], "settings", "a.pdf") is not None  # now the most recently used
+    cache.store(checksums[2], "settings", "text", document)
+
+    assert [cache.load(checksum, "settings", "a.pdf") is not None for checksum in checksums] == [True, False, True]
+
+
+def test_reparse_starts_from_cached_text(tmp_path, monkeypatch, born_digital_pdf) -> None:
+    task = _task(born_digital_pdf)
+    written = _strategy(monkeypatch, tmp_path / "cache", "write").extract(task)
+    assert written
+
+    reparse = _strategy(monkeypatch, tmp_path / "cache", "reparse")
+
+    def no_pymupdf(*_args, **_kwargs):
+        raise AssertionError("PyMuPDF extraction ran in reparse mode")
+
+    monkeypatch.setattr(reparse.pdf_extractor, "extract_document", no_pymupdf)
+    monkeypatch.setattr(reparse.pdf_extractor, "is_text_extractable", no_pymupdf)
+
+    assert _comparable(reparse.extract(task)) == _comparable(written)
+
+
+def test_reparse_misses_when_text_settings_change(tmp_path, monkeypatch, born_digital_pdf) -> None:
+    task = _task(born_digital_pdf)
+    _strategy(monkeypatch, tmp_path / "cache", "write").extract(task)
+
+    monkeypatch.setenv("SG_PDF_STRIP_RUNNING_HEADERS", "true")
+    stripped = _strategy(monkeypatch, tmp_path / "cache", "reparse")
+    calls = []
+    extract_document = stripped.pdf_extractor.extract_document
+
+    def counting_extract_document(*args, **kwargs):
+        calls.append(args)
+        return extract_document(*args, **kwargs)
+
+    monkeypatch.setattr(stripped.pdf_extractor, "extract_document", counting_extract_document)
+
+    stripped.extract(task)
+
+    assert len(calls) == 1
+
+
+class _PageEngine(OcrEngine):
+    name = "page"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def recognize(self, pixmap: fitz.Pixmap) -> str:
+        self.calls += 1
+        return "अखिलान्डेश्वरि रक्ष माम\nराग : जुझावन्ति\nताल : आदि"
+
+
+def test_reparse_skips_ocr(tmp_path, monkeypatch, born_digital_pdf) -> None:
+    task = _task(born_digital_pdf)
+    write = _strategy(monkeypatch, tmp_path / "cache", "write")
+    monkeypatch.setattr(write.pdf_extractor, "is_text_extractable", lambda _path: False)
+    write.ocr_fallback._engine = _PageEngine()
+    written = write.extract(task)
+    assert [r.page_range for r in written] == ["1", "2"]
+
+    reparse = _strategy(monkeypatch, tmp_path / "cache", "reparse")
+    reparse.ocr_fallback._engine = engine = _PageEngine()
+
+    assert _comparable(reparse.extract(task)) == _comparable(written)
+    assert engine.calls == 0
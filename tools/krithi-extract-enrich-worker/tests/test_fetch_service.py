@@ -0,0 +1,111 @@
+"""Concurrent prefetch: per-host limits, politeness delay, and failure isolation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter, defaultdict
+from functools import partial
+
+import httpx
+
+from src.artifact_store import ArtifactStore
+from src.fetch_service import FetchService
+
+
+class _RecordingTransport(httpx.AsyncBaseTransport):
+    """Serves every URL after a short delay, recording per-host concurrency."""
+
+    def __init__(self, latency_s: float = 0.02, fail: frozenset[str] = frozenset()) -> None:
+        self.latency_s = latency_s
+        self.fail = fail
+        self.in_flight: Counter[str] = Counter()
+        self.peak: Counter[str] = Counter()
+        self.starts: defaultdict[str, list[float]] = defaultdict(list)
+        self.requests: list[str] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        self.requests.append(str(request.url))
+        self.starts[host].append(time.monotonic())
+        self.in_flight[host] += 1
+        self.peak[host] = max(self.peak[host], self.in_flight[host])
+        try:
+            await asyncio.sleep(self.latency_s)
+        finally:
+            self.in_flight[host] -= 1
+        if str(request.url) in self.fail:
+            return httpx.Response(503)
+        return httpx.Response(200, content=f"<html>{request.url.path}</html>".encode())
+
+
+def _urls(host: str, count: int) -> list[str]:
+    return [f"https://{host}/krithi-{n}.html" for n in range(count)]
+
+
+def test_requests_run_concurrently_within_the_per_host_limit(tmp_path) -> None:
+    transport = _RecordingTransport()
+    service = FetchService(ArtifactStore(tmp_path), per_host_limit=3, transport=transport)
+    urls = _urls("guru-guha.blogspot.com", 12) + _urls("govindan.example.org", 12)
+
+    fetched = service.prefetch(urls, ".html")
+
+    assert set(fetched) == set(urls)
+    assert transport.peak == {"guru-guha.blogspot.com": 3, "govindan.example.org": 3}
+    for url, artifact in fetched.items():
+        assert artifact.path.read_bytes() == f"<html>{httpx.URL(url).path}</html>".encode()
+
+
+def test_request_starts_to_one_host_are_spaced_by_the_delay(tmp_path) -> None:
+    transport = _RecordingTransport(latency_s=0.0)
+    service = FetchService(ArtifactStore(tmp_path), per_host_limit=4, host_delay_s=0.05, transport=transport)
+
+    service.prefetch(_urls("guru-guha.blogspot.com", 4), ".html")
+
+    starts = transport.starts["guru-guha.blogspot.com"]
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+    assert len(gaps) == 3
+    assert min(gaps) >= 0.04
+
+
+def test_failures_are_isolated_and_cached_urls_are_not_refetched(tmp_path) -> None:
+    urls = _urls("guru-guha.blogspot.com", 4)
+    store = ArtifactStore(tmp_path)
+    transport = _RecordingTransport(fail=frozenset({urls[1]}))
+    service = FetchService(store, transport=transport)
+
+    first = service.prefetch(urls, ".html")
+    second = service.prefetch(urls, ".html")
+
+    assert set(first) == {urls[0], urls[2], urls[3]}
+    assert store.lookup(urls[1]) is None
+    assert second.keys() == first.keys()
+    # Only the failed URL is requested again.
+    assert Counter(transport.requests) == {urls[0]: 1, urls[1]: 2, urls[2]: 1, urls[3]: 1}
+
+
+def test_revalidating_strategy_trusts_urls_it_just_prefetched(tmp_path, monkeypatch) -> None:
+    from src.config import ExtractorConfig
+    from src.worker import ExtractionWorker
+
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("EXTRACTION_CACHE_REVALIDATE", "true")
+    monkeypatch.setattr(
+        "src.extraction_strategies.FetchService", partial(FetchService, transport=_RecordingTransport())
+    )
+    strategy = ExtractionWorker(ExtractorConfig()).html_strategy
+    downloads: list[str] = []
+
+    def serve(request: httpx.Request) -> httpx.Response:
+        downloads.append(str(request.url))
+        return httpx.Response(200, content=b"<html>fresh</html>")
+
+    strategy._http_client = httpx.Client(transport=httpx.MockTransport(serve))
+    [url] = _urls("guru-guha.blogspot.com", 1)
+
+    assert strategy.prefetch_sources([url]) == 1
+    strategy._download_source(url)
+    assert downloads == []
+    # Only the download right after the prefetch is exempt.
+    strategy._download_source(url)
+    assert downloads == [url]
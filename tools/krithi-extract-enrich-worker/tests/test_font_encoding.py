@@ -0,0 +1,132 @@
+"""Font-encoding registry: glyph maps derived from embedded Type 1 encoding vectors."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import fitz
+
+from src import font_encoding
+from src.font_encoding import FontEncodingRegistry, derive_glyph_map, parse_encoding_vector
+from src.velthuis_decoder import _GLYPH_MAP
+
+# dvngi10-style vector: ण् where dvng10 has न्, plus a uniXXXX-named glyph.
+VELTHUIS_PROGRAM = b"""%!PS-AdobeFont-1.0: Velthuis-dvngi10
+/Encoding 256 array
+dup 6 /halfnna put
+dup 34 /ksa put
+dup 200 /uni0915 put
+dup 201 /notaname put
+readonly def
+"""
+
+# A legacy Indic font outside the Velthuis family, named with uniXXXX glyphs.
+LEGACY_PROGRAM = b"""%!PS-AdobeFont-1.0: Sanskrit-Legacy
+/Encoding 256 array
+dup 65 /uni0915 put
+dup 66 /uni0916 put
+readonly def
+"""
+
+
+def _doc_with_font(basefont: str, program: bytes, *, to_unicode: bool = False) -> fitz.Document:
+    """A one-page document whose resources carry an embedded Type 1 font."""
+    doc = fitz.open()
+    page = doc.new_page()
+    stream_xref = doc.get_new_xref()
+    doc.update_object(stream_xref, "<< >>")
+    doc.update_stream(stream_xref, program)
+    descriptor_xref = doc.get_new_xref()
+    doc.update_object(descriptor_xref, f"<< /Type /FontDescriptor /FontName /{basefont} /FontFile {stream_xref} 0 R >>")
+    font_xref = doc.get_new_xref()
+    extra = ""
+    if to_unicode:
+        cmap_xref = doc.get_new_xref()
+        doc.update_object(cmap_xref, "<< >>")
+        doc.update_stream(cmap_xref, b"")
+        extra = f" /ToUnicode {cmap_xref} 0 R"
+    doc.update_object(
+        font_xref,
+        f"<< /Type /Font /Subtype /Type1 /BaseFont /{basefont} /FontDescriptor {descriptor_xref} 0 R{extra} >>",
+    )
+    doc.xref_set_key(page.xref, "Resources", f"<< /Font << /F1 {font_xref} 0 R >> >>")
+    return doc
+
+
+def test_parse_encoding_vector() -> None:
+    assert parse_encoding_vector(VELTHUIS_PROGRAM) == {6: "halfnna", 34: "ksa", 200: "uni0915", 201: "notaname"}
+    assert parse_encoding_vector(b"%!PS no vector") is None
+
+
+def test_velthuis_encodings_are_only_checked_against_dvng10(caplog) -> None:
+    encoding = parse_encoding_vector(VELTHUIS_PROGRAM)
+    assert encoding is not None
+
+    with caplog.at_level(logging.INFO, logger="src.font_encoding"):
+        assert derive_glyph_map("Velthuis-dvngi10", encoding) is None
+
+    [record] = [r for r in caplog.records if r.getMessage() == "Font encoding differs from the Velthuis-dvng10 map"]
+    assert record.codes == [6]  # set via logging extra
+    assert _GLYPH_MAP[6] == "न्"  # what the span keeps, not the vector's ण्
+
+
+def test_non_velthuis_fonts_need_an_indic_glyph() -> None:
+    assert derive_glyph_map("CMR10", {40: "parenleft", 48: "zero"}) is None
+    assert derive_glyph_map("Sanskrit-Legacy", {65: "uni0915", 40: "parenleft"}) == {65: "क", 40: "("}
+
+
+def test_registry_decodes_embedded_font_and_caches_on_disk(tmp_path, monkeypatch) -> None:
+    doc = _doc_with_font("ABCDEF+Sanskrit-Legacy", LEGACY_PROGRAM)
+
+    decoders = FontEncodingRegistry(tmp_path).decoders_for(doc, [0])
+
+    assert set(decoders) == {"Sanskrit-Legacy"}
+    assert decoders["Sanskrit-Legacy"].decode_text("AB") == "कख"
+    assert len(list(tmp_path.glob("Sanskrit-Legacy-*.json"))) == 1
+
+    # A fresh registry (next worker, next document) reuses the cached map
+    # without parsing the font program again.
+    def no_parse(_program: bytes) -> None:
+        raise AssertionError("font program parsed again")
+
+    monkeypatch.setattr(font_encoding, "parse_encoding_vector", no_parse)
+    decoders = FontEncodingRegistry(tmp_path).decoders_for(doc, [0])
+    assert decoders["Sanskrit-Legacy"].decode_text("AB") == "कख"
+
+
+def test_registry_leaves_velthuis_fonts_to_the_dvng10_decoder(tmp_path) -> None:
+    doc = _doc_with_font("ABCDEF+Velthuis-dvngi10", VELTHUIS_PROGRAM)
+
+    # A map cached before Velthuis fonts were left to dvng10 is derived again.
+    registry = FontEncodingRegistry(tmp_path)
+    key = ("Velthuis-dvngi10", "0" * 64)
+    path = registry._cache_path(key)
+    assert path is not None
+    path.write_text(json.dumps({"font": key[0], "sha256": key[1], "glyph_map": {"6": "ण्"}}), encoding="utf-8")
+    assert registry.glyph_map(key, lambda: VELTHUIS_PROGRAM) is None
+
+    assert FontEncodingRegistry(tmp_path).decoders_for(doc, [0]) == {}
+    # The check is recorded, so later documents skip the font program.
+    assert len(list(tmp_path.glob("Velthuis-dvngi10-*.json"))) == 2
+
+
+def test_fonts_with_to_unicode_or_latin_glyphs_are_left_to_mupdf(tmp_path) -> None:
+    registry = FontEncodingRegistry(tmp_path)
+    indic = b"/Encoding 256 array\ndup 65 /uni0915 put\n"
+
+    assert registry.decoders_for(_doc_with_font("Legacy-Deva", indic, to_unicode=True), [0]) == {}
+    assert registry.decoders_for(_doc_with_font("CMR10", b"dup 48 /zero put\n"), [0]) == {}
+    assert set(registry.decoders_for(_doc_with_font("Legacy-Deva", indic), [0])) == {"Legacy-Deva"}
+
+
+def test_extractor_output_is_unchanged_for_standard_fonts(tmp_path) -> None:
+    from src.extractor import PdfExtractor
+
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "kalyANi - Adi", fontsize=12)
+    pdf = tmp_path / "plain.pdf"
+    doc.save(pdf)
+
+    with_registry = PdfExtractor(font_registry=FontEncodingRegistry(tmp_path / "fonts"))
+    assert with_registry.extract_document(pdf).pages == PdfExtractor().extract_document(pdf).pages
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import pytest
 
-from src.structure_parser import StructureParser
+from src.structure_parser import StructureParser, _ParseContext
 
 # Minimal synthetic blobs, one per script, with P / A / C1 / C2 markers.
 _BLOBS = {
@@ -45,17 +45,15 @@ class TestIndicPacSplitting:
         ],
     )
     def test_detect_when_enabled(self, header: str, expected: str) -> None:
-        parser = StructureParser()
-        parser._inline_indic_pac_enabled = True
-        m = parser._detect_section_header(header)
+        m = StructureParser()._detect_section_header(header, _ParseContext(inline_indic_pac_enabled=True))
         assert m is not None and m.label == expected, f"{header!r} -> {m}"
 
 
 class TestGatingPreventsFalsePositives:
     def test_disabled_by_default(self) -> None:
         """Without the gate, a lyric line beginning with प/अ/च is not a header."""
-        parser = StructureParser()
-        assert getattr(parser, "_inline_indic_pac_enabled", False) is False
+        assert _ParseContext().inline_indic_pac_enabled is False
+        assert _ParseContext.for_text("पल्लवि\nचरणम्").inline_indic_pac_enabled is False
         # A full-word-header document must not activate the abbreviation patterns.
         blob = "पल्लवि\nकामाक्षि पदमु\nचरणम्\nप्रथम चरणमु"
         types = [s.section_type.value for s in StructureParser().parse(blob).sections]
@@ -63,6 +61,5 @@ class TestGatingPreventsFalsePositives:
 
     def test_bare_letter_without_period_not_matched(self) -> None:
         """The period is the disambiguator — 'प foo' (no period) is lyric."""
-        parser = StructureParser()
-        parser._inline_indic_pac_enabled = True
-        assert parser._detect_section_header("प रामुनि") is None
+        context = _ParseContext(inline_indic_pac_enabled=True)
+        assert StructureParser()._detect_section_header("प रामुनि", context) is None
@@ -10,7 +10,7 @@ the digit, which is then stripped from the section text.
 
 from __future__ import annotations
 
-from src.structure_parser import StructureParser
+from src.structure_parser import StructureParser, _ParseContext
 
 _GIRIPAI_LATIN = (
     "P 1giripai nelakonna rAmuni\nguri tappaka kaNTi\n\n"
@@ -30,6 +30,6 @@ def test_pallavi_with_footnote_digit_detected() -> None:
 def test_inline_p_marker_requires_separating_space() -> None:
     """A lyric word beginning with 'P' (no separating space) is not a P marker."""
     parser = StructureParser()
-    parser._inline_pa_enabled = True
+    context = _ParseContext(inline_pa_enabled=True)
     # 'Priya' → 'P' immediately followed by 'r', no space: inline rule must not fire.
-    assert parser._detect_section_header("Priya rAma nAmamu") is None
+    assert parser._detect_section_header("Priya rAma nAmamu", context) is None
@@ -0,0 +1,144 @@
+"""The compiled line classifier must agree with the check-by-check boilerplate/meta tests."""
+
+from __future__ import annotations
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from src.structure_parser import (
+    METADATA_KEYWORDS,
+    RAGA_SUBSECTION_PATTERN,
+    VILOMA_SUBSECTION_PATTERN,
+    StructureParser,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+_FOOTER_MARKERS = (
+    "powered by blogger",
+    "newer post",
+    "older post",
+    "subscribe to",
+    "post a comment",
+    "blog archive",
+    "link to this post",
+    "posted by",
+    "all rights reserved",
+    "copyright",
+    "skip to main",
+    "related posts",
+)
+
+
+def _reference_is_boilerplate(line: str) -> bool:
+    """The per-check implementation the compiled classifier replaced."""
+    lowered = line.lower()
+    if lowered == "back" or lowered.startswith("meaning of kriti"):
+        return True
+    if "a i i u u" in lowered or "ch j jh" in lowered or "ph b bh m" in lowered:
+        return True
+    if "pronunciation guide" in lowered:
+        return True
+    if ("(short)" in lowered or "(long)" in lowered) and re.search(r"[ऀ-ॿ].*-\s*[a-zA-Z]", line):
+        return True
+    if re.match(r"^[ऀ-ൿ]\s*,\s*[ऀ-ൿ]", line):
+        return True
+    if re.search(r"[ऀ-ॿ]", line) and re.search(r"[଀-ൿ]", line):
+        return True
+    if re.match(r"^\s*\([^)]*\s-\s[^)]*\)\s*$", line):
+        return True
+    if re.match(r"^\s*\(?n[oō]t+u[\s-]*svara\s+s[aā]hityam?\)?\.?\s*$", lowered):
+        return True
+    if lowered.startswith("updated on "):
+        return True
+    return any(marker in lowered for marker in _FOOTER_MARKERS)
+
+
+def _reference_is_meta_line(line: str) -> bool:
+    if RAGA_SUBSECTION_PATTERN.search(line) or VILOMA_SUBSECTION_PATTERN.search(line):
+        return False
+    lowered = line.lower()
+    return any(keyword in lowered for keyword in METADATA_KEYWORDS)
+
+
+def _fixture_lines() -> list[str]:
+    lines: list[str] = []
+    for path in sorted(FIXTURES.rglob("*")):
+        if path.suffix in {".txt", ".html"}:
+            lines.extend(path.read_text(encoding="utf-8").splitlines())
+    return lines
+
+
+# Fragments that trip (or nearly trip) each branch, for random recombination.
+_FRAGMENTS = [
+    "Back",
+    "back ",
+    "Meaning of Kriti",
+    "meaning of",
+    "Updated on ",
+    "updated",
+    "A I I U U",
+    "ch j jh",
+    "ph b bh",
+    "Pronunciation Guide",
+    "(short)",
+    "(long)",
+    "ऎ,कॆ",
+    " - ",
+    "-e",
+    "க,ச",
+    "க",
+    "श",
+    "(",
+    ")",
+    "(ச3 - ஜ)",
+    "nOTTu svara sAhityam",
+    "(nottu-svara sahitya).",
+    "Copyright",
+    "Posted by",
+    "older posts",
+    "Raga",
+    "tAlam",
+    "composed by",
+    "kalyANi rAgaM",
+    "vilOma - tODi rAgaM",
+    "1. ",
+    "vAtApi",
+    " ",
+    "\t",
+    "İ",
+]
+
+
+def test_classifier_matches_reference_on_fixture_lines() -> None:
+    parser = StructureParser()
+    lines = _fixture_lines()
+    assert len(lines) > 500
+    for line in lines:
+        assert parser._is_boilerplate(line) is _reference_is_boilerplate(line), line
+        assert parser._is_meta_line(line) is _reference_is_meta_line(line), line
+
+
+def test_classifier_matches_reference_on_random_lines() -> None:
+    parser = StructureParser()
+    rng = random.Random(39)
+    for _ in range(20_000):
+        line = "".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 5)))
+        assert parser._is_boilerplate(line) is _reference_is_boilerplate(line), line
+        assert parser._is_meta_line(line) is _reference_is_meta_line(line), line
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("Raga: kalyANi", True),
+        ("Composed by Tyagaraja", True),
+        ("kalyANi rAgaM", False),  # ragamalika subsection header, not metadata
+        ("vAtApi gaNapatim bhajE", False),
+    ],
+)
+def test_meta_line(line: str, expected: bool) -> None:
+    assert StructureParser()._is_meta_line(line) is expected
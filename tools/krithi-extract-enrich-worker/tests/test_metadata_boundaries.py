@@ -0,0 +1,92 @@
+"""The fused metadata-boundary scan must agree with one `finditer` per pattern."""
+
+from __future__ import annotations
+
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from src import structure_parser
+from src.structure_parser import METADATA_BOUNDARY_PATTERNS, MetadataBoundary, StructureParser, _fuse_boundary_patterns
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _reference_boundaries(text: str) -> list[MetadataBoundary]:
+    """The per-pattern scan merged by start position that the fused scan replaced."""
+    boundaries_by_pos: dict[int, MetadataBoundary] = {}
+    for label, pattern in METADATA_BOUNDARY_PATTERNS:
+        for match in pattern.finditer(text):
+            start = match.start()
+            existing = boundaries_by_pos.get(start)
+            candidate = MetadataBoundary(label=label, start_pos=start, end_pos=match.end())
+            if existing is None or candidate.end_pos > existing.end_pos:
+                boundaries_by_pos[start] = candidate
+    return [boundaries_by_pos[pos] for pos in sorted(boundaries_by_pos)]
+
+
+_FRAGMENTS = [
+    "\n",
+    "\n\n",
+    "  ",
+    "\t",
+    "Meaning",
+    "meaning of",
+    " the kriti",
+    "Artha",
+    "artham",
+    "भावार्थ",
+    "GIST",
+    "summary",
+    "Notes",
+    "note on",
+    "note by",
+    "tippani",
+    "Word Division",
+    "word\ndivision",
+    "pada ccheda",
+    "Variations",
+    "alternate reading",
+    "pallavi",
+    ":",
+    "-",
+    "x",
+]
+
+
+def test_fused_scan_matches_reference_on_fixtures() -> None:
+    parser = StructureParser()
+    for path in sorted(FIXTURES.rglob("*")):
+        if path.suffix in {".txt", ".html"}:
+            text = path.read_text(encoding="utf-8")
+            assert parser._find_metadata_boundaries(text) == _reference_boundaries(text), path.name
+
+
+def test_fused_scan_matches_reference_on_random_text() -> None:
+    parser = StructureParser()
+    rng = random.Random(40)
+    for _ in range(5_000):
+        text = "".join(rng.choices(_FRAGMENTS, k=rng.randint(1, 12)))
+        assert parser._find_metadata_boundaries(text) == _reference_boundaries(text), text
+
+
+def test_longest_match_wins_at_a_shared_start(monkeypatch) -> None:
+    flags = re.IGNORECASE | re.MULTILINE
+    scan, bodies = _fuse_boundary_patterns(
+        [("SHORT", re.compile(r"^\s*note\b", flags)), ("LONG", re.compile(r"^\s*note\s+on\b", flags))]
+    )
+    monkeypatch.setattr(structure_parser, "_METADATA_BOUNDARY_SCAN", scan)
+    monkeypatch.setattr(structure_parser, "_METADATA_BOUNDARY_BODIES", bodies)
+    monkeypatch.setattr(structure_parser, "_METADATA_BOUNDARY_RANK", {"SHORT": 0, "LONG": 1})
+
+    assert StructureParser()._find_metadata_boundaries("pallavi\n  note on raga\nnote") == [
+        MetadataBoundary(label="LONG", start_pos=8, end_pos=17),
+        MetadataBoundary(label="SHORT", start_pos=23, end_pos=27),
+    ]
+
+
+def test_patterns_must_share_the_line_start_prefix() -> None:
+    with pytest.raises(ValueError, match="must start with"):
+        _fuse_boundary_patterns([("NOTES", re.compile(r"notes\b", re.MULTILINE))])
@@ -1,6 +1,13 @@
 """Tests for consolidated matching normalizer."""
 
-from src.normalizer import normalize_for_matching, normalize_garbled_diacritics
+from src.identity_candidates import normalize_identity_text, normalize_identity_texts
+from src.normalizer import (
+    clear_normalization_caches,
+    normalization_cache_stats,
+    normalize_for_matching,
+    normalize_garbled_diacritics,
+    normalize_many_for_matching,
+)
 
 TITLE_PAIRS = [
     # Required examples from request.
@@ -85,3 +92,21 @@ def test_transliteration_collapse_order_longest_match_first() -> None:
 
 def test_garbled_diacritic_cleanup_is_available() -> None:
     assert normalize_garbled_diacritics("r\u00afaga \u02d9m") == "rāgaṁ"
+
+
+def test_repeated_keys_are_served_from_the_cache() -> None:
+    clear_normalization_caches()
+    for _ in range(3):
+        assert normalize_for_matching("Muthuswāmi Dīkṣitar", "composer") == "muttusvami diksitar"
+        assert normalize_identity_text("Kedāra Gaula") == "kedara gaula"
+
+    stats = {entry.name: entry for entry in normalization_cache_stats()}
+    assert (stats["matching"].hits, stats["matching"].misses, stats["matching"].size) == (2, 1, 1)
+    assert (stats["identity"].hits, stats["identity"].misses) == (2, 1)
+    assert stats["matching"].hit_rate == 2 / 3
+
+
+def test_batch_normalization_matches_single_calls() -> None:
+    ragas = ["Kalyāṇi", "Tōḍi", "Kalyāṇi", "", "Śankarābharaṇam"]
+    assert normalize_many_for_matching(ragas, "raga") == [normalize_for_matching(raga, "raga") for raga in ragas]
+    assert normalize_identity_texts(ragas) == [normalize_identity_text(raga) for raga in ragas]
@@ -0,0 +1,101 @@
+"""OCR engines: the persistent Tesseract handle is created once and fed pixmaps in memory."""
+
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from src.ocr_engine import PytesseractEngine, TesserocrEngine, create_ocr_engine
+from src.ocr_fallback import OcrFallback
+
+
+class _FakeTessApi:
+    instances: list[_FakeTessApi] = []
+
+    def __init__(self, lang: str, psm: int) -> None:
+        self.lang = lang
+        self.psm = psm
+        self.images: list[tuple[int, int, int, int, int]] = []
+        self.ended = False
+        _FakeTessApi.instances.append(self)
+
+    def SetImageBytes(self, data: bytes, width: int, height: int, bpp: int, bpl: int) -> None:  # noqa: N802
+        assert len(data) == height * bpl
+        self.images.append((len(data), width, height, bpp, bpl))
+
+    def GetUTF8Text(self) -> str:  # noqa: N802
+        return f"page {len(self.images)}"
+
+    def End(self) -> None:  # noqa: N802
+        self.ended = True
+
+
+@pytest.fixture()
+def fake_tesserocr(monkeypatch):
+    _FakeTessApi.instances = []
+    monkeypatch.setitem(sys.modules, "tesserocr", SimpleNamespace(PyTessBaseAPI=_FakeTessApi, PSM=int))
+    return _FakeTessApi
+
+
+@pytest.fixture()
+def scanned_pdf(tmp_path):
+    path = tmp_path / "scanned.pdf"
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page(width=144, height=144)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_tesserocr_handle_is_reused_across_pages_and_documents(fake_tesserocr, scanned_pdf) -> None:
+    ocr = OcrFallback(languages=["sa", "en"], dpi=72, preflight=False)
+
+    first = ocr.extract_document_text(scanned_pdf)
+    second = ocr.extract_document_text(scanned_pdf, page_range=(1, 2))
+
+    assert len(fake_tesserocr.instances) == 1, "traineddata must be loaded once"
+    api = fake_tesserocr.instances[0]
+    assert api.lang == "san+eng" and api.psm == 6
+    assert first == {0: "page 1", 1: "page 2", 2: "page 3"}
+    assert second == {1: "page 4", 2: "page 5"}
+    # RGB samples passed straight from the pixmap: 144x144 at 72 DPI, 3 bytes per pixel.
+    assert api.images[0][1:4] == (144, 144, 3)
+
+    ocr.close()
+    assert api.ended
+
+
+def test_auto_falls_back_to_pytesseract(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "tesserocr", None)
+    monkeypatch.setitem(sys.modules, "pytesseract", SimpleNamespace(image_to_string=lambda *_a, **_k: ""))
+    monkeypatch.setitem(sys.modules, "PIL", SimpleNamespace(Image=SimpleNamespace()))
+
+    assert isinstance(create_ocr_engine("eng"), PytesseractEngine)
+
+
+def test_auto_prefers_tesserocr(fake_tesserocr) -> None:
+    assert isinstance(create_ocr_engine("tam+eng"), TesserocrEngine)
+
+
+def test_auto_falls_back_when_traineddata_is_missing(monkeypatch) -> None:
+    def missing_traineddata(lang: str, psm: int) -> None:
+        raise RuntimeError("Failed to init API, possibly an invalid tessdata path: /usr/share/tessdata/")
+
+    monkeypatch.setitem(sys.modules, "tesserocr", SimpleNamespace(PyTessBaseAPI=missing_traineddata, PSM=int))
+    monkeypatch.setitem(sys.modules, "pytesseract", SimpleNamespace(image_to_string=lambda *_a, **_k: ""))
+    monkeypatch.setitem(sys.modules, "PIL", SimpleNamespace(Image=SimpleNamespace()))
+
+    assert isinstance(create_ocr_engine("san+eng"), PytesseractEngine)
+    with pytest.raises(RuntimeError):
+        create_ocr_engine("san+eng", backend="tesserocr")
+
+
+def test_explicit_backend_that_is_not_installed_raises(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "tesserocr", None)
+
+    with pytest.raises(ImportError):
+        create_ocr_engine("eng", backend="tesserocr")
@@ -0,0 +1,110 @@
+"""Pre-OCR page analysis: blank and plate pages are skipped, text pages cropped."""
+
+from __future__ import annotations
+
+import fitz
+import pytest
+
+from src.ocr_engine import OcrEngine
+from src.ocr_fallback import OcrFallback
+from src.ocr_preflight import analyze_page
+
+
+def _text_page(doc: fitz.Document) -> fitz.Page:
+    page = doc.new_page()
+    for line in range(6):
+        page.insert_text((72, 100 + line * 20), "vAtApi gaNapatim bhajEham", fontsize=14)
+    return page
+
+
+def _plate_page(doc: fitz.Document) -> fitz.Page:
+    page = doc.new_page()
+    page.draw_rect(fitz.Rect(40, 40, 560, 760), color=(0.2, 0.2, 0.2), fill=(0.2, 0.2, 0.2))
+    return page
+
+
+def _bordered_text_page(doc: fitz.Document) -> fitz.Page:
+    page = _text_page(doc)
+    # A dark scanner edge down the left side and along the bottom.
+    page.draw_rect(fitz.Rect(0, 0, 12, page.rect.height), color=(0, 0, 0), fill=(0, 0, 0))
+    page.draw_rect(
+        fitz.Rect(0, page.rect.height - 10, page.rect.width, page.rect.height), color=(0, 0, 0), fill=(0, 0, 0)
+    )
+    return page
+
+
+def test_blank_page_is_skipped() -> None:
+    doc = fitz.open()
+    assert analyze_page(doc.new_page()).kind == "blank"
+
+
+def test_a_lone_title_line_is_not_blank() -> None:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 100), "Part II", fontsize=12)
+    assert analyze_page(page).kind == "text"
+
+
+def test_full_page_plate_is_skipped() -> None:
+    doc = fitz.open()
+    layout = analyze_page(_plate_page(doc))
+    assert layout.kind == "plate"
+
+
+def test_text_page_is_cropped_to_its_text_region() -> None:
+    doc = fitz.open()
+    layout = analyze_page(_text_page(doc))
+
+    assert layout.kind == "text"
+    assert layout.clip is not None
+    # The six lines sit between y=86 and y=200 starting at x=72.
+    assert layout.clip.y0 < 86 and layout.clip.y1 > 200
+    assert layout.clip.x0 < 72
+    assert layout.clip.get_area() < doc[0].rect.get_area() / 2
+
+
+def test_scanner_border_neither_counts_as_ink_nor_widens_the_crop() -> None:
+    doc = fitz.open()
+    bordered = analyze_page(_bordered_text_page(doc))
+    clean = analyze_page(_text_page(doc))
+
+    assert bordered.kind == "text"
+    assert bordered.clip is not None and clean.clip is not None
+    assert bordered.clip.y1 == pytest.approx(clean.clip.y1, abs=4)
+    assert bordered.clip.x0 >= 12
+
+
+class _RecordingEngine(OcrEngine):
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.sizes: list[tuple[int, int]] = []
+
+    def recognize(self, pixmap: fitz.Pixmap) -> str:
+        self.sizes.append((pixmap.width, pixmap.height))
+        return "ocr-text"
+
+
+def test_ocr_skips_and_crops_and_reports_counts(tmp_path) -> None:
+    path = tmp_path / "anthology.pdf"
+    doc = fitz.open()
+    _text_page(doc)
+    doc.new_page()
+    _plate_page(doc)
+    _text_page(doc)
+    doc.save(str(path))
+    doc.close()
+
+    ocr = OcrFallback(dpi=72)
+    engine = _RecordingEngine()
+    ocr._engine = engine
+
+    texts = ocr.extract_document_text(path)
+
+    assert texts == {0: "ocr-text", 1: "", 2: "", 3: "ocr-text"}
+    assert len(engine.sizes) == 2
+    assert all(width < 595 and height < 842 for width, height in engine.sizes), "pages must be cropped"
+    stats = ocr.last_stats
+    assert (stats.pages, stats.ocr_pages, stats.cropped_pages) == (4, 2, 2)
+    assert (stats.skipped_blank, stats.skipped_plate) == (1, 1)
+    assert stats.skipped_page_numbers == [1, 2]
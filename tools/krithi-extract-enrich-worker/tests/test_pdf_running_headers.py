@@ -0,0 +1,61 @@
+"""Running-header and footer removal for born-digital PDFs."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+
+from src.extractor import PdfExtractor
+
+LYRICS = [
+    "pallavi",
+    "vAtApi gaNapatim bhajEham",
+    "anupallavi",
+    "bhUtAdi samsEvita caraNam",
+]
+
+
+def _anthology(path: Path, pages: int = 5) -> Path:
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 30), "Dikshitar Kritis - Volume I", fontsize=9)
+        page.insert_text((72, 90), f"Kriti {number + 1}", fontsize=16, fontname="hebo")
+        for line, text in enumerate(LYRICS):
+            page.insert_text((72, 130 + line * 20), text, fontsize=11)
+        if number == 1:
+            page.insert_image(fitz.Rect(300, 300, 360, 360), pixmap=fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8)))
+        page.insert_text((290, page.rect.height - 20), f"Page {number + 10}", fontsize=9)
+    doc.save(path)
+    return path
+
+
+def test_only_band_lines_are_removed(tmp_path) -> None:
+    pdf = _anthology(tmp_path / "anthology.pdf")
+
+    default = PdfExtractor().extract_document(pdf, page_range=(1, 4))
+    stripped = PdfExtractor(strip_running_headers=True).extract_document(pdf, page_range=(1, 4))
+
+    assert [page.page_number for page in stripped.pages] == [1, 2, 3, 4]
+    for full, page in zip(default.pages, stripped.pages, strict=True):
+        assert full.text.splitlines()[1:-1] == page.text.splitlines()
+        assert (full.width, full.height) == (page.width, page.height)
+
+
+def test_running_headers_and_page_numbers_are_stripped(tmp_path) -> None:
+    pdf = _anthology(tmp_path / "anthology.pdf")
+
+    doc = PdfExtractor(strip_running_headers=True).extract_document(pdf)
+
+    for number, page in enumerate(doc.pages):
+        assert page.text.splitlines() == [f"Kriti {number + 1}", *LYRICS]
+        assert all("Volume" not in block.text and "Page" not in block.text for block in page.blocks)
+
+
+def test_short_ranges_keep_their_band_lines(tmp_path) -> None:
+    pdf = _anthology(tmp_path / "anthology.pdf")
+
+    doc = PdfExtractor(strip_running_headers=True).extract_document(pdf, page_range=(0, 1))
+
+    assert doc.pages[0].text.splitlines()[0] == "Dikshitar Kritis - Volume I"
@@ -0,0 +1,137 @@
+"""Corpus re-extraction: stale DONE tasks are rebuilt, diffed and only changes written back."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID, uuid4
+
+import fitz
+import pytest
+
+from src.config import ExtractorConfig
+from src.db import DoneExtraction, ExtractionTask, RewrittenResults
+from src.reextract import CorpusReextractor, diff_results, version_is_older
+from src.worker import ExtractionWorker
+
+
+def test_version_is_older() -> None:
+    current = "krithi-extract-enrich-worker:1.10.0"
+    assert version_is_older("krithi-extract-enrich-worker:1.9.2", current)
+    assert version_is_older(None, current)
+    assert version_is_older("legacy", current)
+    assert not version_is_older("krithi-extract-enrich-worker:1.10.0", current)
+    assert not version_is_older("krithi-extract-enrich-worker:2.0.0", current)
+
+
+def test_diff_ignores_extraction_timestamp() -> None:
+    old = [{"title": "a", "tala": "Adi", "extractionTimestamp": "2026-01-01T00:00:00Z"}]
+    assert not diff_results(old, [{**old[0], "extractionTimestamp": "2026-10-19T00:00:00Z"}])
+    assert diff_results(old, [{"title": "a", "tala": "Rupakam"}, {"title": "b"}]) == {"tala": 1, "+result": 1}
+    assert diff_results(old * 2, []) == {"-result": 2}
+
+
+class _FakeQueueDB:
+    """The two queue calls the re-extractor makes, over an in-memory table."""
+
+    def __init__(self, rows: list[DoneExtraction]) -> None:
+        self.rows = sorted(rows, key=lambda row: row.task.id)
+        self.pages: list[int] = []
+        self.rewrites: list[tuple[list[RewrittenResults], list[UUID]]] = []
+
+    def list_done_extractions(
+        self, *, exclude_version: str, after_id: UUID | None, limit: int, source_format: str | None = None
+    ) -> list[DoneExtraction]:
+        page = [
+            row
+            for row in self.rows
+            if row.extractor_version != exclude_version and (after_id is None or row.task.id > after_id)
+        ][:limit]
+        self.pages.append(len(page))
+        return page
+
+    def rewrite_done_results(
+        self, changed: Sequence[RewrittenResults], unchanged: Sequence[UUID], *, as_rows: bool = False
+    ) -> int:
+        self.rewrites.append((list(changed), list(unchanged)))
+        return len(changed)
+
+
+@pytest.fixture()
+def born_digital_pdf(tmp_path):
+    path = tmp_path / "krithi.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "vAtApi gaNapatiM bhajEhaM", fontsize=15)
+    page.insert_text((50, 72), "rAgaM: haMsadhvani  tALaM: Adi", fontsize=10)
+    page.insert_text((50, 100), "pallavi", fontsize=10)
+    page.insert_text((50, 114), "vAtApi gaNapatiM bhajEhaM vAraNAsyaM", fontsize=10)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _task(source_url: str) -> ExtractionTask:
+    return ExtractionTask(
+        id=uuid4(),
+        source_url=source_url,
+        source_format="PDF",
+        source_name="fixture",
+        source_tier=1,
+        request_payload={},
+        page_range=None,
+        import_batch_id=None,
+        import_task_run_id=None,
+        attempts=1,
+    )
+
+
+@pytest.fixture()
+def config(tmp_path, monkeypatch) -> ExtractorConfig:
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("EXTRACTOR_VERSION", "1.1.0")
+    monkeypatch.setenv("SG_OCR_PREFLIGHT", "false")
+    monkeypatch.setenv("SG_ENABLE_IDENTITY_DISCOVERY", "false")
+    return ExtractorConfig()
+
+
+def _corpus(config: ExtractorConfig, pdf) -> tuple[list[dict[str, Any]], dict[str, DoneExtraction]]:
+    current = [r.to_json_dict() for r in ExtractionWorker(config).pdf_strategy.extract(_task(str(pdf)))]
+    assert current
+    stale = [{**current[0], "tala": "Rupakam"}]
+    rows = {
+        "changed": DoneExtraction(_task(str(pdf)), "krithi-extract-enrich-worker:1.0.0", stale),
+        "unchanged": DoneExtraction(_task(str(pdf)), "krithi-extract-enrich-worker:1.0.0", current),
+        "newer": DoneExtraction(_task(str(pdf)), "krithi-extract-enrich-worker:2.0.0", stale),
+        "missing": DoneExtraction(_task(str(pdf.with_name("gone.pdf"))), None, stale),
+    }
+    return current, rows
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_reextract_writes_back_only_changed_tasks(config, born_digital_pdf, workers: int) -> None:
+    current, rows = _corpus(config, born_digital_pdf)
+    db = _FakeQueueDB(list(rows.values()))
+
+    stats = CorpusReextractor(config, db, workers=workers, batch_size=2).run()
+
+    assert (stats.scanned, stats.changed, stats.unchanged, stats.failed, stats.skipped_newer) == (4, 1, 1, 1, 1)
+    assert stats.field_changes == {"tala": 1}
+    assert stats.written == 1
+    assert db.pages == [2, 2, 0]
+    [changed] = [result for batch, _ in db.rewrites for result in batch]
+    assert changed.task_id == rows["changed"].task.id
+    assert not diff_results(current, [json.loads(document) for document in changed.result_documents])
+    assert [task_id for _, unchanged in db.rewrites for task_id in unchanged] == [rows["unchanged"].task.id]
+
+
+def test_dry_run_reports_without_writing(config, born_digital_pdf) -> None:
+    _, rows = _corpus(config, born_digital_pdf)
+    db = _FakeQueueDB(list(rows.values()))
+
+    stats = CorpusReextractor(config, db, dry_run=True, limit=3).run()
+
+    assert stats.scanned == 3
+    assert stats.written == 0
+    assert db.rewrites == []
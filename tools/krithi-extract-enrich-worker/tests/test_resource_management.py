@@ -77,6 +77,8 @@ def _install_fake_ocr_stack(monkeypatch) -> None:
     fake_image_mod = SimpleNamespace(frombytes=lambda _mode, _size, _data: object())
     fake_pil = SimpleNamespace(Image=fake_image_mod)
 
+    # Pin the pytesseract backend even where tesserocr is installed.
+    monkeypatch.setitem(sys.modules, "tesserocr", None)
     monkeypatch.setitem(sys.modules, "pytesseract", fake_tess)
     monkeypatch.setitem(sys.modules, "PIL", fake_pil)
     monkeypatch.setitem(sys.modules, "PIL.Image", fake_image_mod)
@@ -105,6 +107,7 @@ def test_ocr_opens_the_document_once_for_a_multi_page_range(three_page_pdf, monk
 
 def test_ocr_missing_stack_still_returns_one_entry_per_page(three_page_pdf, monkeypatch) -> None:
     """Degraded-path behaviour preserved: empty strings, not an empty dict."""
+    monkeypatch.setitem(__import__("sys").modules, "tesserocr", None)
     monkeypatch.setitem(__import__("sys").modules, "pytesseract", None)
 
     result = OcrFallback().extract_document_text(three_page_pdf, page_range=(0, 1))
@@ -1,5 +1,7 @@
 """Tests for the canonical extraction schema validation."""
 
+import json
+
 from pydantic import ValidationError
 
 from src.schema import (
@@ -201,3 +203,29 @@ def test_identity_candidates_and_metadata_enrichment_serialization() -> None:
     assert payload["identityCandidates"]["composers"][0]["entityId"] == "composer-1"
     assert payload["metadataEnrichment"]["provider"] == "google-genai"
     assert payload["metadataEnrichment"]["fieldsUpdated"] == ["composer", "raga"]
+
+
+def test_to_json_matches_to_json_dict() -> None:
+    """The direct JSON encoder used for per-result rows emits the same document."""
+    extraction = CanonicalExtraction(
+        title="Vatapi Ganapatim Bhaje",
+        composer="Muthuswami Dikshitar",
+        ragas=[CanonicalRaga(name="Hamsadhvani", order=1)],
+        tala="Adi",
+        sections=[CanonicalSection(type=SectionType.PALLAVI, order=1, label="Pallavi")],
+        lyric_variants=[
+            CanonicalLyricVariant(
+                language="sa",
+                script="devanagari",
+                sections=[CanonicalLyricSection(section_order=1, text="वातापि गणपतिं भजेऽहम्")],
+            )
+        ],
+        metadata_boundaries=[CanonicalMetadataBoundary(label="MEANING", start_offset=120, end_offset=127)],
+        metadata_enrichment=CanonicalMetadataEnrichment(provider="google-genai", applied=False, confidence=0.5),
+        source_url="https://guruguha.org/mdskt.pdf",
+        source_name="guruguha.org",
+        source_tier=1,
+        extraction_method=ExtractionMethod.PDF_PYMUPDF,
+    )
+
+    assert json.loads(extraction.to_json()) == extraction.to_json_dict()
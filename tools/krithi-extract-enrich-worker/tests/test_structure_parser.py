@@ -1,10 +1,13 @@
 """Tests for section structure detection."""
 
+import dataclasses
 import json
 from pathlib import Path
 
+import pytest
+
 from src.schema import SectionType
-from src.structure_parser import StructureParser
+from src.structure_parser import StructureParser, _HeaderMatch
 
 
 def test_standard_pac_structure() -> None:
@@ -284,6 +287,24 @@ def test_fixture_dikshitar_multi_variant() -> None:
     assert len(word_div_variants) == 0
 
 
+def test_header_detection_runs_once_per_line(monkeypatch) -> None:
+    """Lyric window and post-boundary variants share one classified line stream."""
+    fixture_dir = Path(__file__).parent / "fixtures" / "structure_parser"
+    text = (fixture_dir / "dikshitar_multi_variant.txt").read_text(encoding="utf-8")
+    detected: list[str] = []
+    detect_language_header = StructureParser._detect_language_header
+
+    def counting(self: StructureParser, line: str) -> _HeaderMatch | None:
+        detected.append(line)
+        return detect_language_header(self, line)
+
+    monkeypatch.setattr(StructureParser, "_detect_language_header", counting)
+    result = StructureParser().parse(text)
+
+    assert result.metadata_boundaries and len(result.lyric_variants) > 1
+    assert len(detected) <= sum(1 for line in text.splitlines() if line.strip())
+
+
 def test_fixture_tyagaraja_multi_variant() -> None:
     """TRACK-100: Tyagaraja blog with P/A/C abbreviations produces multi-script variants."""
     parser = StructureParser()
@@ -778,3 +799,47 @@ def test_inline_c_space_digit_format() -> None:
     assert sections[1].section_type == SectionType.ANUPALLAVI
     assert sections[2].section_type == SectionType.CHARANAM
     assert sections[2].text.startswith("vara giri")
+
+
+def test_parse_cache_is_opt_in_and_bounded() -> None:
+    """Identical text is parsed once per caching parser; results are frozen, their lists per caller."""
+    first = "Pallavi\nvAtApi gaNapatim\nCharanam\nhariharaa putram\n"
+    second = "Pallavi\nsrI gaNanAtham\n"
+
+    parser = StructureParser(cache_size=1)
+    result = parser.parse(first)
+    assert parser.parse(first) == result
+    assert parser.parse_sections(first) == result.sections
+    assert (parser.cache_hits, parser.cache_misses) == (2, 1)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.sections[0].text = "changed"  # type: ignore[misc]  # assigning a frozen field is the point
+
+    parser.parse(second)
+    parser.parse(first)
+    assert parser.cache_misses == 3  # evicted by the bound
+
+
+def test_cached_results_do_not_share_lists() -> None:
+    text = "Pallavi\nvAtApi gaNapatim\nCharanam\nhariharaa putram\n\nDevanagari\nPallavi\nवातापि गणपतिं\n"
+    parser = StructureParser(cache_size=4)
+    pristine = StructureParser().parse(text)
+    assert pristine.sections
+
+    mutated = parser.parse(text)
+    mutated.sections.clear()
+    mutated.metadata_boundaries.clear()
+    for variant in mutated.lyric_variants:
+        variant.sections.clear()
+    mutated.lyric_variants.clear()
+
+    assert parser.parse(text) == pristine
+    assert parser.cache_hits == 1
+
+
+def test_parse_cache_key_includes_trailer_strip_flag() -> None:
+    parser = StructureParser(cache_size=8)
+    text = "Pallavi\nvAtApi gaNapatim\n"
+    stripped = parser.parse(text)
+    parser._trailer_strip_enabled = False
+    assert parser.parse(text) is not stripped
+    assert parser.parse(text) == stripped
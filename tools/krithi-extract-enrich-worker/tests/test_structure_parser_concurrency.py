@@ -0,0 +1,55 @@
+"""One StructureParser shared by many threads must parse exactly as it does sequentially."""
+
+from __future__ import annotations
+
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.html_extractor import HtmlTextExtractor
+from src.structure_parser import StructureParser
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Documents whose inline-abbreviation gates differ: parsed side by side, any
+# per-document state left on the shared parser would leak between them.
+GATED_DOCUMENTS = [
+    "P ADa mODi galadE rAmayya\nA tODu nIDa nIvEyanucunu\nC caduvulanni telisi\nsadayuDAShuga\n",
+    "Pallavi\nP rAma nAmamu\nAnupallavi\nA dharaNilO\nCharanam\nC rAma\n",
+    "प. रामुनि\nअ. धरणिलो\nच1. सकल\nच2. वेद\n",
+    "पल्लवि\nकामाक्षि पदमु\nचरणम्\nप्रथम चरणमु\n",
+]
+
+
+def _documents() -> list[str]:
+    documents = list(GATED_DOCUMENTS)
+    for path in sorted(FIXTURES.rglob("*")):
+        if path.suffix == ".txt":
+            documents.append(path.read_text(encoding="utf-8"))
+        elif path.suffix == ".html":
+            documents.append(HtmlTextExtractor().extract(path.read_text(encoding="utf-8")).text)
+    return documents
+
+
+@pytest.mark.parametrize("cache_size", [0, 8])
+def test_shared_parser_matches_sequential_parsing(cache_size: int) -> None:
+    documents = _documents()
+    expected = [StructureParser().parse(document) for document in documents]
+
+    # Switch threads often so parses interleave mid-document.
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        parser = StructureParser(cache_size=cache_size)
+        order = [i for i in range(len(documents)) for _ in range(6)]
+        random.Random(43).shuffle(order)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda i: (i, parser.parse(documents[i])), order))
+    finally:
+        sys.setswitchinterval(previous)
+
+    for i, result in results:
+        assert result == expected[i], f"document {i} diverged under concurrent parsing"
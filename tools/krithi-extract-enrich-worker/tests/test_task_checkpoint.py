@@ -0,0 +1,184 @@
+"""Task checkpoints: a retried OCR task resumes from its last page and segment."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import fitz
+import pytest
+
+from src.config import ExtractorConfig
+from src.db import ExtractionTask
+from src.ocr_engine import OcrEngine
+from src.schema import CanonicalExtraction, CanonicalRaga, ExtractionMethod
+from src.task_checkpoint import CheckpointStore
+from src.worker import ExtractionWorker
+
+PAGE_TEXTS = [
+    "अखिलान्डेश्वरि रक्ष माम\nराग : जुझावन्ति\nताल : आदि",
+    "अखिलान्डेश्वरो रक्षतु\nराग : कर्नाटक शुद्धसावेरी\nताल : रूपक",
+    "वातापि गणपतिं भजेऽहं\nराग : हंसध्वनि\nताल : आदि",
+]
+
+
+class _ScriptedEngine(OcrEngine):
+    """Returns the text of the page it is asked for; fails on the page numbers in `fail_on`."""
+
+    name = "scripted"
+
+    def __init__(self, fail_on: frozenset[int] = frozenset()) -> None:
+        self.fail_on = fail_on
+        self.pages: list[int] = []
+
+    def recognize(self, pixmap: fitz.Pixmap) -> str:
+        page = int(pixmap.height // 1000)  # page number encoded in the page height
+        self.pages.append(page)
+        if page in self.fail_on:
+            raise RuntimeError(f"worker died on page {page}")
+        return PAGE_TEXTS[page]
+
+
+def _extraction(title: str) -> CanonicalExtraction:
+    return CanonicalExtraction(
+        title=title,
+        composer="Muthuswami Dikshitar",
+        ragas=[CanonicalRaga(name="Hamsadhvani")],
+        tala="Adi",
+        source_url="https://example.org/a.pdf",
+        source_name="fixture",
+        source_tier=1,
+        extraction_method=ExtractionMethod.PDF_OCR,
+    )
+
+
+def test_checkpoint_survives_reopen_and_resets_on_other_input(tmp_path) -> None:
+    store = CheckpointStore(tmp_path)
+    task_id = uuid4()
+    checkpoint = store.open(task_id, "sha-a", "settings-1")
+    checkpoint.record_page(0, "वातापि")
+    checkpoint.record_segment("ocr:0", _extraction("Vatapi"))
+    checkpoint.record_segment("ocr:1", None)
+    checkpoint.close()
+
+    resumed = store.open(task_id, "sha-a", "settings-1")
+    assert resumed.resumed
+    assert resumed.pages == {0: "वातापि"}
+    assert resumed.segments == {"ocr:0": _extraction("Vatapi"), "ocr:1": None}
+    resumed.close()
+
+    assert not store.open(task_id, "sha-b", "settings-1").resumed
+    assert not store.open(task_id, "sha-b", "settings-2").resumed
+
+
+def test_torn_final_record_is_dropped(tmp_path) -> None:
+    store = CheckpointStore(tmp_path)
+    task_id = uuid4()
+    checkpoint = store.open(task_id, "sha", "settings")
+    checkpoint.record_page(0, "first")
+    checkpoint.close()
+    path = tmp_path / f"{task_id}.jsonl"
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"page": 1, "text": "sec')
+
+    resumed = store.open(task_id, "sha", "settings")
+    resumed.record_page(1, "second")
+    resumed.close()
+
+    assert store.open(task_id, "sha", "settings").pages == {0: "first", 1: "second"}
+
+
+def test_discard_and_prune(tmp_path) -> None:
+    store = CheckpointStore(tmp_path)
+    finished, abandoned = uuid4(), uuid4()
+    store.open(finished, "sha", "settings").close()
+    store.open(abandoned, "sha", "settings").close()
+
+    store.discard(finished)
+    assert store.prune(max_age_s=3600) == 0
+    assert store.prune(max_age_s=-1) == 1
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture()
+def scanned_pdf(tmp_path):
+    path = tmp_path / "scanned.pdf"
+    doc = fitz.open()
+    for number in range(len(PAGE_TEXTS)):
+        # Rendered at 72 dpi with preflight off, page n is n*1000+500 px tall.
+        page = doc.new_page(width=400, height=number * 1000 + 500)
+        page.insert_text((72, 100), "scanned page", fontsize=14)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _strategy(monkeypatch, cache_dir, *, checkpoints: bool):
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv("SG_TASK_CHECKPOINTS", str(checkpoints).lower())
+    monkeypatch.setenv("SG_OCR_PREFLIGHT", "false")
+    worker = ExtractionWorker(ExtractorConfig())
+    strategy = worker.pdf_strategy
+    strategy.ocr_fallback.dpi = 72
+    monkeypatch.setattr(strategy.pdf_extractor, "is_text_extractable", lambda _path: False)
+    return worker, strategy
+
+
+def test_retried_ocr_task_resumes_from_last_page_and_segment(tmp_path, monkeypatch, scanned_pdf) -> None:
+    task = ExtractionTask(
+        id=uuid4(),
+        source_url=str(scanned_pdf),
+        source_format="PDF",
+        source_name="fixture",
+        source_tier=1,
+        request_payload={"composerHint": "Muttuswami Dikshitar"},
+        page_range=None,
+        import_batch_id=None,
+        import_task_run_id=None,
+        attempts=1,
+    )
+    worker, strategy = _strategy(monkeypatch, tmp_path / "cache", checkpoints=True)
+    finalize = strategy._finalize
+    finalized: list[str | None] = []
+
+    def counting_finalize(extraction, text, source_format):
+        finalized.append(extraction.page_range)
+        if extraction.page_range in fail_finalize:
+            raise RuntimeError("worker died while finalizing")
+        return finalize(extraction, text, source_format)
+
+    monkeypatch.setattr(strategy, "_finalize", counting_finalize)
+
+    # Attempt 1 dies during OCR of the last page.
+    fail_finalize: set[str] = set()
+    strategy.ocr_fallback._engine = first = _ScriptedEngine(fail_on=frozenset({2}))
+    with pytest.raises(RuntimeError, match="page 2"):
+        strategy.extract(task)
+    assert first.pages == [0, 1, 2]
+
+    # Attempt 2 OCRs only the missing page, then dies finalizing the last Krithi.
+    fail_finalize = {"3"}
+    strategy.ocr_fallback._engine = second = _ScriptedEngine()
+    with pytest.raises(RuntimeError, match="finalizing"):
+        strategy.extract(task)
+    assert second.pages == [2]
+
+    # Attempt 3 redoes only the unfinished segment.
+    fail_finalize = set()
+    finalized.clear()
+    strategy.ocr_fallback._engine = third = _ScriptedEngine()
+    resumed = strategy.extract(task)
+    assert third.pages == []
+    assert finalized == ["3"]
+
+    _, fresh_strategy = _strategy(monkeypatch, tmp_path / "fresh", checkpoints=False)
+    fresh_strategy.ocr_fallback._engine = _ScriptedEngine()
+    expected = fresh_strategy.extract(task)
+
+    def comparable(results):
+        return [r.model_copy(update={"extraction_timestamp": None}) for r in results]
+
+    assert comparable(resumed) == comparable(expected)
+    assert [r.page_range for r in resumed] == ["1", "2", "3"]
+
+    worker.checkpoints.discard(task.id)
+    assert list((tmp_path / "cache" / "checkpoints").iterdir()) == []
@@ -0,0 +1,112 @@
+"""Task metrics: per-stage timings and counters recorded with each task's outcome."""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import uuid4
+
+import fitz
+import pytest
+
+from src import task_metrics
+from src.config import ExtractorConfig
+from src.db import ExtractionTask
+from src.worker import PATTERN_MATCH_CONFIDENCE, ExtractionWorker
+
+
+def test_stages_accumulate_and_are_noops_outside_collect() -> None:
+    with task_metrics.stage("parse"):
+        task_metrics.count("segments")
+
+    with task_metrics.collect() as metrics:
+        for _ in range(3):
+            with task_metrics.stage("parse"):
+                task_metrics.count("segments")
+        task_metrics.count("ocr_pages", 0)
+        with pytest.raises(RuntimeError), task_metrics.stage("ocr"):
+            raise RuntimeError("engine died")
+
+    task_metrics.count("segments")
+
+    assert set(metrics.stages_ms) == {"parse", "ocr"}
+    assert metrics.counters == {"segments": 3, "ocr_pages": 0}
+    assert metrics.as_dict()["counters"] == {"segments": 3, "ocr_pages": 0}
+
+
+class _RecordingQueueDB:
+    def __init__(self) -> None:
+        self.done: dict[str, Any] = {}
+        self.failed: dict[str, Any] = {}
+
+    def has_shards(self, task_id) -> bool:
+        return False
+
+    def mark_done(self, **kwargs) -> None:
+        self.done = kwargs
+
+    def mark_failed(self, task_id, error_detail, stage_metrics=None) -> None:
+        self.failed = {"error_detail": error_detail, "stage_metrics": stage_metrics}
+
+
+@pytest.fixture()
+def worker(tmp_path, monkeypatch) -> ExtractionWorker:
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SG_ENABLE_IDENTITY_DISCOVERY", "false")
+    worker = ExtractionWorker(ExtractorConfig())
+    worker.db = _RecordingQueueDB()  # type: ignore[assignment]
+    return worker
+
+
+def _pdf_task(path) -> ExtractionTask:
+    return ExtractionTask(
+        id=uuid4(),
+        source_url=str(path),
+        source_format="PDF",
+        source_name="fixture",
+        source_tier=1,
+        request_payload={},
+        page_range=None,
+        import_batch_id=None,
+        import_task_run_id=None,
+        attempts=1,
+    )
+
+
+def test_completed_task_persists_its_stage_breakdown(worker, tmp_path) -> None:
+    pdf = tmp_path / "krithi.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "vAtApi gaNapatiM bhajEhaM", fontsize=15)
+    page.insert_text((50, 72), "rAgaM: haMsadhvani  tALaM: Adi", fontsize=10)
+    page.insert_text((50, 100), "pallavi", fontsize=10)
+    page.insert_text((50, 114), "vAtApi gaNapatiM bhajEhaM vAraNAsyaM", fontsize=10)
+    doc.save(str(pdf))
+    doc.close()
+
+    worker._process_task(_pdf_task(pdf))
+
+    metrics = worker.db.done["stage_metrics"]
+    assert {"extract", "pdf_text", "segmentation", "metadata_parse", "structure_parse", "normalize"} <= set(
+        metrics["stages_ms"]
+    )
+    assert metrics["stages_ms"]["extract"] >= metrics["stages_ms"]["pdf_text"]
+    assert metrics["counters"] == {"segments": 1, "results": 1}
+    assert worker.db.done["confidence"] == PATTERN_MATCH_CONFIDENCE
+
+
+def test_failed_task_persists_the_stages_it_reached(worker, tmp_path, monkeypatch) -> None:
+    pdf = tmp_path / "scanned.pdf"
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(str(pdf))
+    doc.close()
+
+    def engine_crash(*_args, **_kwargs):
+        raise RuntimeError("tesseract crashed")
+
+    monkeypatch.setattr(worker.pdf_strategy.ocr_fallback, "extract_document_text", engine_crash)
+
+    worker._process_task(_pdf_task(pdf))
+
+    assert worker.db.failed["error_detail"]["type"] == "RuntimeError"
+    assert {"extract", "pdf_text", "ocr"} <= set(worker.db.failed["stage_metrics"]["stages_ms"])
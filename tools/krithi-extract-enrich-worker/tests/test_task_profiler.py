@@ -0,0 +1,97 @@
+"""Task profiler: opt-in cProfile capture written per task id and summarized into diagnostics."""
+
+from __future__ import annotations
+
+import os
+import pstats
+import time
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+import fitz
+import pytest
+
+from src import task_profiler
+from src.config import ExtractorConfig
+from src.db import ExtractionTask
+from src.worker import ExtractionWorker
+
+
+def _pdf_task(path: Path, request_payload: dict[str, Any] | None = None) -> ExtractionTask:
+    return ExtractionTask(
+        id=uuid4(),
+        source_url=str(path),
+        source_format="PDF",
+        source_name="fixture",
+        source_tier=1,
+        request_payload=request_payload or {},
+        page_range=None,
+        import_batch_id=None,
+        import_task_run_id=None,
+        attempts=1,
+    )
+
+
+def test_wants_profile_from_ratio_or_payload_flag(tmp_path) -> None:
+    assert not task_profiler.wants_profile(_pdf_task(tmp_path), 0.0)
+    assert task_profiler.wants_profile(_pdf_task(tmp_path), 1.0)
+    assert task_profiler.wants_profile(_pdf_task(tmp_path, {"profile": True}), 0.0)
+    assert not task_profiler.wants_profile(_pdf_task(tmp_path, {"profile": "yes"}), 0.0)
+
+
+class _RecordingQueueDB:
+    def __init__(self) -> None:
+        self.done: dict[str, Any] = {}
+        self.profiles: dict[Any, dict[str, Any]] = {}
+
+    def has_shards(self, task_id) -> bool:
+        return False
+
+    def mark_done(self, **kwargs) -> None:
+        self.done = kwargs
+
+    def attach_profile(self, task_id, profile) -> None:
+        self.profiles[task_id] = profile
+
+
+@pytest.fixture()
+def worker(tmp_path, monkeypatch) -> ExtractionWorker:
+    monkeypatch.setenv("EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("SG_ENABLE_IDENTITY_DISCOVERY", "false")
+    worker = ExtractionWorker(ExtractorConfig())
+    worker.db = _RecordingQueueDB()  # type: ignore[assignment]
+    return worker
+
+
+def test_profiled_task_writes_pstats_and_attaches_top_functions(worker, tmp_path) -> None:
+    pdf = tmp_path / "krithi.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), "vAtApi gaNapatiM bhajEhaM", fontsize=15)
+    page.insert_text((50, 72), "rAgaM: haMsadhvani  tALaM: Adi", fontsize=10)
+    doc.save(str(pdf))
+    doc.close()
+    task = _pdf_task(pdf, {"profile": True})
+
+    worker._process_task_profiled(task)
+
+    assert worker.db.done["task_id"] == task.id
+    summary = worker.db.profiles[task.id]
+    path = tmp_path / "cache" / "profiles" / f"{task.id}.pstats"
+    assert summary["path"] == str(path)
+    assert pstats.Stats(str(path)).total_calls > 0  # type: ignore[attr-defined]  # set in __init__, untyped in typeshed
+    assert len(summary["top"]) == task_profiler.TOP_FUNCTIONS
+    assert summary["top"][0]["cumtime_ms"] >= summary["top"][-1]["cumtime_ms"]
+    assert any(entry["function"].startswith("worker.py:") for entry in summary["top"])
+
+
+def test_old_profiles_are_pruned(tmp_path) -> None:
+    old, recent = tmp_path / "old.pstats", tmp_path / "recent.pstats"
+    for path in (old, recent):
+        path.write_bytes(b"")
+    week_ago = time.time() - 8 * 24 * 3600
+    os.utime(old, (week_ago, week_ago))
+
+    assert task_profiler.prune_profiles(tmp_path, 7 * 24 * 3600) == 1
+    assert not old.exists() and recent.exists()
@@ -0,0 +1,160 @@
+"""Shard planning for large anthology PDFs: boundaries must align to Krithi starts."""
+
+from __future__ import annotations
+
+import uuid
+
+import fitz
+import pytest
+
+from src.db import ExtractionTask
+from src.extraction_strategies import format_page_range, parse_page_range
+from src.page_segmenter import PageSegmenter
+from src.task_metrics import TaskMetrics
+from src.task_splitter import TaskSplitter
+
+
+def _write_anthology(path, krithi_lengths: list[int]) -> None:
+    """One Krithi per entry: a bold title atop its first page, then body pages."""
+    doc = fitz.open()
+    for number, length in enumerate(krithi_lengths, start=1):
+        for offset in range(length):
+            page = doc.new_page()
+            if offset == 0:
+                page.insert_text((72, 60), f"Krithi title {number}", fontsize=18, fontname="hebo")
+                page.insert_text((72, 90), "raga: kalyani  tala: adi", fontsize=11)
+            for line in range(8):
+                page.insert_text((72, 200 + line * 16), f"body line {line} of krithi {number}", fontsize=11)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture()
+def anthology(tmp_path):
+    path = tmp_path / "anthology.pdf"
+    # Starts (0-based): 0, 3, 6, 8, 11, 14, 17, 19 — 22 pages in total.
+    _write_anthology(path, [3, 3, 2, 3, 3, 3, 2, 3])
+    return path
+
+
+def test_small_documents_are_not_split(anthology) -> None:
+    splitter = TaskSplitter(PageSegmenter(), page_threshold=100, target_pages=5)
+    assert splitter.plan(anthology, text_extractable=True) == []
+
+
+def test_shard_boundaries_align_to_krithi_starts(anthology) -> None:
+    splitter = TaskSplitter(PageSegmenter(), page_threshold=10, target_pages=5)
+
+    shards = splitter.plan(anthology, text_extractable=True)
+
+    assert shards == [(0, 5), (6, 10), (11, 16), (17, 21)]
+    krithi_starts = {0, 3, 6, 8, 11, 14, 17, 19}
+    assert all(start in krithi_starts for start, _ in shards)
+    # Contiguous and complete: no page lost or duplicated between shards.
+    assert shards[0][0] == 0 and shards[-1][1] == 21
+    assert all(prev[1] + 1 == nxt[0] for prev, nxt in zip(shards, shards[1:], strict=False))
+
+
+def test_small_tail_folds_into_previous_shard(tmp_path) -> None:
+    path = tmp_path / "tail.pdf"
+    _write_anthology(path, [6, 6, 1, 1])
+    splitter = TaskSplitter(PageSegmenter(), page_threshold=5, target_pages=6)
+
+    assert splitter.plan(path, text_extractable=True) == [(0, 5), (6, 13)]
+
+
+def test_scanned_documents_split_at_any_page(tmp_path) -> None:
+    path = tmp_path / "scanned.pdf"
+    doc = fitz.open()
+    for _ in range(12):
+        doc.new_page()
+    doc.save(str(path))
+    doc.close()
+    splitter = TaskSplitter(PageSegmenter(), page_threshold=10, target_pages=4)
+
+    assert splitter.plan(path, text_extractable=False) == [(0, 3), (4, 7), (8, 11)]
+
+
+def test_format_page_range_round_trips_through_parse() -> None:
+    for start, end in [(0, 0), (0, 49), (50, 99)]:
+        assert parse_page_range(format_page_range(start, end)) == (start, end)
+
+
+def test_pdf_strategy_never_reshards_a_shard(anthology) -> None:
+    from src.config import ExtractorConfig
+    from src.worker import ExtractionWorker
+
+    worker = ExtractionWorker(ExtractorConfig())
+    worker.pdf_strategy.task_splitter = TaskSplitter(PageSegmenter(), page_threshold=10, target_pages=5)
+
+    def task(page_range: str | None, parent_extraction_id: uuid.UUID | None = None) -> ExtractionTask:
+        return ExtractionTask(
+            id=uuid.uuid4(),
+            source_url=str(anthology),
+            source_format="PDF",
+            source_name="fixture",
+            source_tier=5,
+            request_payload={},
+            page_range=page_range,
+            import_batch_id=None,
+            import_task_run_id=None,
+            attempts=1,
+            parent_extraction_id=parent_extraction_id,
+        )
+
+    whole = task(None)
+    shard = task("1-6", parent_extraction_id=whole.id)
+
+    assert worker.pdf_strategy.plan_shards(whole) == ["1-6", "7-11", "12-17", "18-22"]
+    assert worker.pdf_strategy.plan_shards(shard) == []
+
+
+class _ShardedQueueDB:
+    def __init__(self) -> None:
+        self.enqueued: list[list[str]] = []
+
+    def has_shards(self, task_id: uuid.UUID) -> bool:
+        return True
+
+    def enqueue_shards(self, parent: ExtractionTask, page_ranges: list[str]) -> list[uuid.UUID]:
+        self.enqueued.append(page_ranges)
+        return []
+
+
+def test_reclaimed_parent_resumes_its_shards_without_planning(anthology, monkeypatch) -> None:
+    from src.config import ExtractorConfig
+    from src.worker import ExtractionWorker
+
+    worker = ExtractionWorker(ExtractorConfig())
+    db = _ShardedQueueDB()
+    worker.db = db  # type: ignore[assignment]
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("a parent with shards must not be planned or extracted")
+
+    monkeypatch.setattr(worker.pdf_strategy, "plan_shards", fail)
+    monkeypatch.setattr(worker.pdf_strategy, "extract", fail)
+    parent = ExtractionTask(
+        id=uuid.uuid4(),
+        source_url=str(anthology),
+        source_format="PDF",
+        source_name="fixture",
+        source_tier=5,
+        request_payload={},
+        page_range=None,
+        import_batch_id=None,
+        import_task_run_id=None,
+        attempts=2,
+    )
+
+    assert worker._run_task(parent, 0.0, TaskMetrics()) == "sharded"
+    assert db.enqueued == [[]]
+
+
+def test_shard_segments_report_absolute_page_numbers(anthology) -> None:
+    from src.extractor import PdfExtractor
+
+    document = PdfExtractor().extract_document(str(anthology), parse_page_range("7-11"))
+    segments = PageSegmenter().segment(document)
+
+    assert [segment.page_range_str for segment in segments] == ["7-8", "9-11"]
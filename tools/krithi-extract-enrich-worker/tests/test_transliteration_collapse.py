@@ -0,0 +1,22 @@
+"""Collapse tables must list longer patterns before their prefixes."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.heuristics.transliteration_collapse import (
+    CORE_COLLAPSE_RULES,
+    IDENTITY_COLLAPSE_RULES,
+    MATCHING_COLLAPSE_RULES,
+    check_collapse_precedence,
+)
+
+
+@pytest.mark.parametrize("rules", [CORE_COLLAPSE_RULES, MATCHING_COLLAPSE_RULES, IDENTITY_COLLAPSE_RULES])
+def test_shipped_tables_pass_the_precedence_check(rules) -> None:
+    check_collapse_precedence(rules)
+
+
+def test_shadowed_rule_is_rejected() -> None:
+    with pytest.raises(ValueError, match="'ksh' is shadowed by earlier rule 'sh'"):
+        check_collapse_precedence((("sh", "s"), ("ksh", "ks")))
@@ -164,3 +164,62 @@ class TestVelthuisDecoder:
         raw = "d\x03v,"
         expected = "देवः"
         assert self.decoder.decode_text(raw) == expected
+
+
+# ── Equivalence with the original per-character decoder ──
+
+
+def _reference_decode(raw_text: str) -> str:
+    """The original dict-lookup / list-insert decoder, kept as the oracle."""
+    from src.velthuis_decoder import _GLYPH_MAP
+
+    result = list("".join(_GLYPH_MAP.get(ord(ch), ch) for ch in raw_text))
+    i = 0
+    while i < len(result):
+        if result[i] == "ि":
+            j = i + 1
+            while j < len(result):
+                if 0x0915 <= ord(result[j]) <= 0x0939:
+                    if j + 1 < len(result) and result[j + 1] == "्":
+                        j += 2
+                    else:
+                        j += 1
+                        break
+                else:
+                    break
+            if j > i + 1:
+                matra = result.pop(i)
+                result.insert(j - 1, matra)
+            else:
+                i += 1
+                continue
+        i += 1
+    text = "".join(result)
+    for pair, merged in (("अा", "आ"), ("इी", "ई"), ("उू", "ऊ")):
+        text = text.replace(pair, merged)
+    return text
+
+
+def test_matches_reference_decoder_on_random_spans() -> None:
+    import random
+
+    from src.velthuis_decoder import _GLYPH_MAP
+
+    rng = random.Random(34)
+    # Every mapped glyph, plus pass-through characters that interact with
+    # reordering and merging once decoded (ि, ्, ी, ू, and stray Latin).
+    alphabet = [chr(code) for code in _GLYPH_MAP] + ["E"] * 8 + ["ि", "्", "ी", "ू", "-", "z"]
+    decoder = VelthuisDecoder(cache_size=64)
+    for _ in range(5000):
+        raw = "".join(rng.choices(alphabet, k=rng.randint(0, 24)))
+        assert decoder.decode_text(raw) == _reference_decode(raw), repr(raw)
+
+
+def test_repeated_spans_are_served_from_the_memo() -> None:
+    decoder = VelthuisDecoder(cache_size=2)
+    first = decoder.decode_text("crZm^")
+    assert decoder.decode_text("crZm^") is first
+    decoder.decode_text("rAg\\")
+    decoder.decode_text("Ev")  # full: memo is reset rather than growing
+    assert len(decoder._cache) == 1
+    assert decoder.decode_text("crZm^") == "चरणम्"
@@ -54,6 +54,7 @@ def test_force_ocr_for_globally_garbled_text_even_without_devanagari_signal() ->
 def test_extract_pdf_ocr_emits_per_page_results(tmp_path, monkeypatch) -> None:
     worker = _build_worker()
     task = type("Task", (), {})()
+    task.id = "ocr-task"
     task.source_url = "https://example.com/mdskt-A-series.pdf"
     task.source_name = "fixture"
     task.source_tier = 5
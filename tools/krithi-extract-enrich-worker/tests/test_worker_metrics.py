@@ -0,0 +1,87 @@
+"""Worker metrics endpoint: Prometheus exposition and in-process liveness/readiness probes."""
+
+from __future__ import annotations
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src import task_metrics, worker
+from src.config import ExtractorConfig
+from src.db import QueueStats
+from src.worker_metrics import MetricsServer, WorkerMetrics
+
+
+def _task_metrics() -> task_metrics.TaskMetrics:
+    with task_metrics.collect() as metrics:
+        task_metrics.count("ocr_pages", 4)
+        task_metrics.count("gemini_calls", 3)
+        task_metrics.count("gemini_rate_limited", 2)
+    metrics.add_time("ocr", 2000.0)
+    metrics.add_time("pdf_text", 3.0)
+    return metrics
+
+
+def test_render_aggregates_tasks_stages_and_queue_depth() -> None:
+    metrics = WorkerMetrics(liveness_max_stall_s=60)
+    metrics.observe_task("PDF", "done", 2.4, _task_metrics())
+    metrics.observe_task("PDF", "failed", 0.2, task_metrics.TaskMetrics())
+    metrics.set_queue_stats(QueueStats(pending=7, processing=1))
+    metrics.identity_catalog_age = lambda: 12.5
+
+    text = metrics.render()
+
+    assert 'sangita_worker_tasks_total{source_format="PDF",outcome="done"} 1' in text
+    assert 'sangita_worker_tasks_total{source_format="PDF",outcome="failed"} 1' in text
+    assert 'sangita_worker_task_duration_seconds_bucket{source_format="PDF",le="2.5"} 2' in text
+    assert 'sangita_worker_stage_duration_seconds_bucket{stage="ocr",le="1"} 0' in text
+    assert 'sangita_worker_stage_duration_seconds_count{stage="ocr"} 1' in text
+    assert "sangita_worker_ocr_pages_per_second 2.000" in text
+    assert "sangita_worker_gemini_calls_total 3" in text
+    assert "sangita_worker_gemini_rate_limited_total 2" in text
+    assert 'sangita_worker_queue_tasks{status="PENDING"} 7' in text
+    assert "sangita_worker_identity_catalog_age_seconds 12.500" in text
+
+
+def _get(port: int, path: str) -> tuple[int, str]:
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=5) as response:
+            return response.status, response.read().decode()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read().decode()
+
+
+@pytest.fixture()
+def server():
+    server = MetricsServer(WorkerMetrics(liveness_max_stall_s=60), "127.0.0.1", 0)
+    server.start()
+    yield server
+    server.close()
+
+
+def test_probes_answer_from_in_process_state(server) -> None:
+    assert _get(server.port, "/healthz") == (200, "ok\n")
+    assert _get(server.port, "/readyz") == (503, "not ready\n")
+
+    server.metrics.heartbeat(db_ready=True)
+    assert _get(server.port, "/readyz") == (200, "ready\n")
+    status, body = _get(server.port, "/metrics")
+    assert status == 200
+    assert "sangita_worker_ready 1" in body
+
+    server.metrics.shutting_down()
+    assert _get(server.port, "/readyz")[0] == 503
+    server.metrics.liveness_max_stall_s = 0
+    assert _get(server.port, "/healthz") == (503, "stalled\n")
+    assert _get(server.port, "/nope")[0] == 404
+
+
+def test_health_check_probes_the_running_worker(server, monkeypatch) -> None:
+    monkeypatch.setenv("SG_METRICS_PORT", str(server.port))
+    monkeypatch.setattr(worker, "load_config", ExtractorConfig)
+    worker.health_check()
+
+    server.metrics.liveness_max_stall_s = 0
+    with pytest.raises(SystemExit):
+        worker.health_check()